@@ -0,0 +1,396 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, TypeVar
+
+from fontbro.exceptions import ArgumentError
+from fontbro.font import Font
+
+_T = TypeVar("_T")
+
+CONCURRENCY_DEFAULT: int = os.cpu_count() or 1
+
+# default semaphore of each event loop, shared by all the fonts using it
+_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class AsyncFont:
+    """
+    Asyncio wrapper of Font, blocking operations (file I/O, parsing,
+    compiling, compressing, subsetting and sanitizing) run in an executor,
+    so they don't block the event loop.
+    The number of operations running at once is bounded by a semaphore
+    and operations on the same font run one at a time.
+    Font getters can be called in the same way using run.
+    """
+
+    def __init__(
+        self,
+        font: Font,
+        *,
+        executor: Executor | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> None:
+        """
+        Constructs a new AsyncFont instance wrapping the given font.
+
+        :param font: The font
+        :type font: Font
+        :param executor: The thread pool executor used to run blocking operations,
+            if None the event loop default executor is used.
+        :type executor: concurrent.futures.ThreadPoolExecutor or None
+        :param semaphore: The semaphore bounding the number of operations
+            running at once, if None a semaphore shared by all the fonts
+            of the event loop is used (CONCURRENCY_DEFAULT operations at once).
+        :type semaphore: asyncio.Semaphore or None
+
+        :raises ArgumentError: If the executor is a process pool executor
+            (the font is modified in place, so it can't be sent to other processes).
+        """
+        if isinstance(executor, ProcessPoolExecutor):
+            raise ArgumentError(
+                "Invalid executor: expected thread pool executor, "
+                "found process pool executor."
+            )
+        self._font = font
+        self._executor = executor
+        self._semaphore = semaphore
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(
+        self,
+    ) -> AsyncFont:
+        return self
+
+    async def __aexit__(  # type: ignore
+        self,
+        e_type,
+        e_value,
+        e_traceback,
+    ) -> None:
+        await self.close()
+
+    @property
+    def font(
+        self,
+    ) -> Font:
+        """
+        Gets the wrapped Font instance. Its methods run on the event loop thread:
+        getters decompile font tables on first access (eg. cmap, or GSUB
+        on CJK fonts), blocking the event loop and racing with the operations
+        running in the executor on the same font, so call them using run,
+        eg. await font.run(Font.get_family_name)
+        """
+        return self._font
+
+    @classmethod
+    async def open(
+        cls,
+        filepath: str | Path,
+        *,
+        executor: Executor | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+        **kwargs: Any,
+    ) -> AsyncFont:
+        """
+        Opens the font file at the given filepath without blocking the event loop,
+        the whole file is read in memory, so operations don't read from disk later.
+
+        :param filepath: The filepath
+        :type filepath: str or pathlib.Path
+        :param executor: The thread pool executor used to run blocking operations.
+        :type executor: concurrent.futures.ThreadPoolExecutor or None
+        :param semaphore: The semaphore bounding the number of operations running at once.
+        :type semaphore: asyncio.Semaphore or None
+        :param kwargs: The options for the fontTools.ttLib.TTFont constructor
+        :type kwargs: dictionary
+
+        :returns: The AsyncFont instance.
+        :rtype: AsyncFont
+
+        :raises ValueError: if the filepath is not a valid font
+        """
+        font = await _run(
+            partial(_open_font, filepath, **kwargs),
+            executor=executor,
+            semaphore=semaphore,
+        )
+        return cls(font, executor=executor, semaphore=semaphore)
+
+    @classmethod
+    async def from_bytes(
+        cls,
+        buffer: bytes,
+        *,
+        executor: Executor | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+        **kwargs: Any,
+    ) -> AsyncFont:
+        """
+        Creates a new AsyncFont instance from a bytes-like object
+        (eg. an uploaded file) without blocking the event loop.
+
+        :param buffer: The buffer containing the font data
+        :type buffer: bytes or bytearray or memoryview or mmap.mmap
+        :param executor: The thread pool executor used to run blocking operations.
+        :type executor: concurrent.futures.ThreadPoolExecutor or None
+        :param semaphore: The semaphore bounding the number of operations running at once.
+        :type semaphore: asyncio.Semaphore or None
+        :param kwargs: The options for the fontTools.ttLib.TTFont constructor
+        :type kwargs: dictionary
+
+        :returns: The AsyncFont instance.
+        :rtype: AsyncFont
+
+        :raises ValueError: if the buffer is not a valid font
+        """
+        font = await _run(
+            partial(Font.from_bytes, buffer, **kwargs),
+            executor=executor,
+            semaphore=semaphore,
+        )
+        return cls(font, executor=executor, semaphore=semaphore)
+
+    async def clone(
+        self,
+    ) -> AsyncFont:
+        """
+        Creates a new AsyncFont instance with the current in-memory state
+        (see Font.clone), using the same executor and semaphore.
+
+        :returns: The AsyncFont instance.
+        :rtype: AsyncFont
+        """
+        font = await self.run(Font.clone)
+        return AsyncFont(font, executor=self._executor, semaphore=self._semaphore)
+
+    async def close(
+        self,
+    ) -> None:
+        """
+        Close the wrapped Font instance.
+        """
+        await self.run(Font.close)
+
+    async def run(
+        self,
+        func: Callable[..., _T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> _T:
+        """
+        Runs the given function with the wrapped font as first argument
+        in the executor, eg. await font.run(Font.to_static, coordinates={"wght": 700})
+
+        :param func: The function (or unbound Font method)
+        :type func: callable
+        :param args: The function additional positional arguments
+        :type args: tuple
+        :param kwargs: The function keyword arguments
+        :type kwargs: dictionary
+
+        :returns: The function result.
+        :rtype: Any
+        """
+        async with self._lock:
+            return await _run(
+                partial(func, self._font, *args, **kwargs),
+                executor=self._executor,
+                semaphore=self._semaphore,
+            )
+
+    async def sanitize(
+        self,
+        *,
+        strict: bool = True,
+    ) -> None:
+        """
+        Sanitize the font file using OpenType Sanitizer (see Font.sanitize).
+
+        :param strict: If True (default), raises an exception even on sanitizer warnings.
+        :type strict: bool
+
+        :raises Exception: If the OpenType Sanitizer reports an error during the sanitization process.
+        """
+        await self.run(Font.sanitize, strict=strict)
+
+    async def save(
+        self,
+        filepath: str | Path | None = None,
+        *,
+        overwrite: bool = False,
+    ) -> str:
+        """
+        Saves the font at filepath (see Font.save).
+
+        :param filepath: The filepath, if None the source filepath will be used
+        :type filepath: str or None
+        :param overwrite: The overwrite, if True the source font file can be overwritten
+        :type overwrite: bool
+
+        :returns: The filepath where the font has been saved to.
+        :rtype: str
+        """
+        return await self.run(Font.save, filepath, overwrite=overwrite)
+
+    async def save_as(
+        self,
+        dirpath: str | Path | None = None,
+        *,
+        formats: list[str] | None = None,
+        overwrite: bool = True,
+        **compression_options: Any,
+    ) -> dict[str, str]:
+        """
+        Saves the font in multiple formats at once (see Font.save_as).
+
+        :param dirpath: The dirpath (or filepath used for the files basename),
+            if None the source filepath will be used
+        :type dirpath: str or None
+        :param formats: The formats, eg. ['ttf', 'woff2', 'woff'].
+        :type formats: list of str or None
+        :param overwrite: The overwrite, if True the source font file can be overwritten
+        :type overwrite: bool
+        :param compression_options: The woff/woff2 compression options.
+        :type compression_options: dict
+
+        :returns: The filepaths where the font has been saved to, by format.
+        :rtype: dict
+        """
+        return await self.run(
+            Font.save_as,
+            dirpath,
+            formats=formats,
+            overwrite=overwrite,
+            **compression_options,
+        )
+
+    async def save_as_woff(
+        self,
+        filepath: str | Path | None = None,
+        *,
+        overwrite: bool = True,
+        **compression_options: Any,
+    ) -> str:
+        """
+        Saves font as woff (see Font.save_as_woff).
+
+        :param filepath: The filepath
+        :type filepath: str
+        :param overwrite: The overwrite, if True the source font file can be overwritten
+        :type overwrite: bool
+        :param compression_options: The compression options (compression_level).
+        :type compression_options: dict
+
+        :returns: The filepath where the font has been saved to.
+        :rtype: str
+        """
+        return await self.run(
+            Font.save_as_woff,
+            filepath,
+            overwrite=overwrite,
+            **compression_options,
+        )
+
+    async def save_as_woff2(
+        self,
+        filepath: str | Path | None = None,
+        *,
+        overwrite: bool = True,
+        **compression_options: Any,
+    ) -> str:
+        """
+        Saves font as woff2 (see Font.save_as_woff2).
+
+        :param filepath: The filepath
+        :type filepath: str
+        :param overwrite: The overwrite, if True the source font file can be overwritten
+        :type overwrite: bool
+        :param compression_options: The compression options
+            (compression_level and window_size).
+        :type compression_options: dict
+
+        :returns: The filepath where the font has been saved to.
+        :rtype: str
+        """
+        return await self.run(
+            Font.save_as_woff2,
+            filepath,
+            overwrite=overwrite,
+            **compression_options,
+        )
+
+    async def subset(
+        self,
+        *,
+        unicodes: list[str | int] | str = "",
+        glyphs: list[str] | None = None,
+        text: str = "",
+        **options: Any,
+    ) -> None:
+        """
+        Subsets the font using the given options (see Font.subset).
+
+        :param unicodes: The unicodes
+        :type unicodes: str or list
+        :param glyphs: The glyphs
+        :type glyphs: list
+        :param text: The text
+        :type text: str
+        :param options: The subsetter options
+        :type options: dict
+        """
+        await self.run(
+            Font.subset,
+            unicodes=unicodes,
+            glyphs=glyphs,
+            text=text,
+            **options,
+        )
+
+
+def _get_default_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(CONCURRENCY_DEFAULT)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+def _open_font(
+    filepath: str | Path,
+    **kwargs: Any,
+) -> Font:
+    with open(filepath, "rb") as fileobject:
+        data = fileobject.read()
+    font = Font.from_bytes(data, **kwargs)
+    # keep the source filepath, used by save when no filepath is given
+    font._filepath = filepath
+    return font
+
+
+async def _run(
+    func: Callable[[], _T],
+    *,
+    executor: Executor | None,
+    semaphore: asyncio.Semaphore | None,
+) -> _T:
+    loop = asyncio.get_running_loop()
+    async with semaphore or _get_default_semaphore():
+        future = loop.run_in_executor(executor, func)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # the blocking call can't be interrupted, keep holding
+            # the semaphore (and the font lock) until it ends
+            await asyncio.wait([future])
+            raise
@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import tempfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from fontbro.exceptions import ArgumentError
+from fontbro.font import Font
+from fontbro.sanitizer import (
+    get_cached_output,
+    get_sanitizer_error,
+    get_sanitizer_warnings,
+    sanitize_data,
+)
+from fontbro.workers import map_chunks
+from fontbro.writers import validate_compression_options
+
+# metadata fields and the Font methods used to read them
+METADATA_FIELDS: dict[str, str] = {
+    "characters_count": "get_characters_count",
+    "family_classification": "get_family_classification",
+    "family_name": "get_family_name",
+    "features": "get_features",
+    "features_tags": "get_features_tags",
+    "filename": "get_filename",
+    "format": "get_format",
+    "glyphs_count": "get_glyphs_count",
+    "is_color": "is_color",
+    "is_monospace": "is_monospace",
+    "is_static": "is_static",
+    "is_variable": "is_variable",
+    "italic_angle": "get_italic_angle",
+    "names": "get_names",
+    "style_flags": "get_style_flags",
+    "style_name": "get_style_name",
+    "unicode_blocks": "get_unicode_blocks",
+    "unicode_scripts": "get_unicode_scripts",
+    "variable_axes": "get_variable_axes",
+    "variable_instances": "get_variable_instances",
+    "version": "get_version",
+    "vertical_metrics": "get_vertical_metrics",
+    "weight": "get_weight",
+    "width": "get_width",
+}
+
+METADATA_FIELDS_DEFAULT: list[str] = [
+    "family_name",
+    "style_name",
+    "weight",
+    "width",
+    "format",
+    "version",
+    "is_variable",
+    "variable_axes",
+]
+
+
+def extract_metadata(
+    filepaths: Iterable[str | Path],
+    *,
+    fields: Iterable[str] | None = None,
+    workers: int | None = None,
+    chunksize: int = 16,
+) -> Iterator[dict[str, Any]]:
+    """
+    Extracts the metadata of many font files, results are generated
+    lazily in the same order of the given filepaths.
+    Each file is opened only once and only the tables needed
+    by the requested fields are decompiled.
+    Errors are reported per file, without stopping the extraction.
+
+    :param filepaths: The fonts filepaths.
+    :type filepaths: iterable of str or pathlib.Path
+    :param fields: The metadata fields to extract (see METADATA_FIELDS),
+        if None METADATA_FIELDS_DEFAULT are extracted.
+    :type fields: iterable of str or None
+    :param workers: The number of worker processes used to extract metadata in parallel.
+        Default is None (no parallelism).
+    :type workers: int or None
+    :param chunksize: The number of files sent to a worker process in a single task.
+    :type chunksize: int
+
+    :returns: A generator of dictionaries, each one includes 'filepath',
+        'metadata' (a dictionary with fields as keys or None in case of error)
+        and 'error' (the error message or None).
+    :rtype: generator
+
+    :raises ArgumentError: If a field is invalid, or if workers or chunksize
+        is not a positive number.
+    """
+    fields_list = list(METADATA_FIELDS_DEFAULT if fields is None else fields)
+    for field in fields_list:
+        if field not in METADATA_FIELDS:
+            raise ArgumentError(
+                f"Invalid field: '{field}', "
+                f"expected one of {list(METADATA_FIELDS.keys())}."
+            )
+    if workers is not None and workers < 1:
+        raise ArgumentError(
+            f"Invalid workers value: expected positive int, found '{workers}'."
+        )
+    if chunksize < 1:
+        raise ArgumentError(
+            f"Invalid chunksize value: expected positive int, found '{chunksize}'."
+        )
+    if workers is None:
+        return (_extract_file_metadata(filepath, fields_list) for filepath in filepaths)
+    return map_chunks(
+        partial(_extract_files_metadata, fields=fields_list),
+        filepaths,
+        workers=workers,
+        chunksize=chunksize,
+    )
+
+
+def _extract_files_metadata(
+    filepaths: list[str | Path],
+    *,
+    fields: list[str],
+) -> list[dict[str, Any]]:
+    return [_extract_file_metadata(filepath, fields) for filepath in filepaths]
+
+
+def _extract_file_metadata(
+    filepath: str | Path,
+    fields: list[str],
+) -> dict[str, Any]:
+    result: dict[str, Any] = {
+        "filepath": str(filepath),
+        "metadata": None,
+        "error": None,
+    }
+    try:
+        with Font(filepath) as font:
+            result["metadata"] = {
+                field: getattr(font, METADATA_FIELDS[field])() for field in fields
+            }
+    except Exception as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+    return result
+
+
+def convert_fonts(
+    filepaths: Iterable[str | Path],
+    dirpath: str | Path,
+    *,
+    formats: list[str] | None = None,
+    overwrite: bool = True,
+    workers: int | None = None,
+    **compression_options: Any,
+) -> Iterator[dict[str, Any]]:
+    """
+    Converts many font files to the given formats saving them to dirpath
+    (see Font.save_as), results are generated lazily in the same order
+    of the given filepaths. Fonts are converted in parallel in a thread pool,
+    since most of the time is spent in woff2 (brotli) and woff (zlib)
+    compression, that doesn't hold the GIL.
+    Errors are reported per file, without stopping the conversion.
+
+    :param filepaths: The fonts filepaths.
+    :type filepaths: iterable of str or pathlib.Path
+    :param dirpath: The directory path where the converted fonts will be saved.
+    :type dirpath: str or pathlib.Path
+    :param formats: The formats, eg. ['woff2'], if None the fonts are saved
+        without web compression, as woff2 and as woff.
+    :type formats: list of str or None
+    :param overwrite: Whether to overwrite existing files in the directory.
+    :type overwrite: bool
+    :param workers: The number of worker threads used to convert fonts in parallel.
+        Default is None (no parallelism).
+    :type workers: int or None
+    :param compression_options: The compression options for Font.save_as,
+        eg. woff2_compression_level=5 for faster (and bigger) woff2 files.
+    :type compression_options: dict
+
+    :returns: A generator of dictionaries, each one includes 'filepath',
+        'files' (a dictionary with formats as keys and filepaths as values
+        or None in case of error) and 'error' (the error message or None).
+    :rtype: generator
+
+    :raises ArgumentError: If a format or a compression option is invalid,
+        or if workers is not a positive number.
+    """
+    for format_ in formats or []:
+        if format_ not in Font._FORMATS_LIST:
+            raise ArgumentError(
+                f"Invalid format: '{format_}', expected one of {Font._FORMATS_LIST}."
+            )
+    validate_compression_options(**compression_options)
+    if workers is not None and workers < 1:
+        raise ArgumentError(
+            f"Invalid workers value: expected positive int, found '{workers}'."
+        )
+    convert = partial(
+        _convert_files,
+        dirpath=dirpath,
+        formats=formats,
+        overwrite=overwrite,
+        compression_options=compression_options,
+    )
+    if workers is None:
+        return (convert([filepath])[0] for filepath in filepaths)
+    return map_chunks(
+        convert,
+        filepaths,
+        workers=workers,
+        chunksize=1,
+        executor_class=ThreadPoolExecutor,
+    )
+
+
+def _convert_files(
+    filepaths: list[str | Path],
+    *,
+    dirpath: str | Path,
+    formats: list[str] | None,
+    overwrite: bool,
+    compression_options: dict[str, Any],
+) -> list[dict[str, Any]]:
+    results = []
+    for filepath in filepaths:
+        result: dict[str, Any] = {
+            "filepath": str(filepath),
+            "files": None,
+            "error": None,
+        }
+        try:
+            with Font(filepath) as font:
+                result["files"] = font.save_as(
+                    dirpath,
+                    formats=formats,
+                    overwrite=overwrite,
+                    **compression_options,
+                )
+        except Exception as error:
+            result["error"] = f"{type(error).__name__}: {error}"
+        results.append(result)
+    return results
+
+
+def sanitize_many(
+    fonts: Iterable[Font],
+    *,
+    strict: bool = True,
+    workers: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Sanitizes many fonts using OpenType Sanitizer (see Font.sanitize),
+    results are returned in the same order of the given fonts.
+    Fonts data is written to a single temporary directory and the sanitizer
+    processes are run in parallel in a thread pool, fonts with the same data
+    are sanitized only once and results are cached by the font data hash,
+    so unchanged fonts are never sanitized again.
+    Errors are reported per font, without stopping the sanitization.
+
+    :param fonts: The fonts.
+    :type fonts: iterable of Font
+    :param strict: If True (default), sanitizer warnings are reported as errors.
+    :type strict: bool
+    :param workers: The number of sanitizer processes running in parallel.
+        Default is None (no parallelism, fonts are sanitized one at a time).
+    :type workers: int or None
+
+    :returns: A list of dictionaries, each one includes 'font', 'hash'
+        (the font data hash or None if the font can't be serialized),
+        'error' (the error message or None), 'warnings' (the sanitizer
+        warnings or None) and 'cached' (whether the result was already cached).
+    :rtype: list of dicts
+
+    :raises ArgumentError: If workers is not a positive number.
+    """
+    if workers is not None and workers < 1:
+        raise ArgumentError(
+            f"Invalid workers value: expected positive int, found '{workers}'."
+        )
+    results: list[dict[str, Any]] = []
+    outputs: dict[str, tuple[int, str, str] | Future[tuple[int, str, str]]] = {}
+    with (
+        tempfile.TemporaryDirectory() as dirpath,
+        ThreadPoolExecutor(max_workers=workers or 1) as executor,
+    ):
+        for font in fonts:
+            result: dict[str, Any] = {
+                "font": font,
+                "hash": None,
+                "error": None,
+                "warnings": None,
+                "cached": False,
+            }
+            results.append(result)
+            try:
+                key = font._get_binary_hash()
+            except Exception as error:
+                result["error"] = f"{type(error).__name__}: {error}"
+                continue
+            result["hash"] = key
+            if key in outputs:
+                # same data of a previous font
+                result["cached"] = True
+                continue
+            cached_output = get_cached_output(key)
+            if cached_output is not None:
+                outputs[key] = cached_output
+                result["cached"] = True
+                continue
+            # the sanitizer runs in a separate process, threads just wait for it
+            outputs[key] = executor.submit(
+                sanitize_data, font._get_binary_data(), key=key, dirpath=dirpath
+            )
+        for result in results:
+            key = result["hash"]
+            if key is None:
+                continue
+            try:
+                output = outputs[key]
+                if isinstance(output, Future):
+                    output = output.result()
+            except Exception as error:
+                result["error"] = f"{type(error).__name__}: {error}"
+                continue
+            result["error"] = get_sanitizer_error(output, strict=strict)
+            result["warnings"] = get_sanitizer_warnings(output)
+    return results
@@ -0,0 +1,496 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from fontbro.exceptions import ArgumentError
+from fontbro.font import Font
+from fontbro.workers import map_chunks
+
+
+class FingerprintCache:
+    """
+    In-memory LRU cache of fonts fingerprints,
+    keyed by the hash of the font binary data and the fingerprint text,
+    it can be shared between threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 1024,
+    ) -> None:
+        """
+        Constructs a new in-memory fingerprint cache.
+
+        :param maxsize: The max number of fingerprints kept in memory.
+        :type maxsize: int
+
+        :raises ArgumentError: If maxsize is not a positive number.
+        """
+        if maxsize < 1:
+            raise ArgumentError(
+                f"Invalid maxsize value: expected positive int, found '{maxsize}'."
+            )
+        self.hits = 0
+        self.misses = 0
+        self._maxsize = maxsize
+        self._items: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(
+        self,
+    ) -> int:
+        return len(self._items)
+
+    def clear(
+        self,
+    ) -> None:
+        """
+        Removes all the cached fingerprints and resets the hits/misses counters.
+        """
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self._items.clear()
+
+    def get(
+        self,
+        key: str,
+    ) -> Any:
+        """
+        Gets the cached fingerprint for the given key.
+
+        :param key: The key
+        :type key: str
+
+        :returns: The fingerprint hash if cached, None otherwise.
+        :rtype: imagehash.ImageHash or None
+        """
+        with self._lock:
+            value = self._get_item(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def get_stats(
+        self,
+    ) -> dict[str, int]:
+        """
+        Gets the cache stats.
+
+        :returns: A dictionary with 'hits', 'misses' and 'size' (in-memory items) keys.
+        :rtype: dict
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self),
+        }
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+    ) -> None:
+        """
+        Sets the fingerprint for the given key.
+
+        :param key: The key
+        :type key: str
+        :param value: The fingerprint hash
+        :type value: imagehash.ImageHash
+        """
+        with self._lock:
+            self._set_item(key, value)
+
+    def _get_item(
+        self,
+        key: str,
+    ) -> Any:
+        value = self._items.get(key)
+        if value is not None:
+            self._items.move_to_end(key)
+        return value
+
+    def _set_item(
+        self,
+        key: str,
+        value: Any,
+    ) -> None:
+        self._items[key] = value
+        self._items.move_to_end(key)
+        if len(self._items) > self._maxsize:
+            self._items.popitem(last=False)
+
+
+class SQLiteFingerprintCache(FingerprintCache):
+    """
+    Persistent cache of fonts fingerprints stored in a SQLite database,
+    recently used fingerprints are also kept in an in-memory LRU cache.
+    The database connection is guarded by the cache lock,
+    so the cache can be shared between threads (eg. thread pool workers).
+    """
+
+    def __init__(
+        self,
+        filepath: str | Path,
+        *,
+        maxsize: int = 1024,
+    ) -> None:
+        """
+        Constructs a new persistent fingerprint cache.
+
+        :param filepath: The SQLite database filepath (created if it doesn't exist).
+        :type filepath: str or pathlib.Path
+        :param maxsize: The max number of fingerprints kept in memory.
+        :type maxsize: int
+
+        :raises ArgumentError: If maxsize is not a positive number.
+        """
+        super().__init__(maxsize=maxsize)
+        self._connection = sqlite3.connect(str(filepath), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS fingerprints "
+                "(key TEXT PRIMARY KEY, hash TEXT NOT NULL)"
+            )
+
+    def __enter__(
+        self,
+    ) -> SQLiteFingerprintCache:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Any,
+        exc_value: Any,
+        traceback: Any,
+    ) -> None:
+        self.close()
+
+    def clear(
+        self,
+    ) -> None:
+        """
+        Removes all the cached fingerprints (also from the database)
+        and resets the hits/misses counters.
+        """
+        with self._lock, self._connection:
+            super().clear()
+            self._connection.execute("DELETE FROM fingerprints")
+
+    def close(
+        self,
+    ) -> None:
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def _get_item(
+        self,
+        key: str,
+    ) -> Any:
+        value = super()._get_item(key)
+        if value is not None:
+            return value
+        row = self._connection.execute(
+            "SELECT hash FROM fingerprints WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        import imagehash
+
+        value = imagehash.hex_to_hash(row[0])
+        super()._set_item(key, value)
+        return value
+
+    def _set_item(
+        self,
+        key: str,
+        value: Any,
+    ) -> None:
+        super()._set_item(key, value)
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO fingerprints (key, hash) VALUES (?, ?)",
+                (key, str(value)),
+            )
+
+
+class FingerprintIndex:
+    """
+    Index of fonts fingerprints for near-duplicate search across many fonts,
+    fingerprints bits are packed in a numpy uint64 matrix (one row per font)
+    and compared all at once using a vectorized popcount.
+    """
+
+    def __init__(
+        self,
+        *,
+        text: str = "",
+    ) -> None:
+        """
+        Constructs a new empty fingerprint index.
+
+        :param text: The text used for generating the fingerprints
+            (see Font.get_fingerprint), default value is used if empty.
+        :type text: str
+        """
+        self.text = text
+        self._keys: list[str] = []
+        self._variables: list[bool] = []
+        self._hashes_rows: list[Any] = []
+        self._hashes: Any = None
+
+    def __len__(
+        self,
+    ) -> int:
+        return len(self._keys)
+
+    def add(
+        self,
+        key: str,
+        font: Font,
+        *,
+        cache: FingerprintCache | None = None,
+    ) -> None:
+        """
+        Adds the fingerprint of the given font to the index.
+
+        :param key: The key used to identify the font in search results (eg. the filepath).
+        :type key: str
+        :param font: The font
+        :type font: Font
+        :param cache: The cache used to store/retrieve the fingerprint.
+        :type cache: FingerprintCache or None
+        """
+        hash = font.get_fingerprint(text=self.text, cache=cache)
+        self.add_hash(key, hash, variable=font.is_variable())
+
+    def add_hash(
+        self,
+        key: str,
+        hash: Any,
+        *,
+        variable: bool = False,
+    ) -> None:
+        """
+        Adds the given fingerprint hash to the index.
+
+        :param key: The key used to identify the font in search results (eg. the filepath).
+        :type key: str
+        :param hash: The fingerprint hash
+        :type hash: imagehash.ImageHash
+        :param variable: Whether the fingerprint belongs to a variable font.
+        :type variable: bool
+        """
+        self._add_packed_hash(key, _pack_hash(hash), variable=variable)
+
+    def add_filepaths(
+        self,
+        filepaths: Iterable[str | Path],
+        *,
+        workers: int | None = None,
+        chunksize: int = 16,
+    ) -> list[dict[str, Any]]:
+        """
+        Adds the fingerprints of many font files to the index,
+        optionally computing them in parallel in a process pool.
+        Files that can't be fingerprinted are skipped and reported.
+
+        :param filepaths: The fonts filepaths (used as keys).
+        :type filepaths: iterable of str or pathlib.Path
+        :param workers: The number of worker processes. Default is None (no parallelism).
+        :type workers: int or None
+        :param chunksize: The number of files sent to a worker process in a single task.
+        :type chunksize: int
+
+        :returns: The list of errors, each one is a dict with 'filepath' and 'error' keys.
+        :rtype: list of dicts
+
+        :raises ArgumentError: If workers or chunksize is not a positive number.
+        """
+        if workers is not None and workers < 1:
+            raise ArgumentError(
+                f"Invalid workers value: expected positive int, found '{workers}'."
+            )
+        if chunksize < 1:
+            raise ArgumentError(
+                f"Invalid chunksize value: expected positive int, found '{chunksize}'."
+            )
+        get_results = partial(_get_files_packed_hashes, text=self.text)
+        results: Iterable[dict[str, Any]]
+        if workers is None:
+            results = get_results(list(filepaths))
+        else:
+            results = map_chunks(
+                get_results,
+                filepaths,
+                workers=workers,
+                chunksize=chunksize,
+            )
+        errors = []
+        for result in results:
+            if result["error"]:
+                errors.append(
+                    {"filepath": result["filepath"], "error": result["error"]}
+                )
+                continue
+            self._add_packed_hash(
+                result["filepath"], result["hash"], variable=result["variable"]
+            )
+        return errors
+
+    def search(
+        self,
+        font: Font | Any,
+        *,
+        tolerance: int = 10,
+        cache: FingerprintCache | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Searches the fonts with a fingerprint similar to the given font/hash
+        (difference <= tolerance), if a font is given only fonts of the same
+        kind (static/variable) are returned, as in Font.get_fingerprint_match.
+
+        :param font: The font or the fingerprint hash.
+        :type font: Font or imagehash.ImageHash
+        :param tolerance: The diff tolerance.
+        :type tolerance: int
+        :param cache: The cache used to store/retrieve the font fingerprint.
+        :type cache: FingerprintCache or None
+
+        :returns: The list of matches sorted by diff, each one is a dict
+            with 'key' and 'diff' keys.
+        :rtype: list of dicts
+        """
+        variable = None
+        if isinstance(font, Font):
+            hash = font.get_fingerprint(text=self.text, cache=cache)
+            variable = font.is_variable()
+        else:
+            hash = font
+        hashes = self._get_hashes()
+        if hashes is None:
+            return []
+        diffs = np.bitwise_count(hashes ^ _pack_hash(hash)).sum(axis=1)
+        matches = diffs <= tolerance
+        if variable is not None:
+            matches &= np.array(self._variables) == variable
+        indexes = np.flatnonzero(matches)
+        indexes = indexes[np.argsort(diffs[indexes], kind="stable")]
+        return [
+            {"key": self._keys[index], "diff": int(diffs[index])} for index in indexes
+        ]
+
+    def save(
+        self,
+        filepath: str | Path,
+    ) -> None:
+        """
+        Saves the index to the given filepath (numpy .npz format).
+
+        :param filepath: The filepath
+        :type filepath: str or pathlib.Path
+        """
+        hashes = self._get_hashes()
+        with open(filepath, "wb") as fileobject:
+            np.savez_compressed(
+                fileobject,
+                text=np.array(self.text),
+                keys=np.array(self._keys, dtype=str),
+                variables=np.array(self._variables, dtype=bool),
+                hashes=(
+                    hashes if hashes is not None else np.empty((0, 0), dtype=np.uint64)
+                ),
+            )
+
+    @classmethod
+    def load(
+        cls,
+        filepath: str | Path,
+    ) -> FingerprintIndex:
+        """
+        Loads an index previously saved to the given filepath.
+
+        :param filepath: The filepath
+        :type filepath: str or pathlib.Path
+
+        :returns: The index.
+        :rtype: FingerprintIndex
+        """
+        with np.load(filepath, allow_pickle=False) as data:
+            index = cls(text=str(data["text"]))
+            index._keys = [str(key) for key in data["keys"]]
+            index._variables = [bool(variable) for variable in data["variables"]]
+            if len(index._keys):
+                index._hashes = data["hashes"]
+        return index
+
+    def _add_packed_hash(
+        self,
+        key: str,
+        packed_hash: Any,
+        *,
+        variable: bool,
+    ) -> None:
+        self._keys.append(str(key))
+        self._variables.append(variable)
+        self._hashes_rows.append(packed_hash)
+
+    def _get_hashes(
+        self,
+    ) -> Any:
+        # rows are stacked only when needed, to keep bulk insertion fast
+        if self._hashes_rows:
+            rows = [self._hashes] if self._hashes is not None else []
+            rows.append(np.vstack(self._hashes_rows))
+            self._hashes = np.concatenate(rows)
+            self._hashes_rows = []
+        return self._hashes
+
+
+def _pack_hash(
+    hash: Any,
+) -> Any:
+    # pack the hash bits in uint64 words (64 words for a 64x64 hash)
+    bits = np.packbits(np.asarray(hash.hash, dtype=bool).flatten())
+    padding = -len(bits) % 8
+    if padding:
+        bits = np.concatenate([bits, np.zeros(padding, dtype=np.uint8)])
+    return bits.view(np.uint64)
+
+
+def _get_files_packed_hashes(
+    filepaths: list[str | Path],
+    *,
+    text: str,
+) -> list[dict[str, Any]]:
+    results = []
+    for filepath in filepaths:
+        result: dict[str, Any] = {
+            "filepath": str(filepath),
+            "hash": None,
+            "variable": False,
+            "error": None,
+        }
+        try:
+            with Font(filepath) as font:
+                result["hash"] = _pack_hash(font.get_fingerprint(text=text))
+                result["variable"] = font.is_variable()
+        except Exception as error:
+            result["error"] = f"{type(error).__name__}: {error}"
+        results.append(result)
+    return results
@@ -1,20 +1,24 @@
 from __future__ import annotations
 
-import copy
+import hashlib
 import math
+import mmap
 import os
 import re
+import struct
 import sys
-import tempfile
-from collections import Counter
-from collections.abc import Generator
-from io import BytesIO
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import Executor
+from io import BytesIO, StringIO
 from pathlib import Path
-from typing import IO, Any, cast
+from typing import IO, TYPE_CHECKING, Any, cast
 
 import fsutil
-import ots
+import numpy as np
 from fontTools import unicodedata
+from fontTools.misc.timeTools import timestampNow
+from fontTools.pens.boundsPen import ControlBoundsPen
 from fontTools.pens.svgPathPen import SVGPathPen
 from fontTools.subset import Options as SubsetterOptions
 from fontTools.subset import Subsetter
@@ -22,6 +26,7 @@ from fontTools.ttLib import TTCollection, TTFont, TTLibError
 from fontTools.varLib import instancer
 from fontTools.varLib.instancer import OverlapMode
 from PIL import Image, ImageDraw, ImageFont
+from PIL import features as pillow_features
 
 from fontbro.exceptions import (
     ArgumentError,
@@ -30,15 +35,32 @@ from fontbro.exceptions import (
     SanitizationError,
 )
 from fontbro.flags import get_flag, set_flag
+from fontbro.glyphs import GlyphGraph
 from fontbro.math import get_euclidean_distance
-from fontbro.subset import parse_unicodes
+from fontbro.readers import Buffer, BufferReader, TablesReader
+from fontbro.sanitizer import get_sanitizer_error, sanitize_data
+from fontbro.shaping import create_shaping_font, get_pillow_features, shape_text
+from fontbro.subset import format_unicode_range, parse_unicodes
+from fontbro.unicode import get_unicode_block_and_script
 from fontbro.utils import (
     concat_names,
     find_item,
+    get_css_url,
     read_json,
     remove_spaces,
     slugify,
 )
+from fontbro.workers import create_process_pool, get_worker_data
+from fontbro.writers import (
+    WOFF2_COMPRESSION_LEVEL_DEFAULT,
+    WOFF2_WINDOW_SIZE_DEFAULT,
+    WOFF_COMPRESSION_LEVEL_DEFAULT,
+    validate_compression_options,
+    write_tables,
+)
+
+if TYPE_CHECKING:
+    from fontbro.fingerprints import FingerprintCache
 
 
 class Font:
@@ -237,6 +259,46 @@ class Font:
     _UNICODE_BLOCKS: list[dict[str, Any]] = read_json("data/unicode-blocks.json")
     _UNICODE_SCRIPTS: list[dict[str, Any]] = read_json("data/unicode-scripts.json")
 
+    # Unicode-range subsets (Google Fonts style), characters not included in any subset
+    # are split in numbered slices of _UNICODE_SUBSETS_SLICE_SIZE characters:
+    _UNICODE_SUBSETS: list[dict[str, Any]] = read_json("data/unicode-subsets.json")
+    _UNICODE_SUBSETS_SLICE_SIZE: int = 200
+    _UNICODE_SUBSETS_CSS_FORMATS: dict[str, str] = {
+        FORMAT_WOFF2: "woff2",
+        FORMAT_WOFF: "woff",
+        FORMAT_TTF: "truetype",
+        FORMAT_OTF: "opentype",
+    }
+
+    # Characters fields (computed from code and character name):
+    _CHARACTERS_FIELDS: dict[str, Callable[[int, str], Any]] = {
+        "character": lambda code, name: chr(code),
+        "character_name": lambda code, name: name,
+        "code": lambda code, name: code,
+        "escape_sequence": lambda code, name: f"\\u{code:04X}",
+        "html_code": lambda code, name: f"&#{code};",
+        "unicode": lambda code, name: f"U+{code:04X}",
+        "unicode_code": lambda code, name: code,
+        "unicode_name": lambda code, name: unicodedata.name(chr(code), None),
+        "unicode_block_name": lambda code, name: get_unicode_block_and_script(code)[0],
+        "unicode_script_name": lambda code, name: get_unicode_block_and_script(code)[2],
+        "unicode_script_tag": lambda code, name: get_unicode_block_and_script(code)[1],
+    }
+
+    # Max number of Pillow fonts (one per size) cached for rendering images:
+    _IMAGE_FONTS_CACHE_SIZE: int = 16
+    _SHAPING_CACHE_SIZE: int = 256
+    _SVG_GLYPHS_PATHS_CACHE_SIZE: int = 4096
+    _IMAGE_SPEC_KEYS: list[str] = [
+        "text",
+        "size",
+        "color",
+        "background_color",
+        "shaping",
+        "features",
+        "coordinates",
+    ]
+
     # Variable Axes:
     _VARIABLE_AXES: list[dict[str, Any]] = [
         {"tag": "ital", "name": "Italic"},
@@ -391,39 +453,66 @@ class Font:
 
     def __init__(
         self,
-        filepath: str | Path | IO[Any] | TTFont | Font,
+        filepath: str | Path | Buffer | IO[Any] | TTFont | Font,
         **kwargs: Any,
     ) -> None:
         """
         Constructs a new Font instance loading a font file from the given filepath.
+        When loading from a filepath the font is opened in lazy mode (tables
+        are read from file and decompiled only when accessed),
+        pass lazy=None or lazy=False to load the whole file in memory.
 
         :param filepath: The filepath from which to load the font
-        :type filepath: string or file object or TTFont or Font
+        :type filepath: string or bytes-like object or file object or TTFont or Font
+        :param kwargs: The options for the fontTools.ttLib.TTFont constructor
+        :type kwargs: dictionary
 
         :raises ValueError: if the filepath is not a valid font
         """
         super().__init__()
 
         self._filepath: str | Path | None = None
-        self._fileobject: IO[Any] | None = None
+        self._fileobject: IO[Any] | BufferReader | None = None
+        self._mmap: mmap.mmap | None = None
         self._ttfont: TTFont | None = None
         self._kwargs: dict[str, Any] = {}
+        self._characters_cache: dict[str, Any] = {}
+        self._characters_cache_cmap: dict[int, str] | None = None
+        self._binary_data: bytes | None = None
+        self._binary_tables_data: dict[str, bytes] | None = None
+        self._binary_hash: str | None = None
+        self._image_fonts: dict[tuple[Any, ...], ImageFont.FreeTypeFont] = {}
+        self._image_fonts_source: BytesIO | None = None
+        self._svg_glyphs_paths: dict[tuple[str, tuple[Any, ...]], str] = {}
+        self._shaping_font: Any = None
+        self._glyph_graph: GlyphGraph | None = None
+        self._modified_tables_tags: set[str] = set()
+        self._source_tables_tags: set[str] = set()
+        self._shaping_cache: dict[
+            tuple[Any, ...], list[tuple[str, int, int, int, int]]
+        ] = {}
 
         if isinstance(filepath, (Path, str)):
             self._init_with_filepath(str(filepath), **kwargs)
+        elif isinstance(filepath, (bytes, bytearray, memoryview, mmap.mmap)):
+            self._init_with_buffer(filepath, **kwargs)
         elif hasattr(filepath, "read"):
             self._init_with_fileobject(cast(IO[Any], filepath), **kwargs)
         elif isinstance(filepath, Font):
             self._init_with_font(filepath, **kwargs)
         elif isinstance(filepath, TTFont):
             self._init_with_ttfont(filepath, **kwargs)
+        elif isinstance(filepath, TablesReader):
+            self._init_with_tables_reader(filepath, **kwargs)
         else:
             filepath_type = type(filepath).__name__
             raise ArgumentError(
                 "Invalid filepath type: "
-                "expected str or pathlib.Path or file object or TTFont or Font, "
+                "expected str or pathlib.Path or bytes-like object "
+                "or file object or TTFont or Font, "
                 f"found '{filepath_type}'."
             )
+        self._source_tables_tags = self._get_tables_tags()
 
     def _init_with_filepath(
         self,
@@ -433,11 +522,33 @@ class Font:
         try:
             self._filepath = filepath
             self._kwargs = kwargs
-            self._ttfont = TTFont(self._filepath, **kwargs)
+            # read tables from file only on demand,
+            # metadata getters usually need just a few small tables
+            ttfont_kwargs = {"lazy": True, **kwargs}
+            self._ttfont = TTFont(self._filepath, **ttfont_kwargs)
 
         except TTLibError as error:
             raise ArgumentError(f"Invalid font at filepath: '{filepath}'.") from error
 
+    def _init_with_buffer(
+        self,
+        buffer: Buffer,
+        **kwargs: Any,
+    ) -> None:
+        self._fileobject = BufferReader(buffer)
+        self._kwargs = kwargs
+        try:
+            # parse tables directly from the buffer without copying it
+            ttfont_kwargs = {"lazy": True, **kwargs}
+            self._ttfont = TTFont(self._fileobject, **ttfont_kwargs)
+
+        except Exception as error:
+            # release the buffer view, so that the buffer can be closed
+            self._fileobject.close()
+            if isinstance(error, TTLibError):
+                raise ArgumentError("Invalid font buffer.") from error
+            raise
+
     def _init_with_fileobject(
         self,
         fileobject: IO[Any],
@@ -465,10 +576,17 @@ class Font:
         ttfont: TTFont,
         **kwargs: Any,
     ) -> None:
-        self._fileobject = BytesIO()
-        ttfont.save(self._fileobject)
-        self._fileobject.seek(0)
-        self._ttfont = TTFont(self._fileobject, **kwargs)
+        # share the tables data instead of serializing and parsing the whole font,
+        # each font decompiles its own tables, so changes don't affect the other
+        tables_reader = TablesReader.from_ttfont(ttfont)
+        self._init_with_tables_reader(tables_reader, **kwargs)
+
+    def _init_with_tables_reader(
+        self,
+        tables_reader: TablesReader,
+        **kwargs: Any,
+    ) -> None:
+        self._ttfont = tables_reader.open_ttfont(**kwargs)
         self._kwargs = kwargs
 
     def __enter__(
@@ -490,10 +608,14 @@ class Font:
         """
         Creates a new Font instance with the current in-memory state,
         including any modifications made to the current instance.
+        Tables data is shared with the clone (copy-on-write),
+        only loaded tables are compiled (they could have been modified).
         """
         font = self.get_ttfont()
-        font_clone = Font(font, **self._kwargs)
+        tables_reader = TablesReader.from_ttfont(font)
+        font_clone = Font(tables_reader, **self._kwargs)
         font_clone._filepath = self._filepath
+        font_clone._modified_tables_tags = set(self.get_modified_tables_tags())
         return font_clone
 
     def close(
@@ -502,8 +624,81 @@ class Font:
         """
         Close the wrapped TTFont instance.
         """
+        self._clear_binary_cache()
         font = self.get_ttfont()
         font.close()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    @classmethod
+    def from_bytes(
+        cls,
+        buffer: Buffer,
+        **kwargs: Any,
+    ) -> Font:
+        """
+        Creates a new Font instance from a bytes-like object
+        (bytes, bytearray, memoryview or mmap) without copying it,
+        tables are read from the buffer only when accessed.
+
+        :param buffer: The buffer containing the font data
+        :type buffer: bytes or bytearray or memoryview or mmap.mmap
+
+        :returns: The Font instance.
+        :rtype: Font
+
+        :raises ValueError: if the buffer is not a valid font
+        """
+        if not isinstance(buffer, (bytes, bytearray, memoryview, mmap.mmap)):
+            buffer_type = type(buffer).__name__
+            raise ArgumentError(
+                "Invalid buffer type: "
+                "expected bytes or bytearray or memoryview or mmap, "
+                f"found '{buffer_type}'."
+            )
+        return cls(buffer, **kwargs)
+
+    @classmethod
+    def from_mmap(
+        cls,
+        filepath: str | Path,
+        **kwargs: Any,
+    ) -> Font:
+        """
+        Creates a new Font instance memory-mapping the font file at filepath,
+        tables are read from the mapped file only when accessed.
+        The file stays mapped until the font is closed.
+
+        :param filepath: The filepath
+        :type filepath: str or pathlib.Path
+
+        :returns: The Font instance.
+        :rtype: Font
+
+        :raises ValueError: if the file is not a valid font
+        """
+        filepath = str(filepath)
+        with open(filepath, "rb") as fileobject:
+            try:
+                buffer = mmap.mmap(fileobject.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as error:
+                # empty files can't be memory-mapped
+                raise ArgumentError(
+                    f"Invalid font at filepath: '{filepath}'."
+                ) from error
+        try:
+            font = cls(buffer, **kwargs)
+        except Exception:
+            buffer.close()
+            raise
+        # the mapping is closed when the font is closed
+        font._mmap = buffer
+        font._filepath = filepath
+        if isinstance(font._fileobject, BufferReader):
+            # allows detecting when the font is saved over the mapped file
+            font._fileobject.name = filepath
+        return font
 
     @classmethod
     def from_collection(
@@ -526,27 +721,166 @@ class Font:
             fonts = [cls(font, **kwargs) for font in font_collection]
         return fonts
 
+    def _get_binary_data(
+        self,
+    ) -> bytes:
+        """
+        Gets the font binary data (cached until the font changes),
+        the head table modified timestamp is not updated,
+        so that the same font content always produces the same data.
+        """
+        font = self.get_ttfont()
+        recalc_timestamp = font.recalcTimestamp
+        font.recalcTimestamp = False
+        try:
+            # only loaded tables can be edited (also directly via get_ttfont),
+            # so comparing their compiled data is enough to detect changes
+            if (
+                self._binary_data is None
+                or self._get_loaded_tables_data() != self._binary_tables_data
+            ):
+                self._clear_binary_cache()
+                self._binary_data = self.save_to_fileobject().read()
+                self._binary_tables_data = self._get_loaded_tables_data()
+        finally:
+            font.recalcTimestamp = recalc_timestamp
+        return self._binary_data
+
+    def _get_binary_hash(
+        self,
+    ) -> str:
+        """
+        Gets the sha256 hash of the font binary data (cached until the font changes).
+        """
+        binary_data = self._get_binary_data()
+        if self._binary_hash is None:
+            self._binary_hash = hashlib.sha256(binary_data).hexdigest()
+        return self._binary_hash
+
     def get_characters(
         self,
         *,
         ignore_blank: bool = False,
+        fields: list[str] | None = None,
     ) -> Generator[dict[str, Any]]:
         """
         Gets the font characters.
 
         :param ignore_blank: If True, characters without contours will not be returned.
         :type ignore_blank: bool
+        :param fields: The characters fields to return (eg. ["code", "character_name"]),
+            only the requested fields are computed. If None, all fields are returned.
+        :type fields: list or None
 
         :returns: The characters.
         :rtype: generator of dicts
 
         :raises TypeError: If it's not possible to find the 'best' unicode cmap dict.
+        :raises ArgumentError: If a field is invalid.
         """
+        if fields is not None:
+            yield from self._get_characters_fields(
+                fields=fields,
+                ignore_blank=ignore_blank,
+            )
+            return
+        characters = self._get_characters_index()
+        # avoid loading the glyphs tables if not needed
+        is_blank_glyph = self._get_is_blank_glyph_func() if ignore_blank else None
+        for char in characters:
+            if is_blank_glyph and is_blank_glyph(char["character_name"]):
+                continue
+            yield char.copy()
+
+    def _get_characters_fields(
+        self,
+        *,
+        fields: list[str],
+        ignore_blank: bool,
+    ) -> Generator[dict[str, Any]]:
+        fields_funcs = []
+        for field in fields:
+            field_func = self._CHARACTERS_FIELDS.get(field)
+            if field_func is None:
+                raise ArgumentError(
+                    f"Invalid field: '{field}', "
+                    f"expected one of {list(self._CHARACTERS_FIELDS.keys())}."
+                )
+            fields_funcs.append((field, field_func))
         font = self.get_ttfont()
         cmap = font.getBestCmap()
         if cmap is None:
             raise DataError("Unable to find the 'best' unicode cmap dict.")
-        glyfs = font.get("glyf")
+        is_blank_glyph = self._get_is_blank_glyph_func() if ignore_blank else None
+        for code, char_name in cmap.items():
+            # exclude invalid codes and control characters
+            if not (0x20 <= code < 0x110000 and code != 0x7F):
+                continue
+            if is_blank_glyph and is_blank_glyph(char_name):
+                continue
+            yield {
+                field: field_func(code, char_name) for field, field_func in fields_funcs
+            }
+
+    def _get_characters_cached(
+        self,
+        key: str,
+        func: Callable[[dict[int, str]], Any],
+    ) -> Any:
+        """
+        Gets a value computed by func from the 'best' unicode cmap dict,
+        values are computed once and then cached until the cmap changes
+        (eg. subset or in-place changes to the cmap dict).
+
+        :raises TypeError: If it's not possible to find the 'best' unicode cmap dict.
+        """
+        font = self.get_ttfont()
+        cmap = font.getBestCmap()
+        if cmap is None:
+            raise DataError("Unable to find the 'best' unicode cmap dict.")
+        # compare with a copy of the cached cmap, so that in-place changes
+        # (eg. same size remapping) are detected too
+        if cmap != self._characters_cache_cmap:
+            self._characters_cache = {}
+            self._characters_cache_cmap = dict(cmap)
+        if key not in self._characters_cache:
+            self._characters_cache[key] = func(cmap)
+        return self._characters_cache[key]
+
+    def _get_characters_codes(
+        self,
+    ) -> list[int]:
+        """
+        Gets the sorted codes of the font characters (cached).
+        """
+        codes: list[int] = self._get_characters_cached(
+            "codes",
+            lambda cmap: sorted(
+                code
+                for code in cmap.keys()
+                # exclude invalid codes and control characters
+                if 0x20 <= code < 0x110000 and code != 0x7F
+            ),
+        )
+        return codes
+
+    def _get_characters_index(
+        self,
+    ) -> list[dict[str, Any]]:
+        """
+        Gets the font characters (cached).
+        """
+        characters: list[dict[str, Any]] = self._get_characters_cached(
+            "index",
+            self._create_characters_index,
+        )
+        return characters
+
+    @staticmethod
+    def _create_characters_index(
+        cmap: dict[int, str],
+    ) -> list[dict[str, Any]]:
+        characters = []
         for code, char_name in cmap.items():
             code_hex = f"{code:04X}"
             if 0 <= code < 0x110000:
@@ -557,27 +891,26 @@ class Font:
             char_code = ord(char)
             if char_code < 0x20 or char_code == 0x7F:
                 continue
-            if glyfs and ignore_blank:
-                glyf = glyfs.get(char_name)
-                if glyf and glyf.numberOfContours == 0:
-                    continue
             unicode_name = unicodedata.name(char, None)
-            unicode_block_name = unicodedata.block(code)
-            unicode_script_tag = unicodedata.script(code)
-            unicode_script_name = unicodedata.script_name(unicode_script_tag)
-            yield {
-                "character": char,
-                "character_name": char_name,
-                "code": code,
-                "escape_sequence": f"\\u{code_hex}",
-                "html_code": f"&#{code};",
-                "unicode": f"U+{code_hex}",
-                "unicode_code": code,
-                "unicode_name": unicode_name,
-                "unicode_block_name": unicode_block_name,
-                "unicode_script_name": unicode_script_name,
-                "unicode_script_tag": unicode_script_tag,
-            }
+            unicode_block_name, unicode_script_tag, unicode_script_name = (
+                get_unicode_block_and_script(code)
+            )
+            characters.append(
+                {
+                    "character": char,
+                    "character_name": char_name,
+                    "code": code,
+                    "escape_sequence": f"\\u{code_hex}",
+                    "html_code": f"&#{code};",
+                    "unicode": f"U+{code_hex}",
+                    "unicode_code": code,
+                    "unicode_name": unicode_name,
+                    "unicode_block_name": unicode_block_name,
+                    "unicode_script_name": unicode_script_name,
+                    "unicode_script_tag": unicode_script_tag,
+                }
+            )
+        return characters
 
     def get_characters_count(
         self,
@@ -593,7 +926,51 @@ class Font:
         :returns: The characters count.
         :rtype: int
         """
-        return len(list(self.get_characters(ignore_blank=ignore_blank)))
+        codes = self._get_characters_codes()
+        if not ignore_blank:
+            return len(codes)
+        font = self.get_ttfont()
+        cmap = font.getBestCmap()
+        is_blank_glyph = self._get_is_blank_glyph_func()
+        return sum(1 for code in codes if not is_blank_glyph(cmap[code]))
+
+    def _get_is_blank_glyph_func(
+        self,
+    ) -> Callable[[str], bool]:
+        """
+        Gets a function that checks if a glyph (by name) has no contours,
+        it supports both TrueType (glyf) and PostScript (CFF/CFF2) outlines.
+        """
+        font = self.get_ttfont()
+        if "glyf" in font:
+            glyfs = font["glyf"].glyphs
+
+            def is_blank_glyph(name: str) -> bool:
+                glyf = glyfs.get(name)
+                if glyf is None:
+                    return False
+                # read the contours count from the glyph data header
+                # to avoid expanding (decompiling) the whole glyph
+                glyf_data = getattr(glyf, "data", None)
+                if glyf_data is None:
+                    return bool(glyf.numberOfContours == 0)
+                return int.from_bytes(glyf_data[:2], "big", signed=True) == 0
+
+            return is_blank_glyph
+
+        if "CFF " in font or "CFF2" in font:
+            glyphset = font.getGlyphSet()
+
+            def is_blank_cff_glyph(name: str) -> bool:
+                if name not in glyphset:
+                    return False
+                pen = ControlBoundsPen(glyphset)
+                glyphset[name].draw(pen)
+                return pen.bounds is None
+
+            return is_blank_cff_glyph
+
+        return lambda name: False
 
     def _get_family_classification_items(
         self,
@@ -780,6 +1157,7 @@ class Font:
         self,
         *,
         text: str = "",
+        cache: FingerprintCache | None = None,
     ):
         """
         Gets the font fingerprint: an hash calculated from an image representation of the font.
@@ -788,13 +1166,30 @@ class Font:
         :param text: The text used for generating the fingerprint,
         default value: "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789".
         :type text: str
+        :param cache: The cache used to store/retrieve the fingerprint,
+            keyed by the hash of the font binary data and the text.
+        :type cache: fontbro.fingerprints.FingerprintCache or None
 
         :returns: The fingerprint hash.
         :rtype: imagehash.ImageHash
         """
-        import imagehash
-
         text = text or "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+        if cache is None:
+            return self._create_fingerprint(text=text)
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        cache_key = f"{self._get_binary_hash()}-{text_hash}"
+        hash = cache.get(cache_key)
+        if hash is None:
+            hash = self._create_fingerprint(text=text)
+            cache.set(cache_key, hash)
+        return hash
+
+    def _create_fingerprint(  # type: ignore
+        self,
+        *,
+        text: str,
+    ):
+        import imagehash
 
         img = self.get_image(text=text, size=72)
         img_size = img.size
@@ -812,6 +1207,7 @@ class Font:
         *,
         tolerance: int = 10,
         text: str = "",
+        cache: FingerprintCache | None = None,
     ):
         """
         Gets the fingerprint match between this font and another one.
@@ -824,6 +1220,8 @@ class Font:
         :param text: The text used for generating the fingerprint,
         default value: "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789".
         :type text: str
+        :param cache: The cache used to store/retrieve the fingerprints of both fonts.
+        :type cache: fontbro.fingerprints.FingerprintCache or None
 
         :returns: A tuple containing the match info (match, diff, hash, other_hash).
         :rtype: tuple
@@ -839,11 +1237,16 @@ class Font:
                 "Invalid other filepath/font: expected str or Font instance, "
                 f"found '{other_type}'."
             )
-        hash = self.get_fingerprint(text=text)
-        other_hash = other_font.get_fingerprint(text=text)
-        diff = hash - other_hash
-        match = diff <= tolerance
-        match = match and self.is_variable() == other_font.is_variable()
+        try:
+            hash = self.get_fingerprint(text=text, cache=cache)
+            other_hash = other_font.get_fingerprint(text=text, cache=cache)
+            diff = hash - other_hash
+            match = diff <= tolerance
+            match = match and self.is_variable() == other_font.is_variable()
+        finally:
+            # close the font opened from filepath (it keeps the file open)
+            if other_font is not other:
+                other_font.close()
         return (match, diff, hash, other_hash)
 
     def get_format(
@@ -878,6 +1281,21 @@ class Font:
             raise DataError("Unable to get the font format.")
         return format_
 
+    def get_glyph_graph(
+        self,
+    ) -> GlyphGraph:
+        """
+        Gets the glyphs composition graph, it allows to query direct and
+        transitive components/dependents of any glyph (eg. which glyphs depend on 'acute').
+        The graph is built once and cached until the font is modified.
+
+        :returns: The glyph graph.
+        :rtype: fontbro.glyphs.GlyphGraph
+        """
+        if self._glyph_graph is None:
+            self._glyph_graph = GlyphGraph.from_ttfont(self.get_ttfont())
+        return self._glyph_graph
+
     def get_glyphs(
         self,
     ) -> Generator[dict[str, Any]]:
@@ -887,14 +1305,11 @@ class Font:
         :returns: The glyphs.
         :rtype: generator of dicts
         """
-        font = self.get_ttfont()
-        glyfs = font["glyf"]
-        glyphset = font.getGlyphSet()
-        for name in glyphset.keys():
-            glyf = glyfs[name]
+        glyph_graph = self.get_glyph_graph()
+        for name in self.get_ttfont().getGlyphOrder():
             yield {
                 "name": name,
-                "components_names": glyf.getComponentNames(glyfs),
+                "components_names": glyph_graph.get_components(name),
             }
 
     def get_glyphs_count(
@@ -907,8 +1322,7 @@ class Font:
         :rtype: int
         """
         font = self.get_ttfont()
-        glyphset = font.getGlyphSet()
-        count = len(glyphset)
+        count = int(font["maxp"].numGlyphs)
         return count
 
     def get_image(  # type: ignore
@@ -918,6 +1332,9 @@ class Font:
         size: int,
         color: tuple[int, int, int, int] = (0, 0, 0, 255),
         background_color: tuple[int, int, int, int] = (255, 255, 255, 255),
+        shaping: bool = False,
+        features: dict[str, bool | int] | None = None,
+        coordinates: dict[str, float] | None = None,
     ):
         """
         Gets an image representation of the font rendering
@@ -931,24 +1348,183 @@ class Font:
         :type color: tuple
         :param background_color: The background color
         :type background_color: tuple
+        :param shaping: If True, the text is shaped (kerning, ligatures, etc.)
+            using the Pillow raqm layout engine (HarfBuzz).
+        :type shaping: bool
+        :param features: The OpenType features to enable/disable when shaping,
+            eg. {"liga": False, "ss01": True}.
+        :type features: dict or None
+        :param coordinates: The variable axes coordinates used for rendering
+            a variable font without instancing it, eg. {"wght": 700},
+            missing axes use their default value.
+        :type coordinates: dict or None
 
         :returns: The image.
         :rtype: PIL.Image
+
+        :raises ArgumentError: If features are passed without shaping,
+            or if coordinates contain an unknown axis.
+        :raises OperationError: If shaping is not supported by the installed Pillow,
+            or if coordinates are passed for a static font.
+        """
+        if features is not None and not shaping:
+            raise ArgumentError("Invalid features: text shaping must be enabled.")
+        layout_engine = None
+        if shaping:
+            if not pillow_features.check_feature("raqm"):
+                raise OperationError(
+                    "Text shaping requires Pillow with raqm support (libraqm)."
+                )
+            layout_engine = ImageFont.Layout.RAQM
+        text_features = get_pillow_features(features)
+        img = Image.new("RGBA", (2, 2), background_color)
+        draw = ImageDraw.Draw(img)
+        img_font = self._get_image_font(size, layout_engine=layout_engine)
+        if self.is_variable():
+            # cached Pillow fonts are shared, so variations are always (re)set
+            axes_coordinates = self._get_variable_coordinates(coordinates)
+            img_font.set_variation_by_axes(list(axes_coordinates.values()))
+        elif coordinates is not None:
+            self._get_variable_coordinates(coordinates)
+        img_bbox = draw.textbbox((0, 0), text, font=img_font, features=text_features)
+        img_width = img_bbox[2] - img_bbox[0]
+        img_height = img_bbox[3] - img_bbox[1]
+        img_size = (img_width, img_height)
+        img = img.resize(img_size)
+        draw = ImageDraw.Draw(img)
+        draw.text(
+            (-img_bbox[0], -img_bbox[1]),
+            text,
+            font=img_font,
+            fill=color,
+            features=text_features,
+        )
+        return img
+
+    def _get_image_font(
+        self,
+        size: int,
+        *,
+        layout_engine: ImageFont.Layout | None = None,
+    ) -> ImageFont.FreeTypeFont:
+        """
+        Gets the Pillow font of the given size loaded from the font binary data,
+        both data and Pillow fonts are cached until the font changes.
+        """
+        binary_data = self._get_binary_data()
+        if self._image_fonts_source is None:
+            self._image_fonts_source = BytesIO(binary_data)
+        key = (size, layout_engine)
+        img_font = self._image_fonts.pop(key, None)
+        if img_font is None:
+            # all sizes read the same (not copied) bytes from the shared source
+            self._image_fonts_source.seek(0)
+            img_font = ImageFont.truetype(
+                self._image_fonts_source, size, layout_engine=layout_engine
+            )
+            # keep only the most recently used sizes
+            if len(self._image_fonts) >= self._IMAGE_FONTS_CACHE_SIZE:
+                del self._image_fonts[next(iter(self._image_fonts))]
+        self._image_fonts[key] = img_font
+        return img_font
+
+    def get_images(
+        self,
+        specs: Iterable[dict[str, Any]],
+    ) -> list[Image.Image]:
+        """
+        Gets many image representations of the font rendering
+        some texts using the given specs, the font is loaded
+        in the rasterizer only once per size.
+
+        :param specs: The images specs, each one is a dict of get_image options,
+            eg. {"text": "Hello!", "size": 48, "color": (0, 0, 0, 255)}.
+        :type specs: iterable of dicts
+
+        :returns: The images (in the same order of the given specs).
+        :rtype: list of PIL.Image
+
+        :raises ArgumentError: If a spec misses text/size or contains an invalid option.
+        """
+        specs_list = list(specs)
+        for spec in specs_list:
+            self._validate_image_spec(spec)
+        # render same size images together to reuse the same Pillow font
+        images: list[Image.Image | None] = [None] * len(specs_list)
+        specs_indexes = sorted(
+            range(len(specs_list)), key=lambda index: specs_list[index]["size"]
+        )
+        for index in specs_indexes:
+            images[index] = self.get_image(**specs_list[index])
+        return cast(list[Image.Image], images)
+
+    def get_images_sprite(
+        self,
+        specs: Iterable[dict[str, Any]],
+        *,
+        padding: int = 0,
+        background_color: tuple[int, int, int, int] = (0, 0, 0, 0),
+    ) -> tuple[Image.Image, list[dict[str, int]]]:
+        """
+        Gets a single sprite sheet image containing the images rendered
+        using the given specs (see get_images) stacked vertically,
+        along with the offset of each image in the sprite.
+
+        :param specs: The images specs, each one is a dict of get_image options,
+            eg. {"text": "Hello!", "size": 48, "color": (0, 0, 0, 255)}.
+        :type specs: iterable of dicts
+        :param padding: The space between images, in pixels.
+        :type padding: int
+        :param background_color: The sprite background color.
+        :type background_color: tuple
+
+        :returns: The sprite image and the list of images offsets (in the same order
+            of the given specs), each one is a dict with x, y, width and height keys.
+        :rtype: tuple
+
+        :raises ArgumentError: If a spec misses text/size or contains an invalid option,
+            or if padding is negative.
         """
-        with tempfile.TemporaryDirectory() as dest:
-            filepath = self.save(dest)
-            img = Image.new("RGBA", (2, 2), background_color)
-            draw = ImageDraw.Draw(img)
-            img_font = ImageFont.truetype(filepath, size)
-            img_bbox = draw.textbbox((0, 0), text, font=img_font)
-            img_width = img_bbox[2] - img_bbox[0]
-            img_height = img_bbox[3] - img_bbox[1]
-            img_size = (img_width, img_height)
-            img = img.resize(img_size)
-            draw = ImageDraw.Draw(img)
-            draw.text((-img_bbox[0], -img_bbox[1]), text, font=img_font, fill=color)
-            del img_font
-            return img
+        if padding < 0:
+            raise ArgumentError(
+                f"Invalid padding value: expected int >= 0, found '{padding}'."
+            )
+        images = self.get_images(specs)
+        offsets: list[dict[str, int]] = []
+        sprite_width = 0
+        sprite_height = 0
+        for image in images:
+            offsets.append(
+                {
+                    "x": 0,
+                    "y": sprite_height,
+                    "width": image.width,
+                    "height": image.height,
+                }
+            )
+            sprite_width = max(sprite_width, image.width)
+            sprite_height += image.height + padding
+        sprite_height = max(0, sprite_height - padding)
+        sprite = Image.new("RGBA", (sprite_width, sprite_height), background_color)
+        for image, offset in zip(images, offsets, strict=True):
+            sprite.paste(image, (offset["x"], offset["y"]))
+            image.close()
+        return (sprite, offsets)
+
+    @classmethod
+    def _validate_image_spec(
+        cls,
+        spec: dict[str, Any],
+    ) -> None:
+        for key in ["text", "size"]:
+            if key not in spec:
+                raise ArgumentError(f"Invalid image spec: missing '{key}' in {spec!r}.")
+        for key in spec:
+            if key not in cls._IMAGE_SPEC_KEYS:
+                raise ArgumentError(
+                    f"Invalid image spec: unexpected '{key}' in {spec!r}, "
+                    f"expected keys: {cls._IMAGE_SPEC_KEYS}."
+                )
 
     def get_italic_angle(
         self,
@@ -972,6 +1548,22 @@ class Font:
         }
         return italic_angle
 
+    def get_loaded_tables_tags(
+        self,
+    ) -> list[str]:
+        """
+        Gets the tags of the tables that have been loaded (decompiled) so far.
+        Tables are loaded on demand, so this reflects the tables touched by
+        the methods called since the font has been opened.
+
+        :returns: The loaded tables tags list.
+        :rtype: list of str
+        """
+        font = self.get_ttfont()
+        return sorted(
+            tag for tag in font.keys() if tag != "GlyphOrder" and font.isLoaded(tag)
+        )
+
     @classmethod
     def _get_name_id(
         cls,
@@ -987,6 +1579,190 @@ class Font:
                 f"Invalid key type, expected int or str, found '{key_type}'."
             )
 
+    def get_modified_tables_tags(
+        self,
+    ) -> list[str]:
+        """
+        Gets the tags of the tables that have been modified (or removed)
+        since the font has been opened.
+        Changes made by the Font methods are tracked, tables added or removed
+        directly on the TTFont instance too, while direct changes to the content
+        of a table must be marked using set_modified.
+
+        :returns: The modified tables tags list.
+        :rtype: list of str
+        """
+        tables_tags = self._get_tables_tags()
+        tags = self._modified_tables_tags | (tables_tags ^ self._source_tables_tags)
+        return sorted(tags)
+
+    def get_monospace_info(
+        self,
+        threshold: float = 0.85,
+    ) -> dict[str, Any]:
+        """
+        Gets the font monospace info: the share of glyphs with the most common
+        advance width (zero-width and mark glyphs are ignored) and the monospace
+        flags declared in the post (isFixedPitch) and OS/2 (panose proportion) tables.
+
+        :param threshold: The threshold (0.0 <= n <= 1.0) of glyphs with the same width to consider the font as monospace.
+        :type threshold: float
+
+        :returns: A dictionary with 'is_monospace', 'advance_width' (the most common),
+            'advance_width_ratio', 'post_is_fixed_pitch' and 'panose_monospaced' keys.
+        :rtype: dict
+        """
+        font = self.get_ttfont()
+        widths = self._get_advance_widths()
+        # ignore zero-width glyphs and mark glyphs (GDEF glyph class 3)
+        ignored = widths == 0
+        marks_ids = self._get_marks_glyphs_ids()
+        ignored[marks_ids[marks_ids < len(widths)]] = True
+        widths = widths[~ignored]
+        advance_width = None
+        advance_width_ratio = 0.0
+        if len(widths):
+            widths_counts = np.bincount(widths)
+            advance_width = int(widths_counts.argmax())
+            advance_width_ratio = float(widths_counts[advance_width] / len(widths))
+        # panose proportion digit: 9 is monospaced for latin text,
+        # 3 is monospaced for latin hand written and latin symbol families
+        panose_monospaced = False
+        if "OS/2" in font:
+            panose = font["OS/2"].panose
+            if panose.bFamilyType in (0, 1, 2):
+                panose_monospaced = panose.bProportion == 9
+            elif panose.bFamilyType in (3, 5):
+                panose_monospaced = panose.bProportion == 3
+        post_is_fixed_pitch = False
+        if "post" in font:
+            post_is_fixed_pitch = self._get_post_is_fixed_pitch()
+        return {
+            "is_monospace": advance_width_ratio >= threshold,
+            "advance_width": advance_width,
+            "advance_width_ratio": advance_width_ratio,
+            "post_is_fixed_pitch": post_is_fixed_pitch,
+            "panose_monospaced": panose_monospaced,
+        }
+
+    def _get_advance_widths(
+        self,
+    ) -> Any:
+        """
+        Gets the advance widths of all the glyphs (indexed by glyph id)
+        as a numpy uint16 array, when the hmtx table has not been loaded yet
+        the widths are read directly from the table binary data
+        (falling back to the decompiled table if the data is malformed).
+        """
+        font = self.get_ttfont()
+        glyphs_count = self.get_glyphs_count()
+        if not font.isLoaded("hmtx") and "hhea" in font:
+            try:
+                return self._read_advance_widths(glyphs_count)
+            except (ValueError, struct.error):
+                pass
+        hmtx = font["hmtx"]
+        return np.array(
+            [hmtx[name][0] for name in font.getGlyphOrder()], dtype=np.uint16
+        )
+
+    def _read_advance_widths(
+        self,
+        glyphs_count: int,
+    ) -> Any:
+        font = self.get_ttfont()
+        # hmtx starts with (uint16 advanceWidth, int16 lsb) pairs, glyphs
+        # after numberOfHMetrics have the same advance width of the last pair
+        metrics_count = min(font["hhea"].numberOfHMetrics, glyphs_count)
+        if metrics_count <= 0:
+            # no advance widths (malformed hmtx), all glyphs are ignored
+            return np.zeros(glyphs_count, dtype=np.uint16)
+        data = font.getTableData("hmtx")
+        widths = np.frombuffer(data, dtype=">u2", count=metrics_count * 2)[::2]
+        widths = widths.astype(np.uint16)
+        if len(widths) < glyphs_count:
+            widths = np.concatenate(
+                [widths, np.full(glyphs_count - len(widths), widths[-1], np.uint16)]
+            )
+        return widths
+
+    def _get_marks_glyphs_ids(
+        self,
+    ) -> Any:
+        """
+        Gets the ids of the mark glyphs (GDEF glyph class 3) as a numpy array,
+        when the GDEF table has not been loaded yet the glyph class definition
+        is read directly from the table binary data (without resolving glyph names),
+        if the data is malformed no glyph is considered a mark.
+        """
+        font = self.get_ttfont()
+        marks_ids: Any = np.empty(0, dtype=np.intp)
+        if "GDEF" not in font:
+            return marks_ids
+        if not font.isLoaded("GDEF"):
+            try:
+                return self._read_marks_glyphs_ids()
+            except (ValueError, struct.error):
+                return marks_ids
+        class_def = getattr(font["GDEF"].table, "GlyphClassDef", None)
+        if class_def:
+            marks_ids = np.array(
+                [
+                    font.getGlyphID(name)
+                    for name, glyph_class in class_def.classDefs.items()
+                    if glyph_class == 3
+                ],
+                dtype=np.intp,
+            )
+        return marks_ids
+
+    def _read_marks_glyphs_ids(
+        self,
+    ) -> Any:
+        font = self.get_ttfont()
+        marks_ids: Any = np.empty(0, dtype=np.intp)
+        # GDEF header: majorVersion, minorVersion, glyphClassDefOffset
+        data = font.getTableData("GDEF")
+        (offset,) = struct.unpack_from(">H", data, 4)
+        if not offset:
+            return marks_ids
+        (class_format,) = struct.unpack_from(">H", data, offset)
+        if class_format == 1:
+            # startGlyphID, glyphCount, classValues[glyphCount]
+            start_id, count = struct.unpack_from(">HH", data, offset + 2)
+            classes = np.frombuffer(data, dtype=">u2", count=count, offset=offset + 6)
+            marks_ids = np.flatnonzero(classes == 3) + start_id
+        elif class_format == 2:
+            # classRangeCount, classRangeRecords[classRangeCount] (start, end, class)
+            (count,) = struct.unpack_from(">H", data, offset + 2)
+            ranges = np.frombuffer(
+                data, dtype=">u2", count=count * 3, offset=offset + 4
+            )
+            ranges = ranges.reshape(-1, 3)
+            ranges = ranges[ranges[:, 2] == 3]
+            if len(ranges):
+                marks_ids = np.concatenate(
+                    [np.arange(start, end + 1) for start, end, _ in ranges]
+                )
+        return marks_ids.astype(np.intp)
+
+    def _get_post_is_fixed_pitch(
+        self,
+    ) -> bool:
+        """
+        Gets the post table isFixedPitch flag, when the post table has not been
+        loaded yet it's read from the header (avoiding to decode glyph names),
+        if the data is malformed the font is not considered fixed pitch.
+        """
+        font = self.get_ttfont()
+        if font.isLoaded("post"):
+            return bool(font["post"].isFixedPitch != 0)
+        data = font.getTableData("post")
+        try:
+            return bool(struct.unpack_from(">I", data, 12)[0] != 0)
+        except struct.error:
+            return False
+
     def get_name(
         self,
         key: str,
@@ -1091,6 +1867,9 @@ class Font:
         *,
         text: str,
         size: int,
+        shaping: bool = False,
+        features: dict[str, bool | int] | None = None,
+        coordinates: dict[str, float] | None = None,
     ) -> str:
         """
         Gets an SVG representation of the font rendering
@@ -1100,10 +1879,48 @@ class Font:
         :type text: str
         :param size: The size of the font to be used for rendering the text, in points.
         :type size: int
+        :param shaping: If True, the text is shaped (kerning, ligatures, etc.)
+            using HarfBuzz (requires uharfbuzz), shaping results are cached.
+        :type shaping: bool
+        :param features: The OpenType features to enable/disable when shaping,
+            eg. {"liga": False, "ss01": True}.
+        :type features: dict or None
+        :param coordinates: The variable axes coordinates used for rendering
+            a variable font without instancing it, eg. {"wght": 700},
+            missing axes use their default value.
+        :type coordinates: dict or None
 
         :returns: An SVG string that represents the rendered text.
         :rtype: str
-        """
+
+        :raises ArgumentError: If features are passed without shaping,
+            or if coordinates contain an unknown axis.
+        :raises OperationError: If shaping is enabled and uharfbuzz is not installed,
+            or if coordinates are passed for a static font.
+        """
+        return "".join(
+            self._generate_svg(
+                text=text,
+                size=size,
+                shaping=shaping,
+                features=features,
+                coordinates=coordinates,
+            )
+        )
+
+    def _generate_svg(
+        self,
+        *,
+        text: str,
+        size: int,
+        shaping: bool = False,
+        features: dict[str, bool | int] | None = None,
+        coordinates: dict[str, float] | None = None,
+    ) -> Generator[str]:
+        if features is not None and not shaping:
+            raise ArgumentError("Invalid features: text shaping must be enabled.")
+        if coordinates is not None:
+            coordinates = self._get_variable_coordinates(coordinates)
         font = self.get_ttfont()
 
         # get font metrics
@@ -1112,40 +1929,157 @@ class Font:
         hhea = font["hhea"]
         ascent = hhea.ascent * scale
         descent = hhea.descent * scale
-        width = 0
-        height = ascent - descent
-
-        # get glyph set and character map
-        glyphset = font.getGlyphSet()
-        cmap = font["cmap"].getBestCmap()
-
-        # generate svg path for each glyph in text
-        glyphs: list[str] = list(filter(None, [cmap.get(ord(char)) for char in text]))
-        paths = ""
-        for glyph_name in glyphs:
-            glyph = glyphset[glyph_name]
-            pen = SVGPathPen(glyphset)
-            glyph.draw(pen)
-            commands = pen.getCommands()
-            transform = f"translate({width:.2f} {ascent:.2f}) scale({scale} -{scale})"
-            paths += f"""<path d="{commands}" transform="{transform}" />"""
-            width += glyph.width * scale
+
+        # get glyph set (interpolated at coordinates)
+        glyphset = font.getGlyphSet(location=coordinates)
+
+        # compute glyphs positions first, the svg size is written before paths
+        glyphs, position = self._get_svg_glyphs_positions(
+            text,
+            glyphset=glyphset,
+            shaping=shaping,
+            features=features,
+            coordinates=coordinates,
+        )
 
         # round width and height
-        width = int(math.ceil(width))
-        height = int(math.ceil(height))
+        width = int(math.ceil(position * scale))
+        height = int(math.ceil(ascent - descent))
         viewbox = f"0 0 {width} {height}"
         xmlns = "http://www.w3.org/2000/svg"
+        xmlns_xlink = "http://www.w3.org/1999/xlink"
+        yield f"""<svg width="{width}" height="{height}" viewBox="{viewbox}" xmlns="{xmlns}" xmlns:xlink="{xmlns_xlink}">"""
+
+        # define each distinct glyph path once, blank glyphs are not drawn
+        glyphs_paths: dict[str, str] = {}
+        for glyph_name in dict.fromkeys(glyph[0] for glyph in glyphs):
+            commands = self._get_svg_glyph_path(
+                glyph_name, glyphset, coordinates=coordinates
+            )
+            if commands:
+                glyphs_paths[glyph_name] = commands
+
+        # prefix ids with a short hash of the paths, so that they don't collide
+        # when svgs of different fonts/texts are inlined in the same document
+        paths_hash = hashlib.sha256("|".join(glyphs_paths.values()).encode())
+        glyphs_ids_prefix = f"glyph-{paths_hash.hexdigest()[:8]}"
+        glyphs_ids: dict[str, str] = {}
+        yield "<defs>"
+        for glyph_name, commands in glyphs_paths.items():
+            glyph_id = f"{glyphs_ids_prefix}-{len(glyphs_ids)}"
+            glyphs_ids[glyph_name] = glyph_id
+            yield f"""<path id="{glyph_id}" d="{commands}" />"""
+        yield "</defs>"
+
+        # reference glyph paths, positioned in font units
+        transform = f"translate(0 {ascent:.2f}) scale({scale} -{scale})"
+        yield f"""<g transform="{transform}">"""
+        for glyph_name, x, y in glyphs:
+            glyph_ref = glyphs_ids.get(glyph_name)
+            if glyph_ref:
+                x_attr = f"{x:.2f}".rstrip("0").rstrip(".")
+                y_attr = f"{y:.2f}".rstrip("0").rstrip(".")
+                y_attr = f' y="{y_attr}"' if y else ""
+                yield f"""<use xlink:href="#{glyph_ref}" x="{x_attr}"{y_attr} />"""
+        yield "</g></svg>"
+
+    def _get_svg_glyphs_positions(
+        self,
+        text: str,
+        *,
+        glyphset: Any,
+        shaping: bool,
+        features: dict[str, bool | int] | None,
+        coordinates: dict[str, float] | None,
+    ) -> tuple[list[tuple[str, int | float, int | float]], int | float]:
+        """
+        Gets the glyphs of the given text with their (x, y) position in font units
+        and the total advance width.
+        """
+        glyphs: list[tuple[str, int | float, int | float]] = []
+        position: int | float = 0
+        if shaping:
+            for glyph_name, x_advance, _, x_offset, y_offset in self._get_shaped_text(
+                text, features=features, coordinates=coordinates
+            ):
+                glyphs.append((glyph_name, position + x_offset, y_offset))
+                position += x_advance
+            return (glyphs, position)
+        cmap = self.get_ttfont()["cmap"].getBestCmap()
+        glyphs_widths: dict[str, int | float] = {}
+        for char in text:
+            glyph_name = cmap.get(ord(char))
+            if not glyph_name:
+                continue
+            if glyph_name not in glyphs_widths:
+                glyphs_widths[glyph_name] = glyphset[glyph_name].width
+            glyphs.append((glyph_name, position, 0))
+            position += glyphs_widths[glyph_name]
+        return (glyphs, position)
 
-        # generate svg string
-        svg_str = f"""<svg width="{width}" height="{height}" viewBox="{viewbox}" xmlns="{xmlns}">{paths}</svg>"""
-        return svg_str
+    def _get_shaped_text(
+        self,
+        text: str,
+        *,
+        features: dict[str, bool | int] | None = None,
+        coordinates: dict[str, float] | None = None,
+    ) -> list[tuple[str, int, int, int, int]]:
+        """
+        Gets the shaped glyphs of the given text as a list of
+        (glyph_name, x_advance, y_advance, x_offset, y_offset) in font units,
+        results are cached until the font changes.
+        """
+        binary_data = self._get_binary_data()
+        key = (
+            text,
+            tuple(sorted((features or {}).items())),
+            tuple(sorted((coordinates or {}).items())),
+        )
+        shaped_glyphs = self._shaping_cache.pop(key, None)
+        if shaped_glyphs is None:
+            if self._shaping_font is None:
+                self._shaping_font = create_shaping_font(binary_data)
+            glyph_order = self.get_ttfont().getGlyphOrder()
+            shaped_glyphs = [
+                (glyph_order[glyph_id], *glyph_position)
+                for glyph_id, *glyph_position in shape_text(
+                    self._shaping_font,
+                    text,
+                    features=features,
+                    coordinates=coordinates,
+                )
+            ]
+            # keep only the most recently used texts
+            if len(self._shaping_cache) >= self._SHAPING_CACHE_SIZE:
+                del self._shaping_cache[next(iter(self._shaping_cache))]
+        self._shaping_cache[key] = shaped_glyphs
+        return shaped_glyphs
+
+    def _get_svg_glyph_path(
+        self,
+        glyph_name: str,
+        glyphset: Any,
+        *,
+        coordinates: dict[str, float] | None = None,
+    ) -> str:
+        key = (glyph_name, tuple((coordinates or {}).items()))
+        commands = self._svg_glyphs_paths.pop(key, None)
+        if commands is None:
+            pen = SVGPathPen(glyphset)
+            glyphset[glyph_name].draw(pen)
+            commands = pen.getCommands()
+            # keep only the most recently used glyphs (and coordinates)
+            if len(self._svg_glyphs_paths) >= self._SVG_GLYPHS_PATHS_CACHE_SIZE:
+                del self._svg_glyphs_paths[next(iter(self._svg_glyphs_paths))]
+        self._svg_glyphs_paths[key] = commands
+        return commands
 
     def get_ttfont(
         self,
     ) -> TTFont:
         """
         Gets the wrapped TTFont instance.
+        Changes made directly to the tables content must be marked using set_modified.
 
         :returns: The TTFont instance.
         :rtype: TTFont
@@ -1168,28 +2102,30 @@ class Font:
         item = items_cache[item_key]
         item["characters_count"] += 1
 
-    @staticmethod
-    def _get_unicode_items_set_with_coverage(
+    def _get_unicode_items_with_coverage(
+        self,
         all_items: list[dict[str, Any]],
-        items: list[dict[str, Any]],
         *,
         coverage_threshold: float = 0.0,
     ) -> list[dict[str, Any]]:
-        all_items = copy.deepcopy(all_items)
-        items_indexed = {item["name"]: item.copy() for item in items}
-        for item in all_items:
-            item_key = item["name"]
-            if item_key in items_indexed:
-                item["characters_count"] = items_indexed[item_key]["characters_count"]
-                item["coverage"] = item["characters_count"] / item["characters_total"]
-            else:
-                item["characters_count"] = 0
-                item["coverage"] = 0.0
-        items_filtered = [
-            item for item in all_items if item["coverage"] >= coverage_threshold
-        ]
-        # items_filtered.sort(key=lambda item: item['name'])
-        return items_filtered
+        # count the characters in each item ranges with a binary search
+        # over the sorted characters codes, instead of looking up each character
+        codes = self._get_characters_codes()
+        items = []
+        for all_item in all_items:
+            characters_count = 0
+            for first_code, last_code in all_item["ranges"]:
+                characters_count += bisect_right(codes, last_code) - bisect_left(
+                    codes, first_code
+                )
+            coverage = characters_count / all_item["characters_total"]
+            if coverage < coverage_threshold:
+                continue
+            item = {key: value for key, value in all_item.items() if key != "ranges"}
+            item["characters_count"] = characters_count
+            item["coverage"] = coverage
+            items.append(item)
+        return items
 
     def get_unicode_block_by_name(
         self,
@@ -1227,15 +2163,8 @@ class Font:
         :returns: The list of unicode blocks.
         :rtype: list of dicts
         """
-        items: list[dict[str, Any]] = []
-        items_cache: dict[str, Any] = {}
-        for char in self.get_characters():
-            item = {
-                "name": char["unicode_block_name"],
-            }
-            self._populate_unicode_items_set(items, items_cache, item)
-        blocks = self._get_unicode_items_set_with_coverage(
-            self._UNICODE_BLOCKS, items, coverage_threshold=coverage_threshold
+        blocks = self._get_unicode_items_with_coverage(
+            self._UNICODE_BLOCKS, coverage_threshold=coverage_threshold
         )
         return blocks
 
@@ -1275,16 +2204,8 @@ class Font:
         :returns: The list of unicode scripts.
         :rtype: list of dicts
         """
-        items: list[dict[str, Any]] = []
-        items_cache: dict[str, Any] = {}
-        for char in self.get_characters():
-            item = {
-                "name": char["unicode_script_name"],
-                "tag": char["unicode_script_tag"],
-            }
-            self._populate_unicode_items_set(items, items_cache, item)
-        scripts = self._get_unicode_items_set_with_coverage(
-            self._UNICODE_SCRIPTS, items, coverage_threshold=coverage_threshold
+        scripts = self._get_unicode_items_with_coverage(
+            self._UNICODE_SCRIPTS, coverage_threshold=coverage_threshold
         )
         return scripts
 
@@ -1360,6 +2281,38 @@ class Font:
         font = self.get_ttfont()
         return [axis.axisTag for axis in font["fvar"].axes]
 
+    def _get_variable_coordinates(
+        self,
+        coordinates: dict[str, float] | None,
+    ) -> dict[str, float]:
+        """
+        Gets the full coordinates of all the variable axes (in fvar order),
+        missing axes use their default value and values are clamped to axes range.
+        """
+        if not self.is_variable():
+            raise OperationError(
+                "Only a variable font can be rendered at the given coordinates."
+            )
+        coordinates = coordinates or {}
+        axes = self.get_variable_axes(sort=False) or []
+        axes_tags = [axis["tag"] for axis in axes]
+        for axis_tag in coordinates:
+            if axis_tag not in axes_tags:
+                raise ArgumentError(
+                    f"Invalid coordinates: unknown axis '{axis_tag}', "
+                    f"expected one of {axes_tags}."
+                )
+        return {
+            axis["tag"]: min(
+                max(
+                    coordinates.get(axis["tag"], axis["default_value"]),
+                    axis["min_value"],
+                ),
+                axis["max_value"],
+            )
+            for axis in axes
+        }
+
     def get_variable_instances(
         self,
     ) -> list[dict[str, Any]] | None:
@@ -1531,6 +2484,17 @@ class Font:
                 return True
         return False
 
+    def is_modified(
+        self,
+    ) -> bool:
+        """
+        Determines if the font has been modified since it has been opened.
+
+        :returns: True if modified, False otherwise.
+        :rtype: bool
+        """
+        return len(self.get_modified_tables_tags()) > 0
+
     def is_monospace(
         self,
         threshold: float = 0.85,
@@ -1544,12 +2508,8 @@ class Font:
         :returns: True if monospace font, False otherwise.
         :rtype: bool
         """
-        font = self.get_ttfont()
-        widths = [metrics[0] for metrics in font["hmtx"].metrics.values()]
-        widths_counter = Counter(widths)
-        same_width_count = widths_counter.most_common(1)[0][1]
-        same_width_amount = same_width_count / self.get_glyphs_count()
-        return same_width_amount >= threshold
+        monospace_info = self.get_monospace_info(threshold=threshold)
+        return bool(monospace_info["is_monospace"])
 
     def is_static(
         self,
@@ -1687,34 +2647,16 @@ class Font:
         :return: None
 
         :note: Uses OpenType Sanitizer (ots) to sanitize the font file.
-            Saves the font to a temporary directory and invokes the sanitizer on the saved file.
+            Saves the font to a temporary directory and invokes the sanitizer on the saved file,
+            results are cached by the font data hash, so an unchanged font is sanitized only once.
             If `strict` is True (default), treats sanitizer warnings as errors.
             If `strict` is False, only checks for sanitizer errors.
         """
-        with tempfile.TemporaryDirectory() as dest:
-            filename = self.get_filename()
-            filepath = fsutil.join_path(dest, filename)
-            filepath = self.save(filepath)
-            result = ots.sanitize(
-                filepath,
-                capture_output=True,
-                encoding="utf-8",
-            )
-            error_code = result.returncode
-            errors = result.stderr
-            if error_code:
-                raise SanitizationError(
-                    f"OpenType Sanitizer returned non-zero exit code ({error_code}): \n{errors}"
-                )
-
-            elif strict:
-                warnings = result.stdout
-                success_message = "File sanitized successfully!\n"
-                if warnings != success_message:
-                    warnings = warnings.rstrip(success_message)
-                    raise SanitizationError(
-                        f"OpenType Sanitizer warnings: \n{warnings}"
-                    )
+        data = self._get_binary_data()
+        output = sanitize_data(data, key=self._get_binary_hash())
+        error = get_sanitizer_error(output, strict=strict)
+        if error:
+            raise SanitizationError(error)
 
     def save(
         self,
@@ -1724,6 +2666,8 @@ class Font:
     ) -> str:
         """
         Saves the font at filepath.
+        Only the loaded tables are compiled (they could have been modified),
+        the others are copied as they are from the source font.
 
         :param filepath: The filepath, if None the source filepath will be used
         :type filepath: str or None
@@ -1739,6 +2683,24 @@ class Font:
         :raises ValueError: If the font was created from a file object, and filepath is
         not specififed.
         """
+        filepath = self._get_save_filepath(
+            filepath,
+            format_=self.get_format(),
+            overwrite=overwrite,
+        )
+        self._get_ttfont_detached_from_file(filepath)
+        tables = self._get_tables_data()
+        with open(filepath, "wb") as fileobject:
+            self._write_tables(fileobject, tables, flavor=self.get_ttfont().flavor)
+        return filepath
+
+    def _get_save_filepath(
+        self,
+        filepath: str | Path | None,
+        *,
+        format_: str,
+        overwrite: bool,
+    ) -> str:
         if not filepath and not self._filepath:
             raise ArgumentError(
                 "Font doesn't have a filepath. Please specify a filepath to save to."
@@ -1760,7 +2722,6 @@ class Font:
             dirpath, filename = fsutil.split_filepath(filepath)
             basename, extension = fsutil.split_filename(filename)
 
-        format_ = self.get_format()
         extension = format_
         filename = fsutil.join_filename(basename, extension)
         filepath = fsutil.join_filepath(dirpath, filename)
@@ -1771,10 +2732,62 @@ class Font:
                 "and 'overwrite' option is 'False' (consider using 'overwrite=True')."
             )
         fsutil.make_dirs_for_file(filepath)
+        return filepath
+
+    def _get_tables_data(
+        self,
+    ) -> dict[str, bytes]:
+        """
+        Gets the compiled data of the font tables: loaded tables are compiled
+        (they could have been modified, eg. directly on the TTFont instance),
+        the others are read as they are from the source font.
+        """
+        font = self.get_ttfont()
+        tables_reader = TablesReader.from_ttfont(font)
+        tables = {tag: tables_reader[tag] for tag in tables_reader.keys()}
+        head = tables.get("head")
+        if head and font.recalcTimestamp:
+            # update the modified timestamp without compiling the head table
+            timestamp = struct.pack(">Q", timestampNow())
+            tables["head"] = head[:28] + timestamp + head[36:]
+        return tables
+
+    def _write_tables(
+        self,
+        fileobject: IO[Any],
+        tables: dict[str, bytes],
+        *,
+        flavor: str | None,
+        **compression_options: Any,
+    ) -> None:
+        font = self.get_ttfont()
+        # flavor data (eg. woff metadata) can be kept only with the same flavor
+        flavor_data = font.flavorData if flavor == font.flavor else None
+        write_tables(
+            fileobject,
+            tables,
+            sfnt_version=font.sfntVersion,
+            flavor=flavor,
+            flavor_data=flavor_data,
+            **compression_options,
+        )
 
+    def _get_ttfont_detached_from_file(
+        self,
+        filepath: str,
+    ) -> TTFont:
         font = self.get_ttfont()
-        font.save(filepath)
-        return filepath
+        reader_file = getattr(font.reader, "file", None)
+        reader_filepath = getattr(reader_file, "name", None)
+        if (
+            font.lazy
+            and isinstance(reader_filepath, str)
+            and os.path.abspath(reader_filepath) == os.path.abspath(filepath)
+        ):
+            # a lazy font reads tables from its source file on demand,
+            # so all tables must be loaded before overwriting it
+            font.ensureDecompiled()
+        return font
 
     def _save_with_flavor(
         self,
@@ -1782,19 +2795,89 @@ class Font:
         flavor: str | None,
         filepath: str | Path | None = None,
         overwrite: bool = True,
+        **compression_options: Any,
     ) -> str:
-        font = self.get_ttfont()
-        presave_flavor = font.flavor
-        font.flavor = flavor
-        # save
-        saved_font_filepath = self.save(
-            filepath=filepath,
+        format_ = flavor or self.get_format(ignore_flavor=True)
+        filepaths = self.save_as(
+            filepath,
+            formats=[format_],
             overwrite=overwrite,
+            **compression_options,
         )
-        # revert changes
-        font.flavor = presave_flavor
-        # return file path
-        return saved_font_filepath
+        return filepaths[format_]
+
+    def save_as(
+        self,
+        dirpath: str | Path | None = None,
+        *,
+        formats: list[str] | None = None,
+        overwrite: bool = True,
+        woff_compression_level: int = WOFF_COMPRESSION_LEVEL_DEFAULT,
+        woff2_compression_level: int = WOFF2_COMPRESSION_LEVEL_DEFAULT,
+        woff2_window_size: int = WOFF2_WINDOW_SIZE_DEFAULT,
+    ) -> dict[str, str]:
+        """
+        Saves the font in multiple formats at once, tables are compiled only once
+        and the same data is written to each format (woff/woff2 compression included).
+        Using ttf or otf format the font is saved without web compression,
+        the resulting format will be ttf or otf depending on the source font.
+
+        :param dirpath: The dirpath (or filepath used for the files basename),
+            if None the source filepath will be used
+        :type dirpath: str or None
+        :param formats: The formats, eg. ['ttf', 'woff2', 'woff'],
+            if None the font is saved without web compression, as woff2 and as woff.
+        :type formats: list of str or None
+        :param overwrite: The overwrite, if True the source font file can be overwritten
+        :type overwrite: bool
+        :param woff_compression_level: The woff zlib compression level (0-9).
+        :type woff_compression_level: int
+        :param woff2_compression_level: The woff2 brotli compression level (0-11),
+            lower levels are much faster (eg. for previews) but produce bigger files.
+        :type woff2_compression_level: int
+        :param woff2_window_size: The woff2 brotli window size (10-24, base 2 logarithm).
+        :type woff2_window_size: int
+
+        :returns: The filepaths where the font has been saved to, by format.
+        :rtype: dict
+
+        :raises ArgumentError: If a format or a compression option is invalid.
+        """
+        compression_options = {
+            "woff_compression_level": woff_compression_level,
+            "woff2_compression_level": woff2_compression_level,
+            "woff2_window_size": woff2_window_size,
+        }
+        validate_compression_options(**compression_options)
+        sfnt_format = self.get_format(ignore_flavor=True)
+        formats_list = []
+        for format_ in formats or [sfnt_format, self.FORMAT_WOFF2, self.FORMAT_WOFF]:
+            if format_ not in self._FORMATS_LIST:
+                raise ArgumentError(
+                    f"Invalid format: '{format_}', expected one of {self._FORMATS_LIST}."
+                )
+            if format_ in [self.FORMAT_OTF, self.FORMAT_TTF]:
+                format_ = sfnt_format
+            if format_ not in formats_list:
+                formats_list.append(format_)
+        filepaths = {
+            format_: self._get_save_filepath(
+                dirpath,
+                format_=format_,
+                overwrite=overwrite,
+            )
+            for format_ in formats_list
+        }
+        for filepath in filepaths.values():
+            self._get_ttfont_detached_from_file(filepath)
+        tables = self._get_tables_data()
+        for format_, filepath in filepaths.items():
+            flavor = format_ if format_ != sfnt_format else None
+            with open(filepath, "wb") as fileobject:
+                self._write_tables(
+                    fileobject, tables, flavor=flavor, **compression_options
+                )
+        return filepaths
 
     def save_as_ttf(
         self,
@@ -1825,6 +2908,7 @@ class Font:
         filepath: str | Path | None = None,
         *,
         overwrite: bool = True,
+        compression_level: int = WOFF_COMPRESSION_LEVEL_DEFAULT,
     ) -> str:
         """
         Saves font as woff.
@@ -1833,14 +2917,19 @@ class Font:
         :type filepath: str
         :param overwrite: The overwrite, if True the source font file can be overwritten
         :type overwrite: bool
+        :param compression_level: The zlib compression level (0-9).
+        :type compression_level: int
 
         :returns: The filepath where the font has been saved to.
         :rtype: str
+
+        :raises ArgumentError: If the compression level is invalid.
         """
         return self._save_with_flavor(
             flavor=self.FORMAT_WOFF,
             filepath=filepath,
             overwrite=overwrite,
+            woff_compression_level=compression_level,
         )
 
     def save_as_woff2(
@@ -1848,6 +2937,8 @@ class Font:
         filepath: str | Path | None = None,
         *,
         overwrite: bool = True,
+        compression_level: int = WOFF2_COMPRESSION_LEVEL_DEFAULT,
+        window_size: int = WOFF2_WINDOW_SIZE_DEFAULT,
     ) -> str:
         """
         Saves font as woff2.
@@ -1856,16 +2947,61 @@ class Font:
         :type filepath: str
         :param overwrite: The overwrite, if True the source font file can be overwritten
         :type overwrite: bool
+        :param compression_level: The brotli compression level (0-11),
+            lower levels are much faster (eg. for previews) but produce bigger files.
+        :type compression_level: int
+        :param window_size: The brotli window size (10-24, base 2 logarithm).
+        :type window_size: int
 
         :returns: The filepath where the font has been saved to.
         :rtype: str
+
+        :raises ArgumentError: If the compression level or the window size is invalid.
         """
         return self._save_with_flavor(
             flavor=self.FORMAT_WOFF2,
             filepath=filepath,
             overwrite=overwrite,
+            woff2_compression_level=compression_level,
+            woff2_window_size=window_size,
         )
 
+    def save_svg_to_fileobject(
+        self,
+        fileobject: IO[str] | None = None,
+        *,
+        text: str,
+        size: int,
+        **options: Any,
+    ) -> IO[str]:
+        """
+        Writes an SVG representation of the font rendering some text
+        to a text file-like object incrementally (see get_svg),
+        without building the whole SVG string in memory.
+        If no file-object is passed, an instance of `StringIO` is created for the user.
+        The file pointer is reset only if the file-like object is seekable
+        (non-seekable streams, eg. sockets, are written only forward).
+
+        :param fileobject: A text file-like object to write to.
+        :type fileobject: typing.IO or None
+        :param text: The text to be rendered as SVG paths.
+        :type text: str
+        :param size: The size of the font to be used for rendering the text, in points.
+        :type size: int
+        :param options: The other get_svg options (shaping, features, coordinates).
+        :type options: dictionary
+
+        :returns: The file object that was originally passed, or a new StringIO instance.
+        :rtype: typing.IO
+        """
+        if fileobject is None:
+            fileobject = StringIO()
+        for chunk in self._generate_svg(text=text, size=size, **options):
+            fileobject.write(chunk)
+        if fileobject.seekable():
+            fileobject.seek(0)
+        return fileobject
+
     def save_to_fileobject(
         self,
         fileobject: IO[Any] | None = None,
@@ -1879,10 +3015,10 @@ class Font:
         instance.
         :rtype: typing.io.IO
         """
-        font = self.get_ttfont()
         if fileobject is None:
             fileobject = BytesIO()
-        font.save(fileobject)
+        tables = self._get_tables_data()
+        self._write_tables(fileobject, tables, flavor=self.get_ttfont().flavor)
         fileobject.seek(0)
         return fileobject
 
@@ -1893,6 +3029,8 @@ class Font:
         woff2: bool = True,
         woff: bool = True,
         overwrite: bool = True,
+        workers: int | None = None,
+        executor: Executor | None = None,
         **options: Any,
     ) -> list[dict[str, Any]]:
         """
@@ -1906,6 +3044,12 @@ class Font:
         :type woff: bool
         :param overwrite: Whether to overwrite existing files in the directory. Default is True.
         :type overwrite: bool
+        :param workers: The number of worker processes used to make the instances in parallel,
+            the font data is sent only once to each worker. Default is None (no parallelism).
+        :type workers: int or None
+        :param executor: The executor used to make the instances in parallel,
+            the font data is sent along with each task. Default is None.
+        :type executor: concurrent.futures.Executor or None
         :param options: Additional options to be passed to the instancer when generating static instances.
         :type options: dictionary
 
@@ -1914,51 +3058,108 @@ class Font:
             with file formats as keys and file-paths as values).
 
         :raises TypeError: If the font is not a variable font.
+        :raises ArgumentError: If both workers and executor are specified
+            or if workers is not a positive number.
         """
         if not self.is_variable():
             raise OperationError("Only a variable font can be instantiated.")
 
+        if workers is not None and executor is not None:
+            raise ArgumentError(
+                "Invalid arguments: workers and executor are mutually exclusive."
+            )
+        if workers is not None and workers < 1:
+            raise ArgumentError(
+                f"Invalid workers value: expected positive int, found '{workers}'."
+            )
+
         fsutil.assert_not_file(dirpath)
         fsutil.make_dirs(dirpath)
 
-        instances_format = self.get_format(ignore_flavor=True)
-        instances_saved = []
         instances = self.get_variable_instances() or []
-        for instance in instances:
-            # make instance
-            instance_font = self.clone()
-            instance_font.to_static(
-                coordinates=instance["coordinates"],
-                **options,
-            )
-            instance_font.rename(
-                style_name=instance["style_name"],
+        instance_kwargs: dict[str, Any] = {
+            "dirpath": dirpath,
+            "instances_format": self.get_format(ignore_flavor=True),
+            "woff2": woff2,
+            "woff": woff,
+            "overwrite": overwrite,
+            "options": options,
+        }
+        if workers is None and executor is None:
+            return [
+                self._save_variable_instance(instance, **instance_kwargs)
+                for instance in instances
+            ]
+
+        font_data = self.save_to_fileobject().read()
+        if executor is None:
+            with create_process_pool(max_workers=workers, data=font_data) as pool:
+                futures = [
+                    pool.submit(
+                        _save_variable_instance_task,
+                        None,
+                        self._kwargs,
+                        instance,
+                        **instance_kwargs,
+                    )
+                    for instance in instances
+                ]
+                return [future.result() for future in futures]
+        futures = [
+            executor.submit(
+                _save_variable_instance_task,
+                font_data,
+                self._kwargs,
+                instance,
+                **instance_kwargs,
             )
-            instance_files: dict[str, Any] = {
-                Font.FORMAT_OTF: None,
-                Font.FORMAT_TTF: None,
-                Font.FORMAT_WOFF2: None,
-                Font.FORMAT_WOFF: None,
-            }
-            instance_files[instances_format] = instance_font.save_as_ttf(
+            for instance in instances
+        ]
+        return [future.result() for future in futures]
+
+    def _save_variable_instance(
+        self,
+        instance: dict[str, Any],
+        *,
+        dirpath: str | Path,
+        instances_format: str,
+        woff2: bool,
+        woff: bool,
+        overwrite: bool,
+        options: dict[str, Any],
+    ) -> dict[str, Any]:
+        # make instance
+        instance_font = self.clone()
+        instance_font.to_static(
+            coordinates=instance["coordinates"],
+            **options,
+        )
+        instance_font.rename(
+            style_name=instance["style_name"],
+        )
+        instance_files: dict[str, Any] = {
+            Font.FORMAT_OTF: None,
+            Font.FORMAT_TTF: None,
+            Font.FORMAT_WOFF2: None,
+            Font.FORMAT_WOFF: None,
+        }
+        formats = [instances_format]
+        if woff2:
+            formats.append(Font.FORMAT_WOFF2)
+        if woff:
+            formats.append(Font.FORMAT_WOFF)
+        # tables are compiled once for all the formats
+        instance_files.update(
+            instance_font.save_as(
                 dirpath,
+                formats=formats,
                 overwrite=overwrite,
             )
-            if woff2 and not instance_files[Font.FORMAT_WOFF2]:
-                instance_files[Font.FORMAT_WOFF2] = instance_font.save_as_woff2(
-                    dirpath,
-                    overwrite=overwrite,
-                )
-            if woff and not instance_files[Font.FORMAT_WOFF]:
-                instance_files[Font.FORMAT_WOFF] = instance_font.save_as_woff(
-                    dirpath,
-                    overwrite=overwrite,
-                )
-            instance_saved = {}
-            instance_saved["files"] = instance_files.copy()
-            instance_saved["instance"] = instance.copy()
-            instances_saved.append(instance_saved)
-        return instances_saved
+        )
+        instance_saved = {}
+        instance_saved["files"] = instance_files.copy()
+        instance_saved["instance"] = instance.copy()
+        return instance_saved
 
     def set_family_classification(
         self,
@@ -1995,6 +3196,7 @@ class Font:
             subclass_id = subclass_item["id"]
 
         family_class = (class_id << 8) | (subclass_id & 0xFF)
+        self._set_modified("OS/2")
         os2.sFamilyClass = family_class
 
     def set_family_name(
@@ -2012,6 +3214,21 @@ class Font:
             style_name=self.get_style_name(),
         )
 
+    def set_modified(
+        self,
+        tags: list[str] | None = None,
+    ) -> None:
+        """
+        Marks the given tables as modified, it must be called after changing
+        the content of the tables directly on the TTFont instance (get_ttfont),
+        otherwise the changes are not tracked as modified tables and could be ignored
+        by the cached glyphs data (characters, glyph graph and svg paths).
+
+        :param tags: The tables tags, if None all the font tables are marked as modified.
+        :type tags: list of str or None
+        """
+        self._set_modified(*(tags or []))
+
     def set_name(
         self,
         key: int | str,
@@ -2028,6 +3245,7 @@ class Font:
         font = self.get_ttfont()
         name_id = self._get_name_id(key)
         name_table = font["name"]
+        self._set_modified("name")
         # https://github.com/fonttools/fonttools/blob/main/Lib/fontTools/ttLib/tables/_n_a_m_e.py#L568
         name_table.setName(value, name_id, **self._NAMES_MAC_IDS)
         name_table.setName(value, name_id, **self._NAMES_WIN_IDS)
@@ -2065,10 +3283,12 @@ class Font:
         if bit_os2_fs is not None:
             os2 = font.get("OS/2")
             if os2:
+                self._set_modified("OS/2")
                 os2.fsSelection = set_flag(os2.fsSelection, bit_os2_fs, value)
         if bit_head_mac is not None:
             head = font.get("head")
             if head:
+                self._set_modified("head")
                 head.macStyle = set_flag(head.macStyle, bit_head_mac, value)
 
     def set_style_flags(
@@ -2168,8 +3388,215 @@ class Font:
             if metric["key"] in metrics:
                 table = font.get(metric["table"])
                 if table:
+                    self._set_modified(metric["table"])
                     setattr(table, metric["attr"], metrics[metric["key"]])
 
+    def split_by_unicode_ranges(
+        self,
+        dirpath: str | Path,
+        ranges: dict[str, list[str | int] | str] | None = None,
+        *,
+        formats: list[str] | None = None,
+        overwrite: bool = True,
+        workers: int | None = None,
+        woff_compression_level: int = WOFF_COMPRESSION_LEVEL_DEFAULT,
+        woff2_compression_level: int = WOFF2_COMPRESSION_LEVEL_DEFAULT,
+        woff2_window_size: int = WOFF2_WINDOW_SIZE_DEFAULT,
+        **options: Any,
+    ) -> dict[str, Any]:
+        """
+        Splits the font in slices by unicode ranges and saves them to the specified
+        directory, the returned CSS @font-face rules use unicode-range descriptors,
+        so browsers download only the slices needed by the page text.
+        All slices are made from the same source tables data (without cloning
+        and serializing the whole font for each slice), optionally in parallel.
+
+        :param dirpath: The directory path where the slices will be saved.
+        :type dirpath: str or pathlib.Path
+        :param ranges: The unicodes of each slice by name, eg. {'latin': 'U+0000-00FF'},
+            if None the Google Fonts subsets are used (latin, latin-ext, cyrillic, greek...)
+            and the remaining characters are split in numbered slices.
+            Slices without any character of the font are skipped.
+        :type ranges: dict or None
+        :param formats: The formats, eg. ['woff2', 'woff']. Default is ['woff2'].
+        :type formats: list of str or None
+        :param overwrite: Whether to overwrite existing files in the directory. Default is True.
+        :type overwrite: bool
+        :param workers: The number of worker processes used to make the slices in parallel,
+            the font data is sent only once to each worker. Default is None (no parallelism).
+        :type workers: int or None
+        :param woff_compression_level: The woff zlib compression level (0-9).
+        :type woff_compression_level: int
+        :param woff2_compression_level: The woff2 brotli compression level (0-11).
+        :type woff2_compression_level: int
+        :param woff2_window_size: The woff2 brotli window size (10-24, base 2 logarithm).
+        :type woff2_window_size: int
+        :param options: The subsetter options (see subset).
+        :type options: dictionary
+
+        :returns: A dictionary with 'slices' (a list of dictionaries, each one includes
+            'name', 'unicode_range' and 'files' by format) and 'css' (the @font-face rules,
+            with urls relative to dirpath).
+        :rtype: dict
+
+        :raises ArgumentError: If a format or a compression option is invalid,
+            or if workers is not a positive number.
+        """
+        compression_options = {
+            "woff_compression_level": woff_compression_level,
+            "woff2_compression_level": woff2_compression_level,
+            "woff2_window_size": woff2_window_size,
+        }
+        validate_compression_options(**compression_options)
+        formats_list = formats or [self.FORMAT_WOFF2]
+        for format_ in formats_list:
+            if format_ not in self._FORMATS_LIST:
+                raise ArgumentError(
+                    f"Invalid format: '{format_}', expected one of {self._FORMATS_LIST}."
+                )
+        if workers is not None and workers < 1:
+            raise ArgumentError(
+                f"Invalid workers value: expected positive int, found '{workers}'."
+            )
+
+        fsutil.assert_not_file(dirpath)
+        fsutil.make_dirs(dirpath)
+
+        basename = fsutil.get_file_basename(self.get_filename())
+        extension = self.get_format(ignore_flavor=True)
+        slices = self._get_unicode_ranges_slices(ranges)
+        slice_kwargs: list[dict[str, Any]] = [
+            {
+                "filepath": fsutil.join_filepath(
+                    dirpath, f"{basename}-{slugify(slice_['name'])}.{extension}"
+                ),
+                "formats": formats_list,
+                "overwrite": overwrite,
+                "compression_options": compression_options,
+                "options": options,
+            }
+            for slice_ in slices
+        ]
+        slices_saved: list[dict[str, Any]]
+        if workers is None:
+            # slices share the source tables data, only subset tables are compiled,
+            # each slice font opens its own reader, so tables deleted by the subsetter
+            # of a slice (eg. GDEF) are still available for the next slices
+            tables_reader = TablesReader.from_ttfont(self.get_ttfont())
+            slices_saved = []
+            for slice_, kwargs in zip(slices, slice_kwargs, strict=True):
+                with Font(tables_reader, **self._kwargs) as slice_font:
+                    slices_saved.append(
+                        slice_font._save_unicode_range_slice(slice_, **kwargs)
+                    )
+        else:
+            font_data = self.save_to_fileobject().read()
+            with create_process_pool(max_workers=workers, data=font_data) as pool:
+                futures = [
+                    pool.submit(
+                        _save_unicode_range_slice_task,
+                        self._kwargs,
+                        slice_,
+                        **kwargs,
+                    )
+                    for slice_, kwargs in zip(slices, slice_kwargs, strict=True)
+                ]
+                slices_saved = [future.result() for future in futures]
+        return {
+            "slices": slices_saved,
+            "css": self._get_unicode_ranges_css(slices_saved),
+        }
+
+    def _get_unicode_ranges_slices(
+        self,
+        ranges: dict[str, list[str | int] | str] | None,
+    ) -> list[dict[str, Any]]:
+        codes = set(self.get_ttfont().getBestCmap() or {})
+        ranges_dict = ranges
+        if ranges_dict is None:
+            ranges_dict = {
+                subset["name"]: subset["unicode_range"]
+                for subset in self._UNICODE_SUBSETS
+            }
+        slices = []
+        remaining_codes = set(codes)
+        for name, unicodes in ranges_dict.items():
+            slice_codes = sorted(codes.intersection(parse_unicodes(unicodes)))
+            if slice_codes:
+                slices.append({"name": name, "unicodes": slice_codes})
+                remaining_codes.difference_update(slice_codes)
+        if ranges is None:
+            remaining_codes_list = sorted(remaining_codes)
+            slice_size = self._UNICODE_SUBSETS_SLICE_SIZE
+            for index in range(0, len(remaining_codes_list), slice_size):
+                slices.append(
+                    {
+                        "name": str(index // slice_size),
+                        "unicodes": remaining_codes_list[index : index + slice_size],
+                    }
+                )
+        return slices
+
+    def _get_unicode_ranges_css(
+        self,
+        slices: list[dict[str, Any]],
+    ) -> str:
+        family_name = (self.get_family_name() or "").replace("'", "\\'")
+        style = "italic" if self.get_style_flag(self.STYLE_FLAG_ITALIC) else "normal"
+        weight_axis = self.get_variable_axis_by_tag("wght")
+        if weight_axis:
+            weight = f"{weight_axis['min_value']:g} {weight_axis['max_value']:g}"
+        else:
+            weight = str((self.get_weight() or {}).get("value", 400))
+        css_formats = self._UNICODE_SUBSETS_CSS_FORMATS
+        rules = []
+        for slice_ in slices:
+            # the most compressed formats first
+            files = sorted(
+                slice_["files"].items(),
+                key=lambda item: list(css_formats).index(item[0]),
+            )
+            src = ", ".join(
+                f"{get_css_url(fsutil.get_filename(filepath))} "
+                f"format('{css_formats[format_]}')"
+                for format_, filepath in files
+            )
+            rules.append(
+                f"/* {slice_['name']} */\n"
+                "@font-face {\n"
+                f"  font-family: '{family_name}';\n"
+                f"  font-style: {style};\n"
+                f"  font-weight: {weight};\n"
+                "  font-display: swap;\n"
+                f"  src: {src};\n"
+                f"  unicode-range: {slice_['unicode_range']};\n"
+                "}\n"
+            )
+        return "".join(rules)
+
+    def _save_unicode_range_slice(
+        self,
+        slice_: dict[str, Any],
+        *,
+        filepath: str,
+        formats: list[str],
+        overwrite: bool,
+        compression_options: dict[str, Any],
+        options: dict[str, Any],
+    ) -> dict[str, Any]:
+        self.subset(unicodes=slice_["unicodes"], **options)
+        files = self.save_as(
+            filepath,
+            formats=formats,
+            overwrite=overwrite,
+            **compression_options,
+        )
+        return {
+            "name": slice_["name"],
+            "unicode_range": format_unicode_range(slice_["unicodes"]),
+            "files": files,
+        }
+
     def subset(
         self,
         *,
@@ -2215,6 +3642,7 @@ class Font:
         subs_options = SubsetterOptions(**options)
         subs = Subsetter(options=subs_options)
         subs.populate(**subs_args)
+        self._set_modified()
         subs.subset(font)
 
     @staticmethod
@@ -2294,6 +3722,7 @@ class Font:
         options.setdefault("updateFontNames", False)
 
         # instantiate the sliced variable font
+        self._set_modified()
         instancer.instantiateVariableFont(font, coordinates, inplace=True, **options)
 
     def to_static(
@@ -2367,6 +3796,7 @@ class Font:
         options.setdefault("updateFontNames", False)
 
         # instantiate the static font
+        self._set_modified()
         instancer.instantiateVariableFont(font, coordinates, **options)
 
         # remove STAT table
@@ -2396,10 +3826,50 @@ class Font:
         """
         font = self.get_ttfont()
         if "STAT" in font:
+            self._set_modified("STAT")
             del font["STAT"]
             return True
         return False
 
+    def _set_modified(
+        self,
+        *tags: str,
+    ) -> None:
+        """
+        Marks the given tables (all the font tables if none) as modified
+        and invalidates the data cached from the font binary,
+        it must be called by each method that modifies the font.
+        """
+        self._modified_tables_tags.update(tags or self._get_tables_tags())
+        self._clear_binary_cache()
+
+    def _get_loaded_tables_data(
+        self,
+    ) -> dict[str, bytes]:
+        font = self.get_ttfont()
+        return {tag: font.getTableData(tag) for tag in self.get_loaded_tables_tags()}
+
+    def _get_tables_tags(
+        self,
+    ) -> set[str]:
+        font = self.get_ttfont()
+        return {tag for tag in font.keys() if tag != "GlyphOrder"}
+
+    def _clear_binary_cache(
+        self,
+    ) -> None:
+        self._binary_data = None
+        self._binary_tables_data = None
+        self._binary_hash = None
+        self._characters_cache = {}
+        self._characters_cache_cmap = None
+        self._image_fonts = {}
+        self._image_fonts_source = None
+        self._svg_glyphs_paths = {}
+        self._shaping_font = None
+        self._glyph_graph = None
+        self._shaping_cache = {}
+
     def __str__(
         self,
     ) -> str:
@@ -2410,3 +3880,26 @@ class Font:
         :rtype: str
         """
         return f"{type(self).__name__}('{self._filepath}')"
+
+
+def _save_variable_instance_task(
+    font_data: bytes | None,
+    font_kwargs: dict[str, Any],
+    instance: dict[str, Any],
+    **kwargs: Any,
+) -> dict[str, Any]:
+    # runs in a worker, font data is sent with the task or once per worker process
+    if font_data is None:
+        font_data = get_worker_data()
+    with Font.from_bytes(font_data, **font_kwargs) as font:
+        return font._save_variable_instance(instance, **kwargs)
+
+
+def _save_unicode_range_slice_task(
+    font_kwargs: dict[str, Any],
+    slice_: dict[str, Any],
+    **kwargs: Any,
+) -> dict[str, Any]:
+    # runs in a worker process, font data is sent once per worker process
+    with Font.from_bytes(get_worker_data(), **font_kwargs) as font:
+        return font._save_unicode_range_slice(slice_, **kwargs)
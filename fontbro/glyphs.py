@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from fontTools.pens.basePen import NullPen
+from fontTools.ttLib import TTFont
+
+from fontbro.exceptions import ArgumentError
+
+
+class _ComponentsPen(NullPen):  # type: ignore[misc]
+    """
+    Pen that only collects the names of the components drawn,
+    (CFF glyphs use components only through the deprecated seac operator).
+    """
+
+    def __init__(self) -> None:
+        self.components_names: list[str] = []
+
+    def addComponent(
+        self,
+        glyphName: str,
+        transformation: Any,
+    ) -> None:
+        self.components_names.append(glyphName)
+
+
+class GlyphGraph:
+    """
+    Graph of the glyphs composition, with both forward (glyph -> components)
+    and reverse (component -> dependent glyphs) edges.
+    Transitive queries results are memoized.
+    """
+
+    def __init__(
+        self,
+        components: dict[str, list[str]],
+    ) -> None:
+        """
+        Constructs a new glyph graph.
+
+        :param components: The components names of each glyph (in glyph order),
+            a component used more than once by a glyph is repeated.
+        :type components: dict
+        """
+        self._components = components
+        self._dependents: dict[str, list[str]] = {name: [] for name in components}
+        for name, components_names in components.items():
+            for component_name in dict.fromkeys(components_names):
+                self._dependents.setdefault(component_name, []).append(name)
+        self._all_components: dict[str, list[str]] = {}
+        self._all_dependents: dict[str, list[str]] = {}
+
+    @classmethod
+    def from_ttfont(
+        cls,
+        font: TTFont,
+    ) -> GlyphGraph:
+        """
+        Creates the glyph graph of the given font,
+        it supports both TrueType (glyf) and PostScript (CFF/CFF2) outlines.
+        """
+        glyphs_names = font.getGlyphOrder()
+        if "glyf" in font:
+            glyf = font["glyf"]
+            glyphs = glyf.glyphs
+            # read components from the glyphs data without expanding them
+            return cls(
+                {
+                    name: glyphs[name].getComponentNames(glyf) if name in glyphs else []
+                    for name in glyphs_names
+                }
+            )
+        if "CFF " in font:
+            glyphset = font.getGlyphSet()
+            components: dict[str, list[str]] = {}
+            for name in glyphs_names:
+                pen = _ComponentsPen()
+                if name in glyphset:
+                    glyphset[name].draw(pen)
+                components[name] = pen.components_names
+            return cls(components)
+        # CFF2 has no components (seac has been removed) and
+        # fonts without outlines (eg. bitmap only) have nothing to compose
+        return cls({name: [] for name in glyphs_names})
+
+    def __contains__(
+        self,
+        name: str,
+    ) -> bool:
+        return name in self._components
+
+    def __len__(
+        self,
+    ) -> int:
+        return len(self._components)
+
+    def get_components(
+        self,
+        name: str,
+    ) -> list[str]:
+        """
+        Gets the names of the components directly used by the given glyph.
+
+        :param name: The glyph name
+        :type name: str
+
+        :returns: The components names, a component used more than once is repeated.
+        :rtype: list of str
+
+        :raises ArgumentError: If the glyph doesn't exist.
+        """
+        self._validate_name(name)
+        return list(self._components.get(name, []))
+
+    def get_dependents(
+        self,
+        name: str,
+    ) -> list[str]:
+        """
+        Gets the names of the glyphs directly using the given glyph as component.
+
+        :param name: The glyph name
+        :type name: str
+
+        :returns: The dependent glyphs names (in glyph order).
+        :rtype: list of str
+
+        :raises ArgumentError: If the glyph doesn't exist.
+        """
+        self._validate_name(name)
+        return list(self._dependents.get(name, []))
+
+    def get_all_components(
+        self,
+        name: str,
+    ) -> list[str]:
+        """
+        Gets the names of all the components used by the given glyph,
+        including components of components (transitive closure).
+
+        :param name: The glyph name
+        :type name: str
+
+        :returns: The components names (without duplicates).
+        :rtype: list of str
+
+        :raises ArgumentError: If the glyph doesn't exist.
+        """
+        self._validate_name(name)
+        if name not in self._all_components:
+            self._all_components[name] = self._get_reachable(name, self._components.get)
+        return list(self._all_components[name])
+
+    def get_all_dependents(
+        self,
+        name: str,
+    ) -> list[str]:
+        """
+        Gets the names of all the glyphs depending on the given glyph,
+        including glyphs using it through other components (transitive closure),
+        eg. all the glyphs that change if 'acute' is modified.
+
+        :param name: The glyph name
+        :type name: str
+
+        :returns: The dependent glyphs names (without duplicates).
+        :rtype: list of str
+
+        :raises ArgumentError: If the glyph doesn't exist.
+        """
+        self._validate_name(name)
+        if name not in self._all_dependents:
+            self._all_dependents[name] = self._get_reachable(name, self._dependents.get)
+        return list(self._all_dependents[name])
+
+    @staticmethod
+    def _get_reachable(
+        name: str,
+        get_edges: Callable[[str], list[str] | None],
+    ) -> list[str]:
+        # iterative depth-first search, safe with (malformed) cyclic compositions
+        reachable: dict[str, None] = {}
+        stack: list[str] = list(reversed(get_edges(name) or []))
+        while stack:
+            item = stack.pop()
+            if item in reachable or item == name:
+                continue
+            reachable[item] = None
+            stack.extend(reversed(get_edges(item) or []))
+        return list(reachable)
+
+    def _validate_name(
+        self,
+        name: str,
+    ) -> None:
+        if name not in self._components and name not in self._dependents:
+            raise ArgumentError(f"Invalid glyph name: '{name}' not found.")
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import io
+import mmap
+from typing import Any
+
+from fontTools.ttLib import TTFont, getTableClass
+
+Buffer = bytes | bytearray | memoryview | mmap.mmap
+
+
+class BufferReader(io.RawIOBase):
+    """
+    Read-only seekable file object over a bytes-like buffer,
+    each read copies only the requested slice of the buffer.
+    """
+
+    def __init__(
+        self,
+        buffer: Buffer,
+        *,
+        name: str = "",
+    ) -> None:
+        super().__init__()
+        self.name = name
+        self._view = memoryview(buffer).cast("B")
+        self._position = 0
+
+    def close(
+        self,
+    ) -> None:
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+    def readable(
+        self,
+    ) -> bool:
+        return True
+
+    def seekable(
+        self,
+    ) -> bool:
+        return True
+
+    def read(
+        self,
+        size: int | None = -1,
+    ) -> bytes:
+        start = self._position
+        end = len(self._view) if size is None or size < 0 else start + size
+        data = self._view[start:end].tobytes()
+        self._position = start + len(data)
+        return data
+
+    def readinto(
+        self,
+        buffer: Any,
+    ) -> int:
+        data = self.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        return size
+
+    def seek(
+        self,
+        offset: int,
+        whence: int = io.SEEK_SET,
+    ) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence value: {whence}.")
+        if position < 0:
+            raise ValueError(f"Invalid negative seek position: {position}.")
+        self._position = position
+        return self._position
+
+    def tell(
+        self,
+    ) -> int:
+        return self._position
+
+
+class TablesReader:
+    """
+    Font reader over compiled tables data, it implements the part
+    of the fontTools SFNTReader interface used by TTFont.
+    Tables data is never modified in place, each TTFont opened by the reader
+    gets its own reader instance sharing the same tables data (copy-on-open).
+    """
+
+    def __init__(
+        self,
+        tables: dict[str, bytes],
+        *,
+        sfnt_version: str,
+        flavor: str | None = None,
+        flavor_data: Any = None,
+    ) -> None:
+        # empty file placeholder, TTFont reads its name when saving lazy fonts
+        self.file = BufferReader(b"")
+        self.sfntVersion = sfnt_version
+        self.flavor = flavor
+        self.flavorData = flavor_data
+        self._tables = tables
+
+    @classmethod
+    def from_ttfont(
+        cls,
+        ttfont: TTFont,
+    ) -> TablesReader:
+        """
+        Creates a new reader with the tables data of the given font:
+        loaded tables are compiled (they could have been modified),
+        the others are read as they are from the font reader.
+        """
+        tables: dict[str, bytes] = {}
+        for tag in ttfont.keys():
+            if tag != "GlyphOrder":
+                _read_table_data(ttfont, tag, tables)
+        return cls(
+            tables,
+            sfnt_version=ttfont.sfntVersion,
+            flavor=ttfont.flavor,
+            flavor_data=ttfont.flavorData,
+        )
+
+    def __contains__(
+        self,
+        tag: str,
+    ) -> bool:
+        return tag in self._tables
+
+    def __delitem__(
+        self,
+        tag: str,
+    ) -> None:
+        # copy instead of deleting in place, the tables dict is shared
+        # with the other reader instances, only this instance view changes
+        self._tables = {key: value for key, value in self._tables.items() if key != tag}
+
+    def __getitem__(
+        self,
+        tag: str,
+    ) -> bytes:
+        return self._tables[tag]
+
+    def close(
+        self,
+    ) -> None:
+        self._tables = {}
+
+    def keys(
+        self,
+    ) -> list[str]:
+        return list(self._tables.keys())
+
+    def open_ttfont(
+        self,
+        **kwargs: Any,
+    ) -> TTFont:
+        """
+        Creates a new TTFont reading its tables from a new reader instance
+        over the same tables data, so that changes to the TTFont tables
+        (eg. deleted tables) don't affect the other fonts opened by this reader.
+        Tables are decompiled only when accessed.
+        """
+        reader = TablesReader(
+            self._tables,
+            sfnt_version=self.sfntVersion,
+            flavor=self.flavor,
+            flavor_data=self.flavorData,
+        )
+        ttfont = TTFont(**kwargs)
+        ttfont.reader = reader
+        ttfont.sfntVersion = self.sfntVersion
+        ttfont.flavor = self.flavor
+        ttfont.flavorData = self.flavorData
+        # set by TTFont only when reading from file
+        ttfont._tableCache = None
+        return ttfont
+
+
+def _read_table_data(
+    ttfont: TTFont,
+    tag: str,
+    tables: dict[str, bytes],
+) -> None:
+    if tag in tables:
+        return
+    # compile tables in the same dependencies order used by TTFont.save,
+    # eg. compiling glyf updates loca
+    for dependency_tag in getTableClass(tag).dependencies:
+        if dependency_tag in ttfont:
+            _read_table_data(ttfont, dependency_tag, tables)
+    tables[tag] = ttfont.getTableData(tag)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+import ots
+
+CACHE_MAXSIZE: int = 4096
+
+_SUCCESS_MESSAGE = "File sanitized successfully!\n"
+
+# sanitizer outputs (exit code, stdout, stderr) by font data hash
+_cache: OrderedDict[str, tuple[int, str, str]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def clear_sanitizer_cache() -> None:
+    """
+    Removes all the cached sanitizer outputs.
+    """
+    with _cache_lock:
+        _cache.clear()
+
+
+def get_cached_output(
+    key: str,
+) -> tuple[int, str, str] | None:
+    """
+    Gets the cached sanitizer output (exit code, stdout, stderr)
+    for the given font data hash, None if not cached.
+    """
+    with _cache_lock:
+        output = _cache.get(key)
+        if output is not None:
+            _cache.move_to_end(key)
+        return output
+
+
+def get_sanitizer_error(
+    output: tuple[int, str, str],
+    *,
+    strict: bool,
+) -> str | None:
+    """
+    Gets the error message of the given sanitizer output, None if the font is valid,
+    if strict is True sanitizer warnings are reported as errors.
+    """
+    error_code, warnings, errors = output
+    if error_code:
+        return (
+            f"OpenType Sanitizer returned non-zero exit code ({error_code}): \n{errors}"
+        )
+    if strict and warnings != _SUCCESS_MESSAGE:
+        warnings = warnings.removesuffix(_SUCCESS_MESSAGE).rstrip()
+        return f"OpenType Sanitizer warnings: \n{warnings}"
+    return None
+
+
+def get_sanitizer_warnings(
+    output: tuple[int, str, str],
+) -> str | None:
+    """
+    Gets the warnings of the given sanitizer output, None if there are no warnings.
+    """
+    warnings = output[1]
+    if not warnings or warnings == _SUCCESS_MESSAGE:
+        return None
+    return warnings.removesuffix(_SUCCESS_MESSAGE).rstrip()
+
+
+def sanitize_data(
+    data: bytes,
+    *,
+    key: str,
+    dirpath: str | None = None,
+) -> tuple[int, str, str]:
+    """
+    Runs the OpenType Sanitizer on the given font data and returns its output
+    (exit code, stdout, stderr), outputs are cached by the font data hash (key).
+    The data is written to a file in dirpath (a new temporary directory if None)
+    and the file is removed once sanitized.
+    """
+    output = get_cached_output(key)
+    if output is not None:
+        return output
+    if dirpath is None:
+        with tempfile.TemporaryDirectory() as temp_dirpath:
+            output = _run_sanitizer(data, os.path.join(temp_dirpath, key))
+    else:
+        output = _run_sanitizer(data, os.path.join(dirpath, key))
+    with _cache_lock:
+        _cache[key] = output
+        _cache.move_to_end(key)
+        if len(_cache) > CACHE_MAXSIZE:
+            _cache.popitem(last=False)
+    return output
+
+
+def _run_sanitizer(
+    data: bytes,
+    filepath: str,
+) -> tuple[int, str, str]:
+    with open(filepath, "wb") as fileobject:
+        fileobject.write(data)
+    try:
+        result = ots.sanitize(
+            filepath,
+            capture_output=True,
+            encoding="utf-8",
+        )
+    finally:
+        os.remove(filepath)
+    return (result.returncode, result.stdout, result.stderr)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fontbro.exceptions import OperationError
+
+try:
+    import uharfbuzz
+except ImportError:  # pragma: no cover
+    uharfbuzz = None
+
+
+def is_shaping_available() -> bool:
+    """
+    Checks if the text shaping engine (HarfBuzz via uharfbuzz) is installed.
+    """
+    return uharfbuzz is not None
+
+
+def create_shaping_font(
+    data: bytes,
+) -> Any:
+    """
+    Creates a HarfBuzz font from the given font binary data,
+    positions returned by shape_text are expressed in font units.
+    """
+    if uharfbuzz is None:
+        raise OperationError(
+            "Text shaping requires uharfbuzz, install it with: "
+            "pip install python-fontbro[shaping]"
+        )
+    return uharfbuzz.Font(uharfbuzz.Face(uharfbuzz.Blob(data)))
+
+
+def shape_text(
+    shaping_font: Any,
+    text: str,
+    *,
+    features: dict[str, bool | int] | None = None,
+    coordinates: dict[str, float] | None = None,
+) -> list[tuple[int, int, int, int, int]]:
+    """
+    Shapes the given text applying GSUB substitutions (eg. ligatures)
+    and GPOS positioning (eg. kerning), features are enabled/disabled
+    as in the OpenType defaults unless specified.
+    Returns a list of (glyph_id, x_advance, y_advance, x_offset, y_offset).
+    """
+    shaping_font.set_variations(coordinates or {})
+    buffer = uharfbuzz.Buffer()
+    buffer.add_str(text)
+    buffer.guess_segment_properties()
+    uharfbuzz.shape(shaping_font, buffer, features or {})
+    return [
+        (
+            info.codepoint,
+            position.x_advance,
+            position.y_advance,
+            position.x_offset,
+            position.y_offset,
+        )
+        for info, position in zip(
+            buffer.glyph_infos, buffer.glyph_positions, strict=True
+        )
+    ]
+
+
+def get_pillow_features(
+    features: dict[str, bool | int] | None,
+) -> list[str] | None:
+    """
+    Converts the given features to the Pillow (raqm) features strings format.
+    """
+    if features is None:
+        return None
+    return [
+        f"{'+' if value else '-'}{tag}" if isinstance(value, bool) else f"{tag}={value}"
+        for tag, value in features.items()
+    ]
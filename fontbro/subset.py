@@ -26,3 +26,22 @@ def parse_unicodes(
     unicodes_str = re.sub(r"(U\+)|(\\u)|(u)", "", unicodes_str, flags=re.I)
     unicodes_list = list(_parse_unicodes(unicodes_str))
     return unicodes_list
+
+
+def format_unicode_range(
+    codes: Iterable[int],
+) -> str:
+    """
+    Formats the given codes as a CSS unicode-range descriptor value,
+    consecutive codes are merged, eg. 'U+0020-007E, U+00A0'.
+    """
+    ranges: list[list[int]] = []
+    for code in sorted(set(codes)):
+        if ranges and code == ranges[-1][1] + 1:
+            ranges[-1][1] = code
+        else:
+            ranges.append([code, code])
+    return ", ".join(
+        f"U+{first:04X}" if first == last else f"U+{first:04X}-{last:04X}"
+        for first, last in ranges
+    )
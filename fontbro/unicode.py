@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Any
+
+from fontbro.utils import read_json
+
+# sorted ranges of consecutive codes with the same unicode block and script
+_UNICODE_RANGES: list[dict[str, Any]] = read_json("data/unicode-ranges.json")
+_UNICODE_RANGES_FIRST_CODES: list[int] = [
+    unicode_range["first_code"] for unicode_range in _UNICODE_RANGES
+]
+_UNICODE_SCRIPTS_NAMES: dict[str, str] = {
+    script["tag"]: script["name"] for script in read_json("data/unicode-scripts.json")
+}
+
+UNICODE_NO_BLOCK_NAME = "No_Block"
+UNICODE_UNKNOWN_SCRIPT_TAG = "Zzzz"
+
+
+def get_unicode_block_and_script(
+    code: int,
+) -> tuple[str, str, str]:
+    """
+    Gets the unicode block name, script tag and script name of the given code
+    using the pre-computed unicode ranges data.
+    """
+    index = bisect_right(_UNICODE_RANGES_FIRST_CODES, code) - 1
+    if index >= 0 and code <= _UNICODE_RANGES[index]["last_code"]:
+        unicode_range = _UNICODE_RANGES[index]
+        block_name = unicode_range["block_name"]
+        script_tag = unicode_range["script_tag"]
+    else:
+        block_name = UNICODE_NO_BLOCK_NAME
+        script_tag = UNICODE_UNKNOWN_SCRIPT_TAG
+    script_name = _UNICODE_SCRIPTS_NAMES.get(script_tag, "Unknown")
+    return (block_name, script_tag, script_name)
@@ -28,6 +28,15 @@ def find_item(
     )
 
 
+def get_css_url(
+    url: str,
+) -> str:
+    # quoted, so that spaces, parentheses and quotes don't break the css
+    url = url.replace("\\", "\\\\").replace('"', '\\"')
+    url = url.replace("\n", "\\a ").replace("\r", "\\d ")
+    return f'url("{url}")'
+
+
 def read_json(
     filepath: str,
 ) -> Any:
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import Any
+
+from fontbro.exceptions import OperationError
+
+_worker_data: bytes | None = None
+
+
+def _init_worker(
+    data: bytes,
+) -> None:
+    global _worker_data
+    _worker_data = data
+
+
+def create_process_pool(
+    *,
+    max_workers: int | None,
+    data: bytes,
+) -> ProcessPoolExecutor:
+    """
+    Creates a process pool sending the given data to each worker process
+    only once (instead of once per task), tasks can read it with get_worker_data.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(data,),
+    )
+
+
+def get_worker_data() -> bytes:
+    """
+    Gets the data sent to the current worker process by the pool initializer.
+    """
+    if _worker_data is None:
+        raise OperationError("Worker data not initialized.")
+    return _worker_data
+
+
+def map_chunks(
+    func: Callable[[list[Any]], list[Any]],
+    items: Iterable[Any],
+    *,
+    workers: int,
+    chunksize: int,
+    executor_class: type[ProcessPoolExecutor | ThreadPoolExecutor] = (
+        ProcessPoolExecutor
+    ),
+) -> Generator[Any]:
+    """
+    Calls func with chunks of items in a process pool (or in a thread pool
+    passing executor_class=ThreadPoolExecutor), results are generated
+    lazily in the same order of the given items. The number of pending chunks
+    is bounded, so memory usage stays constant on huge iterables.
+    """
+    items_iter = iter(items)
+    with executor_class(max_workers=workers) as executor:
+        futures: deque[Future[list[Any]]] = deque()
+        while True:
+            while len(futures) < workers * 2:
+                chunk = list(islice(items_iter, chunksize))
+                if not chunk:
+                    break
+                futures.append(executor.submit(func, chunk))
+            if not futures:
+                break
+            yield from futures.popleft().result()
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import struct
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from functools import partial
+from io import BytesIO
+from typing import IO, Any
+
+import numpy as np
+from fontTools.ttLib import getSearchRange, woff2
+from fontTools.ttLib.sfnt import SFNTWriter, WOFFDirectoryEntry
+from fontTools.ttLib.ttFont import sortedTagList
+
+from fontbro.exceptions import ArgumentError
+
+_SFNT_HEADER_FORMAT = ">4sHHHH"
+_SFNT_ENTRY_FORMAT = ">4sLLL"
+
+WOFF_COMPRESSION_LEVEL_DEFAULT: int = 6
+WOFF2_COMPRESSION_LEVEL_DEFAULT: int = 11
+WOFF2_WINDOW_SIZE_DEFAULT: int = 22
+
+
+class _BrotliCompressor:
+    """
+    Proxy of the brotli module used by the fontTools woff2 module,
+    the font data compressed by the given thread uses the given options,
+    the other calls are passed through.
+    """
+
+    def __init__(
+        self,
+        brotli: Any,
+        *,
+        thread_id: int,
+        **options: Any,
+    ) -> None:
+        self._brotli = brotli
+        self._thread_id = thread_id
+        self._options = options
+
+    def __getattr__(
+        self,
+        name: str,
+    ) -> Any:
+        return getattr(self._brotli, name)
+
+    def compress(
+        self,
+        data: bytes,
+        **kwargs: Any,
+    ) -> bytes:
+        if (
+            threading.get_ident() == self._thread_id
+            and kwargs.get("mode") == self._brotli.MODE_FONT
+        ):
+            kwargs = {**kwargs, **self._options}
+        return bytes(self._brotli.compress(data, **kwargs))
+
+
+_brotli_lock = threading.Lock()
+
+
+@contextmanager
+def _brotli_options(
+    **options: Any,
+) -> Generator[None]:
+    # WOFF2Writer.close compresses the font data with the brotli module
+    # of the fontTools woff2 module and its default options (quality 11, lgwin 22),
+    # so the module is swapped only while writing and always restored
+    with _brotli_lock:
+        brotli = woff2.brotli
+        woff2.brotli = _BrotliCompressor(
+            brotli, thread_id=threading.get_ident(), **options
+        )
+        try:
+            yield
+        finally:
+            woff2.brotli = brotli
+
+
+class _WOFF2Writer(woff2.WOFF2Writer):  # type: ignore[misc]
+    """
+    WOFF2 writer with configurable brotli compression level and window size.
+    """
+
+    def __init__(
+        self,
+        file: IO[bytes],
+        numTables: int,
+        sfntVersion: str,
+        flavorData: Any = None,
+        *,
+        compression_level: int,
+        window_size: int,
+    ) -> None:
+        super().__init__(file, numTables, sfntVersion, "woff2", flavorData)
+        self.compression_level = compression_level
+        self.window_size = window_size
+
+    def close(
+        self,
+    ) -> None:
+        if (
+            self.compression_level == WOFF2_COMPRESSION_LEVEL_DEFAULT
+            and self.window_size == WOFF2_WINDOW_SIZE_DEFAULT
+        ):
+            super().close()
+            return
+        with _brotli_options(quality=self.compression_level, lgwin=self.window_size):
+            super().close()
+
+
+def calc_checksum(
+    data: bytes,
+) -> int:
+    """
+    Calculates the OpenType checksum of the given table data
+    (sum of big-endian uint32 words, zero padded), vectorized with numpy.
+    """
+    padding = -len(data) % 4
+    if padding:
+        data = data + b"\0" * padding
+    words = np.frombuffer(data, dtype=">u4")
+    return int(words.sum(dtype=np.uint64)) & 0xFFFFFFFF
+
+
+def _create_woff_directory_entry(
+    compression_level: int,
+) -> WOFFDirectoryEntry:
+    # the zlib compression level is read from each directory entry
+    entry = WOFFDirectoryEntry()
+    entry.zlibCompressionLevel = compression_level
+    return entry
+
+
+def write_tables(
+    fileobject: IO[bytes],
+    tables: dict[str, bytes],
+    *,
+    sfnt_version: str,
+    flavor: str | None = None,
+    flavor_data: Any = None,
+    woff_compression_level: int = WOFF_COMPRESSION_LEVEL_DEFAULT,
+    woff2_compression_level: int = WOFF2_COMPRESSION_LEVEL_DEFAULT,
+    woff2_window_size: int = WOFF2_WINDOW_SIZE_DEFAULT,
+) -> None:
+    """
+    Writes the given compiled tables data to a font file object,
+    tables data is written in the order recommended by the OpenType spec
+    (the same order used by TTFont.save).
+    The woff (zlib) and woff2 (brotli) compression options are used
+    only with the corresponding flavor.
+    """
+    validate_compression_options(
+        woff_compression_level=woff_compression_level,
+        woff2_compression_level=woff2_compression_level,
+        woff2_window_size=woff2_window_size,
+    )
+    tags = sortedTagList(list(tables.keys()))
+    if flavor:
+        # woff and woff2 containers compress the tables data,
+        # their writers need a seekable file object
+        buffer = BytesIO()
+        writer: SFNTWriter
+        if flavor == "woff2":
+            writer = _WOFF2Writer(
+                buffer,
+                len(tags),
+                sfnt_version,
+                flavor_data,
+                compression_level=woff2_compression_level,
+                window_size=woff2_window_size,
+            )
+        else:
+            writer = SFNTWriter(buffer, len(tags), sfnt_version, flavor, flavor_data)
+            writer.DirectoryEntry = partial(
+                _create_woff_directory_entry, woff_compression_level
+            )
+        for tag in tags:
+            writer[tag] = tables[tag]
+        writer.close()
+        fileobject.write(buffer.getvalue())
+        return
+    _write_sfnt(fileobject, tables, tags, sfnt_version=sfnt_version)
+
+
+def validate_compression_options(
+    *,
+    woff_compression_level: int = WOFF_COMPRESSION_LEVEL_DEFAULT,
+    woff2_compression_level: int = WOFF2_COMPRESSION_LEVEL_DEFAULT,
+    woff2_window_size: int = WOFF2_WINDOW_SIZE_DEFAULT,
+) -> None:
+    """
+    Validates the woff (zlib level 0-9) and woff2 (brotli quality 0-11
+    and window size 10-24) compression options.
+    """
+    for name, value, min_value, max_value in [
+        ("woff_compression_level", woff_compression_level, 0, 9),
+        ("woff2_compression_level", woff2_compression_level, 0, 11),
+        ("woff2_window_size", woff2_window_size, 10, 24),
+    ]:
+        if not isinstance(value, int) or not min_value <= value <= max_value:
+            raise ArgumentError(
+                f"Invalid {name} value: expected int between "
+                f"{min_value} and {max_value}, found '{value}'."
+            )
+
+
+def _write_sfnt(
+    fileobject: IO[bytes],
+    tables: dict[str, bytes],
+    tags: list[str],
+    *,
+    sfnt_version: str,
+) -> None:
+    num_tables = len(tags)
+    search_range, entry_selector, range_shift = getSearchRange(num_tables, 16)
+    header = struct.pack(
+        _SFNT_HEADER_FORMAT,
+        sfnt_version.encode("latin-1"),
+        num_tables,
+        search_range,
+        entry_selector,
+        range_shift,
+    )
+    offset = len(header) + num_tables * struct.calcsize(_SFNT_ENTRY_FORMAT)
+    entries: dict[str, tuple[int, int, int]] = {}
+    for tag in tags:
+        data = tables[tag]
+        if tag == "head":
+            # checksum adjustment is excluded from the head checksum
+            checksum = calc_checksum(data[:8] + b"\0\0\0\0" + data[12:])
+        else:
+            checksum = calc_checksum(data)
+        entries[tag] = (checksum, offset, len(data))
+        offset += (len(data) + 3) & ~3
+    directory = header + b"".join(
+        struct.pack(_SFNT_ENTRY_FORMAT, tag.encode("latin-1"), *entries[tag])
+        for tag in sorted(tags)
+    )
+    if "head" in tables:
+        checksum = calc_checksum(directory)
+        checksum += sum(entry[0] for entry in entries.values())
+        checksum_adjustment = (0xB1B0AFBA - checksum) & 0xFFFFFFFF
+        head = tables["head"]
+        tables = {
+            **tables,
+            "head": head[:8] + struct.pack(">L", checksum_adjustment) + head[12:],
+        }
+    fileobject.write(directory)
+    for tag in tags:
+        data = tables[tag]
+        fileobject.write(data)
+        fileobject.write(b"\0" * (-len(data) % 4))
@@ -0,0 +1,509 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Any
+from unittest import mock
+
+import fsutil
+import ots
+from fontTools.pens.svgPathPen import SVGPathPen
+from PIL import Image, ImageDraw, ImageFont
+
+from fontbro import Font, batch
+from fontbro.aio import AsyncFont
+from fontbro.exceptions import DataError
+from fontbro.sanitizer import clear_sanitizer_cache
+
+
+def _get_font_filepath(filepath: str) -> str:
+    return str(fsutil.join_path(__file__, f"../tests/fonts/{filepath}"))
+
+
+def _get_fonts_filepaths() -> list[str]:
+    fonts_dirpath = fsutil.join_path(__file__, "../tests/fonts/")
+    return sorted(
+        fsutil.search_files(fonts_dirpath, "**/*.ttf")
+        + fsutil.search_files(fonts_dirpath, "**/*.otf")
+    )
+
+
+def _measure(func: Callable[..., Any], *args: Any, **kwargs: Any) -> float:
+    # best of 3, in milliseconds
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def _measure_memory(func: Callable[..., Any], *args: Any, **kwargs: Any) -> float:
+    # peak of traced memory allocations, in MiB
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+def _print_results(title: str, results: dict[str, float], *, unit: str) -> None:
+    print(f"\n{title}")
+    for key, value in results.items():
+        print(f"  {key:<32} {value:>10.3f} {unit}")
+
+
+def benchmark_metadata() -> None:
+    filepaths = _get_fonts_filepaths()
+    largest_filepath = max(filepaths, key=fsutil.get_file_size)
+
+    def read_metadata(filepaths: list[str], **kwargs: Any) -> None:
+        for filepath in filepaths:
+            with Font(filepath, **kwargs) as font:
+                font.get_family_name()
+                font.get_style_name()
+                font.get_weight()
+                font.get_width()
+                font.get_format()
+                font.get_version()
+                font.get_variable_axes()
+
+    for title, files in [
+        (f"all fonts ({len(filepaths)} files)", filepaths),
+        (f"largest font ({fsutil.get_filename(largest_filepath)})", [largest_filepath]),
+    ]:
+        results = {
+            "eager (lazy=None)": _measure(read_metadata, files, lazy=None),
+            "lazy (default)": _measure(read_metadata, files),
+        }
+        results = {key: value / len(files) for key, value in results.items()}
+        _print_results(f"metadata per-file latency, {title}", results, unit="ms")
+
+
+def _clone_legacy(font: Font) -> Font:
+    # serializes and parses again the whole font
+    font_clone = Font(font.save_to_fileobject())
+    font_clone._filepath = font._filepath
+    return font_clone
+
+
+def benchmark_clone() -> None:
+    font = Font(_get_font_filepath("Honk/Honk-Regular-VariableFont_MORF,SHLN.ttf"))
+    font.rename(family_name="Honk Clone")
+    results = {
+        "legacy (save + parse)": _measure(_clone_legacy, font),
+        "copy-on-write": _measure(font.clone),
+    }
+    _print_results("clone latency, Honk (3.7 MB)", results, unit="ms")
+
+    filepath = _get_font_filepath("Roboto_Mono/RobotoMono-VariableFont_wght.ttf")
+
+    def save_variable_instances(clone: Callable[[Font], Font] | None = None) -> None:
+        with (
+            tempfile.TemporaryDirectory() as dirpath,
+            mock.patch.object(Font, "clone", clone or Font.clone),
+        ):
+            font = Font(filepath)
+            font.save_variable_instances(dirpath, woff2=False, woff=False)
+
+    instances_count = len(Font(filepath).get_variable_instances())
+    title = f"save_variable_instances, Roboto Mono ({instances_count} instances)"
+    results = {
+        "legacy (save + parse)": _measure(save_variable_instances, _clone_legacy),
+        "copy-on-write": _measure(save_variable_instances),
+    }
+    _print_results(f"{title} time", results, unit="ms")
+    results = {
+        "legacy (save + parse)": _measure_memory(
+            save_variable_instances, _clone_legacy
+        ),
+        "copy-on-write": _measure_memory(save_variable_instances),
+    }
+    _print_results(f"{title} peak memory", results, unit="MiB")
+
+
+def _get_image_legacy(font: Font, *, text: str, size: int) -> Image.Image:
+    # saves the font to a temporary file and loads it for each image
+    with tempfile.TemporaryDirectory() as dest:
+        filepath = font.save(dest)
+        img = Image.new("RGBA", (2, 2), (255, 255, 255, 255))
+        draw = ImageDraw.Draw(img)
+        img_font = ImageFont.truetype(filepath, size)
+        img_bbox = draw.textbbox((0, 0), text, font=img_font)
+        img_size = (img_bbox[2] - img_bbox[0], img_bbox[3] - img_bbox[1])
+        img = img.resize(img_size)
+        draw = ImageDraw.Draw(img)
+        draw.text(
+            (-img_bbox[0], -img_bbox[1]), text, font=img_font, fill=(0, 0, 0, 255)
+        )
+        del img_font
+        return img
+
+
+def benchmark_image() -> None:
+    images_count = 50
+    sizes = [16, 24, 32, 48, 64]
+
+    def get_images(get_image: Callable[..., Image.Image], font: Font) -> None:
+        for index in range(images_count):
+            get_image(font, text="Hello World!", size=sizes[index % len(sizes)])
+
+    for filepath in [
+        "Roboto_Mono/static/RobotoMono-Regular.ttf",
+        "Inter/Inter-VariableFont_slnt,wght.ttf",
+    ]:
+        font = Font(_get_font_filepath(filepath))
+        results = {
+            "temp file (legacy)": _measure(get_images, _get_image_legacy, font),
+            "in-memory + cache": _measure(get_images, Font.get_image, font),
+        }
+        results = {key: images_count / (value / 1000) for key, value in results.items()}
+        title = f"get_image throughput, {fsutil.get_filename(filepath)}"
+        _print_results(title, results, unit="images/s")
+
+    # specimen set: 4 sample strings x 6 sizes
+    specs = [
+        {"text": text, "size": size}
+        for text in ["Hello World!", "Aa", "0123456789", "The quick brown fox"]
+        for size in [12, 16, 24, 32, 48, 64]
+    ]
+
+    def get_specimen_legacy(font: Font) -> None:
+        for spec in specs:
+            _get_image_legacy(font, **spec)
+
+    def get_specimen(font: Font) -> None:
+        # fresh font, so the Pillow fonts are loaded within the measure
+        Font(font.save_to_fileobject()).get_images(specs)
+
+    font = Font(_get_font_filepath("Inter/Inter-VariableFont_slnt,wght.ttf"))
+    results = {
+        "get_image loop (legacy)": _measure(get_specimen_legacy, font),
+        "get_images": _measure(get_specimen, font),
+    }
+    title = f"specimen set latency ({len(specs)} images), Inter"
+    _print_results(title, results, unit="ms")
+
+
+def _get_svg_legacy(font: Font, *, text: str, size: int) -> str:
+    # draws each glyph again for every char and concatenates strings
+    ttfont = font.get_ttfont()
+    scale = size / ttfont["head"].unitsPerEm
+    ascent = ttfont["hhea"].ascent * scale
+    glyphset = ttfont.getGlyphSet()
+    cmap = ttfont["cmap"].getBestCmap()
+    width = 0.0
+    paths = ""
+    for glyph_name in filter(None, [cmap.get(ord(char)) for char in text]):
+        glyph = glyphset[glyph_name]
+        pen = SVGPathPen(glyphset)
+        glyph.draw(pen)
+        transform = f"translate({width:.2f} {ascent:.2f}) scale({scale} -{scale})"
+        paths += f"""<path d="{pen.getCommands()}" transform="{transform}" />"""
+        width += glyph.width * scale
+    return f"<svg>{paths}</svg>"
+
+
+def benchmark_svg() -> None:
+    text = "The quick brown fox jumps over the lazy dog. " * 200
+    font = Font(_get_font_filepath("Inter/static/Inter-Black.ttf"))
+    results = {
+        "legacy (draw per char)": _measure(_get_svg_legacy, font, text=text, size=16),
+        "glyph paths cache": _measure(font.get_svg, text=text, size=16),
+    }
+    _print_results(f"get_svg latency, Inter ({len(text)} chars)", results, unit="ms")
+    results = {
+        "legacy (draw per char)": len(_get_svg_legacy(font, text=text, size=16)),
+        "glyph paths cache": len(font.get_svg(text=text, size=16)),
+    }
+    results = {key: value / 1024 for key, value in results.items()}
+    _print_results("get_svg output size", results, unit="KiB")
+
+
+def benchmark_variations() -> None:
+    font = Font(_get_font_filepath("Inter/Inter-VariableFont_slnt,wght.ttf"))
+    # preview grid of axes values
+    coordinates_grid = [
+        {"wght": wght, "slnt": slnt}
+        for wght in [100, 400, 700, 900]
+        for slnt in [-10, 0]
+    ]
+
+    def get_images_instancing() -> None:
+        for coordinates in coordinates_grid:
+            static_font = font.clone()
+            static_font.to_static(coordinates=coordinates)
+            static_font.get_image(text="Hello World!", size=48)
+            static_font.get_svg(text="Hello World!", size=48)
+
+    def get_images_coordinates() -> None:
+        for coordinates in coordinates_grid:
+            font.get_image(text="Hello World!", size=48, coordinates=coordinates)
+            font.get_svg(text="Hello World!", size=48, coordinates=coordinates)
+
+    results = {
+        "clone + to_static": _measure(get_images_instancing),
+        "coordinates": _measure(get_images_coordinates),
+    }
+    title = f"image + svg previews ({len(coordinates_grid)} coordinates), Inter"
+    _print_results(title, results, unit="ms")
+
+
+def _is_monospace_legacy(font: Font, threshold: float = 0.85) -> bool:
+    # decompiles hmtx and counts the widths of all the glyphs
+    ttfont = font.get_ttfont()
+    widths = [metrics[0] for metrics in ttfont["hmtx"].metrics.values()]
+    same_width_count = Counter(widths).most_common(1)[0][1]
+    return same_width_count / font.get_glyphs_count() >= threshold
+
+
+def benchmark_monospace() -> None:
+    filepaths = _get_fonts_filepaths()
+
+    def detect_monospace(is_monospace: Callable[[Font], bool]) -> None:
+        for filepath in filepaths:
+            with Font(filepath) as font:
+                is_monospace(font)
+
+    results = {
+        "open only (baseline)": _measure(detect_monospace, lambda font: False),
+        "legacy (hmtx + Counter)": _measure(detect_monospace, _is_monospace_legacy),
+        "raw hmtx widths": _measure(detect_monospace, Font.is_monospace),
+    }
+    results = {key: value / len(filepaths) for key, value in results.items()}
+    title = f"is_monospace per-file latency, all fonts ({len(filepaths)} files)"
+    _print_results(title, results, unit="ms")
+
+
+def _save_legacy(font: Font, filepath: str) -> None:
+    # compiles all the loaded tables and reorders the saved font
+    font.get_ttfont().save(filepath)
+
+
+def benchmark_save() -> None:
+    def rename_and_save(filepath: str, save: Callable[[Font, str], Any]) -> None:
+        with tempfile.TemporaryDirectory() as dirpath, Font(filepath) as font:
+            font.rename(family_name="Renamed")
+            save(font, fsutil.join_path(dirpath, fsutil.get_filename(filepath)))
+
+    for title, filepath in [
+        ("Honk (3.7 MB)", "Honk/Honk-Regular-VariableFont_MORF,SHLN.ttf"),
+        ("League Gothic (CFF)", "issues/issue-0050/LeagueGothic-Regular.otf"),
+    ]:
+        filepath = _get_font_filepath(filepath)
+        results = {
+            "legacy (TTFont.save)": _measure(rename_and_save, filepath, _save_legacy),
+            "not loaded tables reused": _measure(rename_and_save, filepath, Font.save),
+        }
+        _print_results(f"rename + save latency, {title}", results, unit="ms")
+
+    filepath = _get_font_filepath("Roboto_Mono/RobotoMono-VariableFont_wght.ttf")
+    font = Font(filepath)
+    font.to_static(coordinates={"wght": 700})
+
+    def save_formats(save: Callable[[Font, str], Any]) -> None:
+        with tempfile.TemporaryDirectory() as dirpath:
+            save(font, dirpath)
+
+    def save_formats_legacy(font: Font, dirpath: str) -> None:
+        # each format compiles all the tables again
+        ttfont = font.get_ttfont()
+        for flavor in [None, Font.FORMAT_WOFF2, Font.FORMAT_WOFF]:
+            ttfont.flavor = flavor
+            ttfont.save(fsutil.join_path(dirpath, f"font.{flavor or 'ttf'}"))
+        ttfont.flavor = None
+
+    results = {
+        "legacy (compile per format)": _measure(save_formats, save_formats_legacy),
+        "save_as (compile once)": _measure(save_formats, Font.save_as),
+    }
+    title = "save ttf + woff2 + woff latency, Roboto Mono static instance"
+    _print_results(title, results, unit="ms")
+
+
+def benchmark_compression() -> None:
+    filepath = _get_font_filepath("Inter/Inter-VariableFont_slnt,wght.ttf")
+    font = Font(filepath)
+
+    def save_woff2(dirpath: str, **kwargs: Any) -> None:
+        font.save_as_woff2(dirpath, **kwargs)
+
+    with tempfile.TemporaryDirectory() as dirpath:
+        results = {}
+        sizes = {}
+        for compression_level in [1, 5, 9, 11]:
+            key = f"woff2 compression level {compression_level}"
+            results[key] = _measure(
+                save_woff2, dirpath, compression_level=compression_level
+            )
+            sizes[key] = fsutil.get_file_size(fsutil.search_files(dirpath)[0]) / 1024
+    _print_results("woff2 save latency, Inter variable", results, unit="ms")
+    _print_results("woff2 file size, Inter variable", sizes, unit="KiB")
+
+    filepaths = _get_fonts_filepaths()[:24]
+
+    def convert(**kwargs: Any) -> None:
+        with tempfile.TemporaryDirectory() as dirpath:
+            for result in batch.convert_fonts(
+                filepaths, dirpath, formats=["woff2", "woff"], **kwargs
+            ):
+                assert result["error"] is None, result["error"]
+
+    results = {
+        "sequential": _measure(convert),
+        "4 threads": _measure(convert, workers=4),
+        "4 threads, woff2 level 5": _measure(
+            convert, workers=4, woff2_compression_level=5
+        ),
+    }
+    title = f"convert_fonts to woff2 + woff latency, {len(filepaths)} fonts"
+    _print_results(title, results, unit="ms")
+
+
+def benchmark_aio() -> None:
+    filepath = _get_font_filepath("Inter/Inter-VariableFont_slnt,wght.ttf")
+
+    async def get_event_loop_max_lag(save: Callable[[str], Awaitable[Any]]) -> float:
+        # longest interval the event loop has been unable to run other tasks
+        max_lag = 0.0
+
+        async def tick() -> None:
+            nonlocal max_lag
+            while True:
+                start = time.perf_counter()
+                await asyncio.sleep(0)
+                max_lag = max(max_lag, time.perf_counter() - start)
+
+        ticker = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+        with tempfile.TemporaryDirectory() as dirpath:
+            await save(dirpath)
+        await asyncio.sleep(0)
+        ticker.cancel()
+        return max_lag * 1000
+
+    async def save_sync(dirpath: str) -> None:
+        with Font(filepath) as font:
+            font.subset(unicodes="0000-00FF")
+            font.save_as_woff2(dirpath, compression_level=5)
+
+    async def save_async(dirpath: str) -> None:
+        async with await AsyncFont.open(filepath) as font:
+            await font.subset(unicodes="0000-00FF")
+            await font.save_as_woff2(dirpath, compression_level=5)
+
+    results = {
+        "Font (blocking)": asyncio.run(get_event_loop_max_lag(save_sync)),
+        "AsyncFont": asyncio.run(get_event_loop_max_lag(save_async)),
+    }
+    title = "event loop max lag, open + subset + save woff2, Inter variable"
+    _print_results(title, results, unit="ms")
+
+
+def _sanitize_legacy(font: Font) -> None:
+    # temporary directory, save and sanitizer process for each font
+    with tempfile.TemporaryDirectory() as dirpath:
+        filepath = font.save(fsutil.join_path(dirpath, "font.ttf"))
+        ots.sanitize(filepath, capture_output=True, encoding="utf-8")
+
+
+def benchmark_sanitize() -> None:
+    fonts_dirpath = fsutil.join_path(__file__, "../tests/fonts-ots/good/")
+    filepaths = []
+    for filepath in sorted(fsutil.list_files(fonts_dirpath)):
+        try:
+            Font(filepath).close()
+        except ValueError:
+            # font collections
+            continue
+        filepaths.append(filepath)
+
+    def sanitize(func: Callable[[list[Font]], Any], *, cached: bool = False) -> None:
+        if not cached:
+            clear_sanitizer_cache()
+        fonts = [Font(filepath) for filepath in filepaths]
+        func(fonts)
+
+    def sanitize_legacy(fonts: list[Font]) -> None:
+        for font in fonts:
+            try:
+                _sanitize_legacy(font)
+            except DataError:
+                # the font format can't be detected for choosing the filename
+                continue
+
+    results = {
+        "legacy (temp dir per font)": _measure(sanitize, sanitize_legacy),
+        "sanitize_many": _measure(sanitize, batch.sanitize_many),
+        "sanitize_many, 4 workers": _measure(
+            sanitize, partial(batch.sanitize_many, workers=4)
+        ),
+        "sanitize_many, cached": _measure(sanitize, batch.sanitize_many, cached=True),
+    }
+    _print_results(f"sanitize latency, {len(filepaths)} fonts", results, unit="ms")
+
+
+def benchmark_slices() -> None:
+    filepath = _get_font_filepath("Inter/Inter-VariableFont_slnt,wght.ttf")
+    font = Font(filepath)
+    slices = font._get_unicode_ranges_slices(None)
+
+    def split_legacy(dirpath: str) -> None:
+        # clone and subset the source font for each unicode-range bucket
+        for slice_ in slices:
+            slice_font = font.clone()
+            slice_font.subset(unicodes=slice_["unicodes"])
+            slice_font.save_as_woff2(
+                fsutil.join_path(dirpath, f"{slice_['name']}.woff2"),
+                compression_level=5,
+            )
+
+    def split(dirpath: str, **kwargs: Any) -> None:
+        font.split_by_unicode_ranges(dirpath, woff2_compression_level=5, **kwargs)
+
+    def split_to_tempdir(func: Callable[..., None], **kwargs: Any) -> None:
+        with tempfile.TemporaryDirectory() as dirpath:
+            func(dirpath, **kwargs)
+
+    results = {
+        "legacy (clone + subset)": _measure(split_to_tempdir, split_legacy),
+        "split_by_unicode_ranges": _measure(split_to_tempdir, split),
+        "split_by_unicode_ranges, 4 workers": _measure(
+            split_to_tempdir, split, workers=4
+        ),
+    }
+    title = f"unicode-range slicing latency, Inter variable ({len(slices)} slices)"
+    _print_results(title, results, unit="ms")
+
+
+_BENCHMARKS: dict[str, Callable[[], None]] = {
+    "aio": benchmark_aio,
+    "metadata": benchmark_metadata,
+    "clone": benchmark_clone,
+    "compression": benchmark_compression,
+    "image": benchmark_image,
+    "monospace": benchmark_monospace,
+    "sanitize": benchmark_sanitize,
+    "save": benchmark_save,
+    "slices": benchmark_slices,
+    "svg": benchmark_svg,
+    "variations": benchmark_variations,
+}
+
+
+def main() -> None:
+    names = sys.argv[1:] or list(_BENCHMARKS.keys())
+    for name in names:
+        _BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
@@ -13,11 +13,56 @@ def _write_data_json(filepath: str, data: Any) -> None:
     fsutil.write_file_json(data_filepath, data, indent=4, sort_keys=True)
 
 
+def _populate_unicode_ranges(
+    ranges: list[dict[str, Any]],
+    code: int,
+    block_name: str,
+    script_tag: str,
+) -> None:
+    # merge consecutive codes with the same block and script in a single range
+    last_range = ranges[-1] if ranges else None
+    if (
+        last_range
+        and last_range["last_code"] == code - 1
+        and last_range["block_name"] == block_name
+        and last_range["script_tag"] == script_tag
+    ):
+        last_range["last_code"] = code
+        return
+    ranges.append(
+        {
+            "block_name": block_name,
+            "first_code": code,
+            "last_code": code,
+            "script_tag": script_tag,
+        }
+    )
+
+
+def _get_unicode_items_ranges(
+    ranges: list[dict[str, Any]],
+    key: str,
+) -> dict[str, list[list[int]]]:
+    # merge consecutive unicode ranges with the same block/script,
+    # each item range is a list with the first and the last code
+    items_ranges: dict[str, list[list[int]]] = {}
+    for unicode_range in ranges:
+        item_ranges = items_ranges.setdefault(unicode_range[key], [])
+        first_code = unicode_range["first_code"]
+        last_code = unicode_range["last_code"]
+        if item_ranges and item_ranges[-1][1] == first_code - 1:
+            item_ranges[-1][1] = last_code
+        else:
+            item_ranges.append([first_code, last_code])
+    return items_ranges
+
+
 def update_unicode_data() -> None:
     blocks: list[dict[str, Any]] = []
     blocks_cache: dict[str, Any] = {}
     scripts: list[dict[str, Any]] = []
     scripts_cache: dict[str, Any] = {}
+    ranges: list[dict[str, Any]] = []
     for code in range(0, 0x110000):
         block_name = unicodedata.block(code)
         if block_name == "No_Block":
@@ -33,17 +78,23 @@ def update_unicode_data() -> None:
             "tag": script_tag,
         }
         Font._populate_unicode_items_set(scripts, scripts_cache, script)
+        _populate_unicode_ranges(ranges, code, block_name, script_tag)
 
+    blocks_ranges = _get_unicode_items_ranges(ranges, "block_name")
     for block in blocks:
         block["characters_total"] = block["characters_count"]
         block.pop("characters_count", None)
+        block["ranges"] = blocks_ranges[block["name"]]
 
+    scripts_ranges = _get_unicode_items_ranges(ranges, "script_tag")
     for script in scripts:
         script["characters_total"] = script["characters_count"]
         script.pop("characters_count", None)
+        script["ranges"] = scripts_ranges[script["tag"]]
 
     _write_data_json(filepath="../fontbro/data/unicode-blocks.json", data=blocks)
     _write_data_json(filepath="../fontbro/data/unicode-scripts.json", data=scripts)
+    _write_data_json(filepath="../fontbro/data/unicode-ranges.json", data=ranges)
 
 
 def main() -> None:
@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from fontbro import Font
+from fontbro.aio import AsyncFont
+from tests import AbstractTestCase
+
+
+class AioTestCase(AbstractTestCase, unittest.IsolatedAsyncioTestCase):
+    """
+    Test case for the asyncio font wrapper.
+    """
+
+    def _get_tracked_sleep(self, active, lock):
+        def sleep(font):
+            with lock:
+                active["count"] += 1
+                active["max"] = max(active["max"], active["count"])
+            time.sleep(0.05)
+            with lock:
+                active["count"] -= 1
+
+        return sleep
+
+    async def test_open(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        async with await AsyncFont.open(filepath) as font:
+            self.assertIsInstance(font.font, Font)
+            self.assertEqual(await font.run(Font.get_family_name), "Roboto Mono")
+
+    async def test_open_with_invalid_font(self):
+        filepath = self._get_font_path("/issues/issue-0000/invalid.ttf")
+        with self.assertRaises(FileNotFoundError):
+            await AsyncFont.open(filepath)
+        with self.assertRaises(ValueError):
+            await AsyncFont.from_bytes(b"invalid")
+
+    async def test_from_bytes(self):
+        filepath = self._get_font_path("/issues/issue-0050/LeagueGothic-Regular.otf")
+        with open(filepath, "rb") as fileobject:
+            data = fileobject.read()
+        font = await AsyncFont.from_bytes(data)
+        self.assertEqual(await font.run(Font.get_format), Font.FORMAT_OTF)
+
+    async def test_clone(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        font = await AsyncFont.open(filepath)
+        font_clone = await font.clone()
+        await font_clone.subset(unicodes="0041-005A")
+        self.assertEqual(await font.run(Font.get_characters_count), 875)
+        self.assertEqual(await font_clone.run(Font.get_characters_count), 26)
+
+    async def test_save(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        font = await AsyncFont.open(filepath)
+        saved_filepath = await font.save(self._get_font_temp_path("font.ttf"))
+        self.assertEqual(saved_filepath, self._get_font_temp_path("font.ttf"))
+        with Font(saved_filepath) as saved_font:
+            self.assertEqual(saved_font.get_family_name(), "Roboto Mono")
+
+    async def test_save_as(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        font = await AsyncFont.open(filepath)
+        saved_filepaths = await font.save_as(
+            self._get_font_temp_path(""),
+            formats=["woff2", "woff"],
+            woff2_compression_level=1,
+        )
+        self.assertEqual(
+            sorted(saved_filepaths.keys()), [Font.FORMAT_WOFF, Font.FORMAT_WOFF2]
+        )
+
+    async def test_save_as_woff(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        font = await AsyncFont.open(filepath)
+        saved_filepath = await font.save_as_woff(self._get_font_temp_path(""))
+        with Font(saved_filepath) as saved_font:
+            self.assertEqual(saved_font.get_format(), Font.FORMAT_WOFF)
+
+    async def test_save_as_woff2(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        font = await AsyncFont.open(filepath)
+        saved_filepath = await font.save_as_woff2(
+            self._get_font_temp_path(""), compression_level=5
+        )
+        with Font(saved_filepath) as saved_font:
+            self.assertEqual(saved_font.get_format(), Font.FORMAT_WOFF2)
+            self.assertEqual(saved_font.get_characters_count(), 875)
+
+    async def test_save_as_woff2_does_not_block_event_loop(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        font = await AsyncFont.open(filepath)
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.001)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        await font.save_as_woff2(self._get_font_temp_path(""))
+        ticker.cancel()
+        self.assertGreater(ticks, 0)
+
+    async def test_sanitize(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        font = await AsyncFont.open(filepath)
+        await font.sanitize()
+
+    async def test_subset(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        font = await AsyncFont.open(filepath)
+        await font.subset(text="Hello")
+        self.assertEqual(await font.run(Font.get_characters_count), 4)
+        self.assertIn("glyf", await font.run(Font.get_modified_tables_tags))
+
+    async def test_run(self):
+        filepath = self._get_font_path("/Roboto_Mono/RobotoMono-VariableFont_wght.ttf")
+        font = await AsyncFont.open(filepath)
+        await font.run(Font.to_static, coordinates={"wght": 700})
+        self.assertTrue(await font.run(Font.is_static))
+        self.assertEqual(await font.run(Font.get_weight), font.font.get_weight())
+
+    async def test_run_with_semaphore(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        active = {"count": 0, "max": 0}
+        sleep = self._get_tracked_sleep(active, threading.Lock())
+        semaphore = asyncio.Semaphore(2)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            fonts = [
+                await AsyncFont.open(filepath, executor=executor, semaphore=semaphore)
+                for _ in range(4)
+            ]
+            await asyncio.gather(*[font.run(sleep) for font in fonts])
+        self.assertEqual(active["max"], 2)
+
+    async def test_run_on_same_font_one_at_a_time(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        active = {"count": 0, "max": 0}
+        sleep = self._get_tracked_sleep(active, threading.Lock())
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            font = await AsyncFont.open(
+                filepath, executor=executor, semaphore=asyncio.Semaphore(4)
+            )
+            await asyncio.gather(*[font.run(sleep) for _ in range(3)])
+        self.assertEqual(active["max"], 1)
+
+    async def test_init_with_process_pool_executor(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            with self.assertRaises(ValueError):
+                AsyncFont(Font(filepath), executor=executor)
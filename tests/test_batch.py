@@ -0,0 +1,204 @@
+import logging
+
+import fsutil
+
+from fontbro import Font, batch
+from fontbro.sanitizer import clear_sanitizer_cache
+from tests import AbstractTestCase
+
+
+class BatchTestCase(AbstractTestCase):
+    """
+    Test case for the batch metadata extraction, conversion and sanitization.
+    """
+
+    def _get_filepaths(self):
+        return [
+            self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf"),
+            self._get_font_path("/Roboto_Mono/RobotoMono-VariableFont_wght.ttf"),
+            self._get_font_path("/issues/issue-0050/LeagueGothic-Regular.otf"),
+        ]
+
+    def test_extract_metadata(self):
+        filepaths = self._get_filepaths()
+        results = list(batch.extract_metadata(filepaths))
+        self.assertEqual(
+            [result["filepath"] for result in results],
+            filepaths,
+        )
+        self.assertEqual([result["error"] for result in results], [None, None, None])
+        metadata = results[0]["metadata"]
+        self.assertEqual(list(metadata.keys()), batch.METADATA_FIELDS_DEFAULT)
+        self.assertEqual(metadata["family_name"], "Roboto Mono")
+        self.assertEqual(metadata["style_name"], "Regular")
+        self.assertEqual(metadata["format"], "ttf")
+        self.assertFalse(metadata["is_variable"])
+        self.assertTrue(results[1]["metadata"]["is_variable"])
+        self.assertEqual(results[2]["metadata"]["format"], "otf")
+
+    def test_extract_metadata_with_fields(self):
+        filepaths = self._get_filepaths()
+        results = list(
+            batch.extract_metadata(filepaths, fields=["family_name", "glyphs_count"])
+        )
+        self.assertEqual(
+            results[0]["metadata"],
+            {"family_name": "Roboto Mono", "glyphs_count": 999},
+        )
+
+    def test_extract_metadata_with_invalid_field(self):
+        with self.assertRaises(ValueError):
+            batch.extract_metadata(self._get_filepaths(), fields=["invalid"])
+
+    def test_extract_metadata_with_invalid_file(self):
+        filepaths = self._get_filepaths()
+        filepaths.insert(1, self._get_font_path("/invalid.ttf"))
+        results = list(batch.extract_metadata(filepaths, fields=["family_name"]))
+        self.assertEqual(len(results), 4)
+        self.assertIsNone(results[1]["metadata"])
+        self.assertTrue(results[1]["error"].startswith("FileNotFoundError"))
+        self.assertEqual(
+            [result["metadata"] for result in results[2:]],
+            [{"family_name": "Roboto Mono"}, {"family_name": "League Gothic"}],
+        )
+
+    def test_extract_metadata_with_workers(self):
+        filepaths = self._get_filepaths() * 3
+        filepaths.append(self._get_font_path("/invalid.ttf"))
+        fields = list(batch.METADATA_FIELDS.keys())
+        results = list(
+            batch.extract_metadata(filepaths, fields=fields, workers=2, chunksize=2)
+        )
+        self.assertEqual(
+            results, list(batch.extract_metadata(filepaths, fields=fields))
+        )
+        self.assertEqual([result["filepath"] for result in results], filepaths)
+
+    def test_extract_metadata_with_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            batch.extract_metadata(self._get_filepaths(), workers=0)
+        with self.assertRaises(ValueError):
+            batch.extract_metadata(self._get_filepaths(), workers=2, chunksize=0)
+
+    def test_convert_fonts(self):
+        filepaths = self._get_filepaths()
+        dirpath = self._get_font_temp_path("converted")
+        results = list(batch.convert_fonts(filepaths, dirpath, formats=["woff2"]))
+        self.assertEqual([result["filepath"] for result in results], filepaths)
+        self.assertEqual([result["error"] for result in results], [None, None, None])
+        for result in results:
+            self.assertEqual(list(result["files"].keys()), [Font.FORMAT_WOFF2])
+            with Font(result["files"][Font.FORMAT_WOFF2]) as font:
+                self.assertEqual(font.get_format(), Font.FORMAT_WOFF2)
+
+    def test_convert_fonts_with_workers(self):
+        filepaths = self._get_filepaths()
+        filepaths.insert(1, self._get_font_path("/invalid.ttf"))
+        dirpath = self._get_font_temp_path("converted")
+        results = list(
+            batch.convert_fonts(
+                filepaths,
+                dirpath,
+                formats=["woff2", "woff"],
+                workers=2,
+                woff2_compression_level=1,
+                woff_compression_level=1,
+            )
+        )
+        self.assertEqual([result["filepath"] for result in results], filepaths)
+        self.assertIsNone(results[1]["files"])
+        self.assertTrue(results[1]["error"].startswith("FileNotFoundError"))
+        self.assertEqual(
+            [sorted(result["files"].keys()) for result in results if result["files"]],
+            [[Font.FORMAT_WOFF, Font.FORMAT_WOFF2]] * 3,
+        )
+
+    def test_convert_fonts_with_invalid_arguments(self):
+        dirpath = self._get_font_temp_path("converted")
+        with self.assertRaises(ValueError):
+            batch.convert_fonts(self._get_filepaths(), dirpath, formats=["eot"])
+        with self.assertRaises(ValueError):
+            batch.convert_fonts(
+                self._get_filepaths(), dirpath, woff2_compression_level=12
+            )
+        with self.assertRaises(ValueError):
+            batch.convert_fonts(self._get_filepaths(), dirpath, workers=0)
+
+    def _get_sanitize_fonts(self):
+        ots_fonts_dir = fsutil.join_path(__file__, "fonts-ots/bad")
+        return [
+            self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf"),
+            # rejected by the sanitizer
+            Font(f"{ots_fonts_dir}/0014256514b220c525e98840b0d6ba736a85acbd.ttf"),
+            # can't be serialized
+            Font(f"{ots_fonts_dir}/013d9956e40d1ea194c4d7817fbf220d6be9c33b.ttf"),
+            self._get_font("/issues/issue-0050/LeagueGothic-Regular.otf"),
+        ]
+
+    def test_sanitize_many(self):
+        clear_sanitizer_cache()
+        fonts = self._get_sanitize_fonts()
+        logging.disable(logging.CRITICAL)
+        try:
+            results = batch.sanitize_many(fonts)
+        finally:
+            logging.disable(logging.NOTSET)
+        self.assertEqual([result["font"] for result in results], fonts)
+        self.assertEqual(
+            [result["cached"] for result in results], [False, False, False, False]
+        )
+        self.assertEqual(results[0]["hash"], fonts[0]._get_binary_hash())
+        self.assertIsNone(results[0]["error"])
+        self.assertIsNone(results[0]["warnings"])
+        self.assertTrue(
+            results[1]["error"].startswith(
+                "OpenType Sanitizer returned non-zero exit code (1)"
+            )
+        )
+        self.assertIsNone(results[2]["hash"])
+        self.assertTrue(results[2]["error"].startswith("AssertionError"))
+        self.assertIsNone(results[3]["error"])
+
+    def test_sanitize_many_with_cache(self):
+        clear_sanitizer_cache()
+        fonts = self._get_sanitize_fonts()[:2]
+        results = batch.sanitize_many(fonts)
+        self.assertEqual([result["cached"] for result in results], [False, False])
+        results_cached = batch.sanitize_many(fonts + [fonts[0].clone()])
+        self.assertEqual(
+            [result["cached"] for result in results_cached], [True, True, True]
+        )
+        self.assertEqual(
+            [result["error"] for result in results_cached],
+            [result["error"] for result in results] + [None],
+        )
+        # modified fonts are sanitized again
+        fonts[0].set_name(Font.NAME_FAMILY_NAME, "Roboto Mono Sanitized")
+        results_modified = batch.sanitize_many(fonts)
+        self.assertEqual(
+            [result["cached"] for result in results_modified], [False, True]
+        )
+        self.assertIsNone(results_modified[0]["error"])
+
+    def test_sanitize_many_with_duplicate_fonts(self):
+        clear_sanitizer_cache()
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        results = batch.sanitize_many([font, font.clone()], workers=2)
+        self.assertEqual([result["cached"] for result in results], [False, True])
+        self.assertEqual(results[0]["hash"], results[1]["hash"])
+
+    def test_sanitize_many_with_workers(self):
+        fonts = self._get_sanitize_fonts()
+        logging.disable(logging.CRITICAL)
+        try:
+            clear_sanitizer_cache()
+            results = batch.sanitize_many(fonts)
+            clear_sanitizer_cache()
+            results_with_workers = batch.sanitize_many(fonts, workers=4)
+        finally:
+            logging.disable(logging.NOTSET)
+        self.assertEqual(results_with_workers, results)
+
+    def test_sanitize_many_with_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            batch.sanitize_many(self._get_sanitize_fonts(), workers=0)
@@ -30,6 +30,28 @@ class CharactersTestCase(AbstractTestCase):
         self.assertEqual(len(chars_list), 875)
         self.assertTrue(all(key in chars_list[0] for key in expected_keys))
 
+    def test_get_characters_with_fields(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        chars_list = list(font.get_characters(fields=["code", "character_name"]))
+        self.assertEqual(len(chars_list), 875)
+        self.assertEqual(chars_list[33], {"code": 65, "character_name": "A"})
+        chars_list = list(
+            font.get_characters(ignore_blank=True, fields=["unicode_script_tag"])
+        )
+        self.assertEqual(len(chars_list), 861)
+        self.assertEqual(chars_list[32], {"unicode_script_tag": "Latn"})
+
+    def test_get_characters_with_all_fields(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        chars_list = list(font.get_characters())
+        fields = list(chars_list[0].keys())
+        self.assertEqual(list(font.get_characters(fields=fields)), chars_list)
+
+    def test_get_characters_with_invalid_fields(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        with self.assertRaises(ValueError):
+            list(font.get_characters(fields=["code", "invalid"]))
+
     def test_get_characters_count(self):
         font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
         chars_count = font.get_characters_count()
@@ -39,3 +61,59 @@ class CharactersTestCase(AbstractTestCase):
         font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
         chars_count = font.get_characters_count(ignore_blank=True)
         self.assertEqual(chars_count, 861)
+
+    def test_get_characters_count_with_ignore_blank_and_cff_font(self):
+        font = self._get_font("/issues/issue-0050/LeagueGothic-Regular.otf")
+        self.assertEqual(font.get_characters_count(), 323)
+        self.assertEqual(font.get_characters_count(ignore_blank=True), 322)
+        chars = font.get_characters(ignore_blank=True)
+        self.assertFalse(" " in [char["character"] for char in chars])
+
+    def test_get_characters_count_with_ignore_blank_and_modified_glyphs(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        glyph_name = font.get_ttfont().getBestCmap()[ord("A")]
+        font.get_ttfont()["glyf"][glyph_name].numberOfContours = 0
+        self.assertEqual(font.get_characters_count(), 875)
+        self.assertEqual(font.get_characters_count(ignore_blank=True), 860)
+
+    def test_get_characters_is_cached(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        chars_list = list(font.get_characters())
+        chars_list[0]["character"] = "modified"
+        self.assertEqual(list(font.get_characters()), list(font.get_characters()))
+        self.assertNotEqual(next(font.get_characters())["character"], "modified")
+
+    def test_get_characters_cache_invalidated_after_subset(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        self.assertEqual(font.get_characters_count(), 875)
+        font.subset(unicodes="0041-005A")
+        chars_list = list(font.get_characters())
+        self.assertEqual(len(chars_list), 26)
+        self.assertEqual(chars_list[0]["unicode_block_name"], "Basic Latin")
+        self.assertEqual(chars_list[0]["unicode_script_tag"], "Latn")
+        self.assertEqual(chars_list[0]["unicode_script_name"], "Latin")
+
+    def test_get_characters_cache_invalidated_after_cmap_remap(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        characters = {char["code"]: char for char in font.get_characters()}
+        self.assertEqual(characters[65]["character_name"], "A")
+        # same size in-place remap of the cmap dict
+        cmap = font.get_ttfont().getBestCmap()
+        cmap[65] = "B"
+        characters = {char["code"]: char for char in font.get_characters()}
+        self.assertEqual(characters[65]["character_name"], "B")
+        del cmap[66]
+        cmap[0x2603] = "B"
+        codes = [char["code"] for char in font.get_characters()]
+        self.assertNotIn(66, codes)
+        self.assertIn(0x2603, codes)
+        self.assertEqual(font.get_characters_count(), 875)
+
+    def test_get_characters_cache_invalidated_after_set_modified(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        characters = {char["code"]: char for char in font.get_characters()}
+        self.assertEqual(characters[65]["character_name"], "A")
+        font.get_ttfont().getBestCmap()[65] = "B"
+        font.set_modified(["cmap"])
+        characters = {char["code"]: char for char in font.get_characters()}
+        self.assertEqual(characters[65]["character_name"], "B")
@@ -1,4 +1,5 @@
 from fontbro import Font
+from fontbro.readers import TablesReader
 from tests import AbstractTestCase
 
 
@@ -60,3 +61,48 @@ class CloneTestCase(AbstractTestCase):
             "NotoSansTCCustom",
         )
         self.assertEqual(font_clone._filepath, filepath)
+
+    def test_clone_is_isolated_from_source_changes(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        characters_count = font.get_characters_count()
+        font_clone = font.clone()
+        font_clone.set_name(Font.NAME_FAMILY_NAME, "Roboto Mono Clone")
+        font_clone.subset(unicodes="0041-005A")
+        self.assertEqual(font.get_name(Font.NAME_FAMILY_NAME), "Roboto Mono")
+        self.assertEqual(font.get_characters_count(), characters_count)
+        self.assertEqual(font_clone.get_characters_count(), 26)
+
+    def test_clone_shares_unmodified_tables_data(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        font_clone1 = font.clone()
+        font_clone1.set_name(Font.NAME_FAMILY_NAME, "Roboto Mono Clone")
+        font_clone2 = font_clone1.clone()
+        reader1 = font_clone1.get_ttfont().reader
+        reader2 = font_clone2.get_ttfont().reader
+        self.assertIs(reader1["glyf"], reader2["glyf"])
+        self.assertEqual(font_clone1.get_loaded_tables_tags(), ["name"])
+        self.assertEqual(font_clone2.get_loaded_tables_tags(), [])
+        self.assertEqual(
+            font_clone2.get_name(Font.NAME_FAMILY_NAME), "Roboto Mono Clone"
+        )
+
+    def test_clone_save(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        font.rename(family_name="Roboto Mono Clone")
+        font_clone = font.clone().clone()
+        filepath = font_clone.save(self._get_font_temp_path("RobotoMonoClone.ttf"))
+        with Font(filepath) as font_saved:
+            self.assertEqual(font_saved.get_family_name(), "Roboto Mono Clone")
+            self.assertEqual(font_saved.get_characters_count(ignore_blank=True), 861)
+
+    def test_fonts_opened_by_same_tables_reader_are_isolated(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        tables_reader = TablesReader.from_ttfont(font.get_ttfont())
+        font_a = Font(tables_reader)
+        font_b = Font(tables_reader)
+        self.assertIsNot(font_a.get_ttfont().reader, font_b.get_ttfont().reader)
+        del font_a.get_ttfont()["post"]
+        self.assertNotIn("post", font_a.get_ttfont())
+        self.assertIn("post", font_b.get_ttfont())
+        self.assertIn("post", tables_reader)
+        self.assertIn("post", Font(tables_reader).get_ttfont())
@@ -1,3 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import fsutil
+
+from fontbro import Font
+from fontbro.fingerprints import (
+    FingerprintCache,
+    FingerprintIndex,
+    SQLiteFingerprintCache,
+)
 from tests import AbstractTestCase
 
 
@@ -119,3 +129,166 @@ class FingerprintTestCase(AbstractTestCase):
         font_b = None
         with self.assertRaises(ValueError):
             font_a.get_fingerprint_match(other=font_b, tolerance=10)
+
+    def test_get_fingerprint_with_cache(self):
+        cache = FingerprintCache()
+        font = self._get_static_font()
+        hash = font.get_fingerprint(cache=cache)
+        self.assertEqual(cache.get_stats(), {"hits": 0, "misses": 1, "size": 1})
+        # same content loaded in another font instance
+        cached_hash = self._get_static_font().get_fingerprint(cache=cache)
+        self.assertEqual(cache.get_stats(), {"hits": 1, "misses": 1, "size": 1})
+        self.assertEqual(hash, cached_hash)
+        self.assertEqual(hash, font.get_fingerprint())
+        # different text
+        font.get_fingerprint(text="Hello World", cache=cache)
+        self.assertEqual(cache.get_stats(), {"hits": 1, "misses": 2, "size": 2})
+
+    def test_get_fingerprint_with_cache_after_font_modified(self):
+        cache = FingerprintCache()
+        font = self._get_static_font()
+        font.get_fingerprint(cache=cache)
+        font.subset(text="ABC")
+        font.get_fingerprint(cache=cache)
+        self.assertEqual(cache.get_stats(), {"hits": 0, "misses": 2, "size": 2})
+
+    def test_get_fingerprint_match_with_cache(self):
+        cache = FingerprintCache()
+        font_a = self._get_variable_font()
+        font_b = self._get_static_font()
+        result = font_a.get_fingerprint_match(other=font_b, cache=cache)
+        self.assertEqual(cache.misses, 2)
+        cached_result = font_a.get_fingerprint_match(other=font_b, cache=cache)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(result, cached_result)
+
+    def test_fingerprint_cache_maxsize(self):
+        cache = FingerprintCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        cache.clear()
+        self.assertEqual(cache.get_stats(), {"hits": 0, "misses": 0, "size": 0})
+        with self.assertRaises(ValueError):
+            FingerprintCache(maxsize=0)
+
+    def test_sqlite_fingerprint_cache(self):
+        fsutil.make_dirs(self._get_font_temp_path())
+        filepath = self._get_font_temp_path("fingerprints.sqlite")
+        with SQLiteFingerprintCache(filepath) as cache:
+            hash = self._get_static_font().get_fingerprint(cache=cache)
+            self.assertEqual(cache.misses, 1)
+        with SQLiteFingerprintCache(filepath) as cache:
+            cached_hash = self._get_static_font().get_fingerprint(cache=cache)
+            self.assertEqual(cache.get_stats(), {"hits": 1, "misses": 0, "size": 1})
+            self.assertEqual(hash, cached_hash)
+            cache.clear()
+        with SQLiteFingerprintCache(filepath) as cache:
+            self._get_static_font().get_fingerprint(cache=cache)
+            self.assertEqual(cache.misses, 1)
+
+    def test_sqlite_fingerprint_cache_in_worker_threads(self):
+        fsutil.make_dirs(self._get_font_temp_path())
+        filepath = self._get_font_temp_path("fingerprints.sqlite")
+        fonts_paths = [
+            "/Tourney/static/Tourney/Tourney-Regular.ttf",
+            "/Tourney/static/Tourney/Tourney-Medium.ttf",
+            "/Roboto_Mono/static/RobotoMono-Regular.ttf",
+        ]
+
+        def get_fingerprint(font_path):
+            with self._get_font(font_path) as font:
+                return font.get_fingerprint(cache=cache)
+
+        with SQLiteFingerprintCache(filepath) as cache:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                hashes = list(executor.map(get_fingerprint, fonts_paths * 2))
+            self.assertEqual(hashes[:3], hashes[3:])
+            self.assertEqual(cache.hits + cache.misses, 6)
+        with SQLiteFingerprintCache(filepath) as cache:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(get_fingerprint, fonts_paths[0]).result()
+                executor.submit(cache.clear).result()
+            self.assertEqual(cache.get_stats(), {"hits": 0, "misses": 0, "size": 0})
+
+    def test_fingerprint_index_search(self):
+        index = FingerprintIndex()
+        static_filepath = self._get_font_path(
+            "/Tourney/static/Tourney/Tourney-Regular.ttf"
+        )
+        other_filepath = self._get_font_path(
+            "/Roboto_Mono/static/RobotoMono-Regular.ttf"
+        )
+        variable_filepath = self._get_font_path(
+            "/Tourney/Tourney-VariableFont_wdth,wght.ttf"
+        )
+        index.add(static_filepath, self._get_static_font())
+        index.add(variable_filepath, self._get_variable_font())
+        index.add_hash(other_filepath, Font(other_filepath).get_fingerprint())
+        self.assertEqual(len(index), 3)
+        results = index.search(self._get_static_font())
+        self.assertEqual(results, [{"key": static_filepath, "diff": 0}])
+        results = index.search(self._get_variable_font())
+        self.assertEqual(results, [{"key": variable_filepath, "diff": 0}])
+        # hash search doesn't filter by static/variable
+        hash = self._get_static_font().get_fingerprint()
+        results = index.search(hash, tolerance=4096)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0], {"key": static_filepath, "diff": 0})
+        diffs = [result["diff"] for result in results]
+        self.assertEqual(diffs, sorted(diffs))
+        font_a = self._get_static_font()
+        font_b = Font(other_filepath)
+        _, diff, _, _ = font_a.get_fingerprint_match(other=font_b)
+        self.assertIn({"key": other_filepath, "diff": diff}, results)
+
+    def test_fingerprint_index_search_empty(self):
+        index = FingerprintIndex()
+        self.assertEqual(index.search(self._get_static_font()), [])
+
+    def test_fingerprint_index_add_filepaths(self):
+        filepaths = [
+            self._get_font_path("/Tourney/static/Tourney/Tourney-Regular.ttf"),
+            self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf"),
+            self._get_font_path("/Roboto_Mono/static/RobotoMono-Bold.ttf"),
+            self._get_font_path("/not-found.ttf"),
+        ]
+        index = FingerprintIndex()
+        errors = index.add_filepaths(filepaths)
+        self.assertEqual(len(index), 3)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0]["filepath"], filepaths[3])
+        results = index.search(self._get_static_font())
+        self.assertEqual(results[0], {"key": filepaths[0], "diff": 0})
+        # parallel insertion gives the same results
+        index_parallel = FingerprintIndex()
+        errors = index_parallel.add_filepaths(filepaths, workers=2, chunksize=1)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(index_parallel.search(self._get_static_font()), results)
+        with self.assertRaises(ValueError):
+            index.add_filepaths(filepaths, workers=0)
+
+    def test_fingerprint_index_save_and_load(self):
+        fsutil.make_dirs(self._get_font_temp_path())
+        filepath = self._get_font_temp_path("fingerprints.npz")
+        index = FingerprintIndex(text="Hello World")
+        index.add("static", self._get_static_font())
+        index.add("variable", self._get_variable_font())
+        index.save(filepath)
+        index_loaded = FingerprintIndex.load(filepath)
+        self.assertEqual(index_loaded.text, "Hello World")
+        self.assertEqual(len(index_loaded), 2)
+        font = self._get_variable_font()
+        self.assertEqual(index_loaded.search(font), [{"key": "variable", "diff": 0}])
+        index_loaded.add("static copy", self._get_static_font())
+        results = index_loaded.search(self._get_static_font())
+        self.assertEqual(
+            [result["key"] for result in results], ["static", "static copy"]
+        )
+        # empty index
+        FingerprintIndex().save(filepath)
+        self.assertEqual(len(FingerprintIndex.load(filepath)), 0)
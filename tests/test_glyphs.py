@@ -1,3 +1,4 @@
+from fontbro.glyphs import GlyphGraph
 from tests import AbstractTestCase
 
 
@@ -25,3 +26,80 @@ class GlyphsTestCase(AbstractTestCase):
             self.assertEqual(glyphs_count, 999)
             characters_count = font.get_characters_count()
             self.assertTrue(glyphs_count > characters_count)
+
+    def test_get_glyphs_with_cff_font(self):
+        with self._get_font("/issues/issue-0050/LeagueGothic-Regular.otf") as font:
+            glyphs = list(font.get_glyphs())
+            self.assertEqual(len(glyphs), font.get_glyphs_count())
+            self.assertEqual(
+                glyphs[0],
+                {"name": ".notdef", "components_names": []},
+            )
+
+    def test_get_glyph_graph(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            graph = font.get_glyph_graph()
+            self.assertEqual(len(graph), 999)
+            self.assertIn("acute", graph)
+            self.assertEqual(graph.get_components("colon"), ["period", "period"])
+            self.assertEqual(graph.get_components("A"), [])
+            self.assertEqual(
+                graph.get_dependents("period"),
+                ["colon", "semicolon", "ellipsis", "uni2025"],
+            )
+            self.assertIn("Aacute", graph.get_dependents("acute"))
+            self.assertEqual(graph.get_all_components("Aacute"), ["A", "acute"])
+            all_dependents = graph.get_all_dependents("acute")
+            self.assertEqual(len(all_dependents), 52)
+            self.assertEqual(len(all_dependents), len(set(all_dependents)))
+            with self.assertRaises(ValueError):
+                graph.get_components("not-found")
+
+    def test_get_glyph_graph_is_cached(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            graph = font.get_glyph_graph()
+            self.assertIs(font.get_glyph_graph(), graph)
+            font.subset(unicodes="0041-005A")
+            graph_subset = font.get_glyph_graph()
+            self.assertIsNot(graph_subset, graph)
+            self.assertNotIn("acute", graph_subset)
+
+    def test_get_glyph_graph_with_cff_seac_components(self):
+        with self._get_font("/issues/issue-0050/LeagueGothic-Regular.otf") as font:
+            charstrings = font.get_ttfont()["CFF "].cff.topDictIndex[0].CharStrings
+            # accented glyph composed with the (deprecated) seac operator,
+            # 65 and 194 are the 'A' and 'acute' standard encoding codes
+            charstring = charstrings["Aacute"]
+            charstring.decompile()
+            charstring.program = [0, 200, 65, 194, "endchar"]
+            graph = font.get_glyph_graph()
+            self.assertEqual(graph.get_components("Aacute"), ["A", "acute"])
+            self.assertEqual(graph.get_dependents("acute"), ["Aacute"])
+
+    def test_glyph_graph_transitive_queries(self):
+        graph = GlyphGraph(
+            {
+                "a": [],
+                "acute": [],
+                "aacute": ["a", "acute"],
+                "aacute.alt": ["aacute"],
+                "aacute.ss01": ["aacute.alt", "acute"],
+                # malformed cyclic composition
+                "x": ["y"],
+                "y": ["x"],
+            }
+        )
+        self.assertEqual(graph.get_dependents("acute"), ["aacute", "aacute.ss01"])
+        self.assertEqual(
+            graph.get_all_dependents("acute"),
+            ["aacute", "aacute.alt", "aacute.ss01"],
+        )
+        self.assertEqual(
+            graph.get_all_components("aacute.ss01"),
+            ["aacute.alt", "aacute", "a", "acute"],
+        )
+        self.assertEqual(graph.get_all_components("x"), ["y"])
+        self.assertEqual(graph.get_all_dependents("x"), ["y"])
+        # results are memoized but returned as copies
+        graph.get_all_dependents("acute").clear()
+        self.assertEqual(len(graph.get_all_dependents("acute")), 3)
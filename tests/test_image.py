@@ -1,3 +1,7 @@
+import unittest
+
+from PIL import features as pillow_features
+
 from tests import AbstractTestCase
 
 
@@ -16,3 +20,137 @@ class ImageTestCase(AbstractTestCase):
         )
         # image.show()
         image.close()
+
+    def test_get_image_with_cached_image_font(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        image1 = font.get_image(text="Hello World!", size=48)
+        image2 = font.get_image(text="Hello World!", size=48)
+        self.assertEqual(image1.size, image2.size)
+        self.assertEqual(image1.tobytes(), image2.tobytes())
+        self.assertIs(font._get_image_font(48), font._get_image_font(48))
+        self.assertIsNot(font._get_image_font(48), font._get_image_font(24))
+
+    def test_get_image_after_font_modified(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        image = font.get_image(text="Hello World!", size=48)
+        image_font = font._get_image_font(48)
+        self.assertEqual(image_font.getname(), ("Roboto Mono", "Regular"))
+        font.rename(family_name="Roboto Mono Modified")
+        image_font_modified = font._get_image_font(48)
+        self.assertIsNot(image_font, image_font_modified)
+        self.assertEqual(
+            image_font_modified.getname(), ("Roboto Mono Modified", "Regular")
+        )
+        font.subset(text="Hello")
+        image_subset = font.get_image(text="Hello World!", size=48)
+        self.assertNotEqual(image.tobytes(), image_subset.tobytes())
+
+    def test_get_image_after_ttfont_modified_directly(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        font.get_family_name()
+        image_font = font._get_image_font(48)
+        self.assertEqual(image_font.getname(), ("Roboto Mono", "Regular"))
+        # changes made directly on the TTFont instance, without set_modified
+        name_table = font.get_ttfont()["name"]
+        name_table.setName("Roboto Mono Direct", 1, 3, 1, 0x409)
+        image_font_modified = font._get_image_font(48)
+        self.assertIsNot(image_font, image_font_modified)
+        self.assertEqual(
+            image_font_modified.getname(), ("Roboto Mono Direct", "Regular")
+        )
+
+    def test_get_image_fonts_share_binary_data(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        binary_data = font._get_binary_data()
+        for size in [12, 24, 48]:
+            self.assertIs(font._get_image_font(size).font_bytes, binary_data)
+
+    @unittest.skipUnless(pillow_features.check_feature("raqm"), "raqm not available")
+    def test_get_image_with_shaping(self):
+        font = self._get_font("/Open_Sans/static/OpenSans-Bold.ttf")
+        image = font.get_image(text="ffi", size=48, shaping=True)
+        image_no_liga = font.get_image(
+            text="ffi", size=48, shaping=True, features={"liga": False}
+        )
+        self.assertNotEqual(image.tobytes(), image_no_liga.tobytes())
+
+    @unittest.skipIf(pillow_features.check_feature("raqm"), "raqm available")
+    def test_get_image_with_shaping_not_available(self):
+        font = self._get_font("/Open_Sans/static/OpenSans-Bold.ttf")
+        with self.assertRaises(TypeError):
+            font.get_image(text="ffi", size=48, shaping=True)
+
+    def test_get_image_with_features_without_shaping(self):
+        font = self._get_font("/Open_Sans/static/OpenSans-Bold.ttf")
+        with self.assertRaises(ValueError):
+            font.get_image(text="ffi", size=48, features={"liga": False})
+
+    def test_get_images(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        specs = [
+            {"text": text, "size": size}
+            for text in ["Hello World!", "Aa"]
+            for size in [48, 16, 24]
+        ]
+        specs.append({"text": "Hello", "size": 16, "color": (255, 0, 0, 255)})
+        images = font.get_images(specs)
+        self.assertEqual(len(images), len(specs))
+        for spec, image in zip(specs, images, strict=True):
+            expected_image = font.get_image(**spec)
+            self.assertEqual(image.size, expected_image.size)
+            self.assertEqual(image.tobytes(), expected_image.tobytes())
+
+    def test_get_images_with_invalid_specs(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        with self.assertRaises(ValueError):
+            font.get_images([{"text": "Hello"}])
+        with self.assertRaises(ValueError):
+            font.get_images([{"text": "Hello", "size": 16, "invalid": True}])
+
+    def test_get_images_sprite(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        specs = [
+            {"text": "Hello World!", "size": 48},
+            {"text": "Hello World!", "size": 16},
+            {"text": "Aa", "size": 24},
+        ]
+        images = font.get_images(specs)
+        sprite, offsets = font.get_images_sprite(specs, padding=10)
+        self.assertEqual(len(offsets), 3)
+        self.assertEqual(sprite.width, max(image.width for image in images))
+        self.assertEqual(sprite.height, sum(image.height for image in images) + 10 * 2)
+        for image, offset in zip(images, offsets, strict=True):
+            self.assertEqual(offset["width"], image.width)
+            self.assertEqual(offset["height"], image.height)
+            box = (
+                offset["x"],
+                offset["y"],
+                offset["x"] + offset["width"],
+                offset["y"] + offset["height"],
+            )
+            self.assertEqual(sprite.crop(box).tobytes(), image.tobytes())
+        with self.assertRaises(ValueError):
+            font.get_images_sprite(specs, padding=-1)
+
+    def test_get_image_with_coordinates(self):
+        font = self._get_font("/Roboto_Mono/RobotoMono-VariableFont_wght.ttf")
+        image_default = font.get_image(text="Hello", size=48)
+        image = font.get_image(text="Hello", size=48, coordinates={"wght": 700})
+        self.assertNotEqual(image.tobytes(), image_default.tobytes())
+        # same rendering of the instanced font
+        static_font = font.clone()
+        static_font.to_static(coordinates={"wght": 700})
+        static_image = static_font.get_image(text="Hello", size=48)
+        self.assertEqual(image.size, static_image.size)
+        self.assertEqual(image.tobytes(), static_image.tobytes())
+        # the cached Pillow font is reset to default coordinates
+        image = font.get_image(text="Hello", size=48)
+        self.assertEqual(image.tobytes(), image_default.tobytes())
+
+    def test_get_image_with_invalid_coordinates(self):
+        font = self._get_font("/Roboto_Mono/RobotoMono-VariableFont_wght.ttf")
+        with self.assertRaises(ValueError):
+            font.get_image(text="Hello", size=48, coordinates={"wdth": 100})
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        with self.assertRaises(TypeError):
+            font.get_image(text="Hello", size=48, coordinates={"wght": 700})
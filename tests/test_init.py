@@ -1,6 +1,9 @@
+import mmap
 from io import BytesIO
 from pathlib import Path
+from unittest import mock
 
+import fsutil
 from fontTools.ttLib import TTFont
 
 from fontbro import Font
@@ -58,3 +61,87 @@ class InitTestCase(AbstractTestCase):
         filepath = self._get_font_path("/Noto_Sans_TC/NotoSansTC-Regular.otf")
         font1 = Font(filepath)
         Font(font1)
+
+    def test_init_with_bytes(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        data = Path(filepath).read_bytes()
+        for buffer in [data, bytearray(data), memoryview(data)]:
+            with self.subTest(buffer_type=type(buffer).__name__):
+                with Font(buffer) as font:
+                    self.assertEqual(font.get_family_name(), "Roboto Mono")
+                    self.assertEqual(font.get_characters_count(), 875)
+
+    def test_init_with_bytes_but_invalid_font_data(self):
+        with self.assertRaises(ValueError):
+            Font(b"")
+        with self.assertRaises(ValueError):
+            Font(b"invalid font data")
+
+    def test_from_bytes(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        data = Path(filepath).read_bytes()
+        with Font.from_bytes(data) as font:
+            self.assertEqual(font.get_family_name(), "Roboto Mono")
+            self.assertEqual(font.get_loaded_tables_tags(), ["name"])
+
+    def test_from_bytes_with_mmap(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        with open(filepath, "rb") as fh:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                font = Font.from_bytes(buffer)
+                self.assertEqual(font.get_family_name(), "Roboto Mono")
+                font.close()
+
+    def test_from_bytes_with_invalid_buffer_type(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        with self.assertRaises(ValueError):
+            Font.from_bytes(filepath)
+
+    def test_from_mmap(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        with Font.from_mmap(filepath) as font:
+            self.assertEqual(font.get_family_name(), "Roboto Mono")
+            self.assertEqual(font.get_characters_count(ignore_blank=True), 861)
+            self.assertEqual(f"{font}", f"Font('{filepath}')")
+
+    def test_from_mmap_and_save_overwriting_source_file(self):
+        filepath = self._get_font_temp_path("RobotoMono-Regular.ttf")
+        fsutil.copy_file(
+            self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf"),
+            filepath,
+        )
+        font = Font.from_mmap(filepath)
+        font.set_name(Font.NAME_FAMILY_NAME, "Roboto Mono Mapped")
+        font.save(overwrite=True)
+        self.assertEqual(font.get_characters_count(ignore_blank=True), 861)
+        font.close()
+        with Font(filepath) as font:
+            self.assertEqual(font.get_name(Font.NAME_FAMILY_NAME), "Roboto Mono Mapped")
+
+    def test_from_mmap_close(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        with Font.from_mmap(filepath) as font:
+            buffer = font._mmap
+            self.assertFalse(buffer.closed)
+        self.assertTrue(buffer.closed)
+
+    def test_from_mmap_with_invalid_font_data(self):
+        filepath = self._get_font_temp_path("invalid.ttf")
+        fsutil.write_file(filepath, "invalid font data")
+        buffers = []
+
+        class TrackedMmap(mmap.mmap):
+            def __init__(self, *args, **kwargs):
+                super().__init__()
+                buffers.append(self)
+
+        with mock.patch("mmap.mmap", TrackedMmap):
+            with self.assertRaises(ValueError):
+                Font.from_mmap(filepath)
+        self.assertEqual(len(buffers), 1)
+        self.assertTrue(buffers[0].closed)
+
+    def test_from_mmap_with_invalid_font_file(self):
+        with self.assertRaises(ValueError):
+            filepath = self._get_font_path("/Noto_Sans_TC/OFL.txt")
+            Font.from_mmap(filepath)
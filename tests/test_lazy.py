@@ -0,0 +1,80 @@
+import gc
+import warnings
+
+import fsutil
+
+from fontbro import Font
+from tests import AbstractTestCase
+
+
+class LazyTestCase(AbstractTestCase):
+    """
+    Test case for the lazy (table-on-demand) loading of fonts.
+    """
+
+    def test_init_with_filepath_is_lazy(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            self.assertTrue(font.get_ttfont().lazy)
+            self.assertEqual(font.get_loaded_tables_tags(), [])
+
+    def test_init_with_filepath_and_lazy_option(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        with Font(filepath, lazy=None) as font:
+            self.assertIsNone(font.get_ttfont().lazy)
+
+    def test_get_loaded_tables_tags(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            font.get_format()
+            font.is_variable()
+            self.assertEqual(font.get_loaded_tables_tags(), [])
+            font.get_family_name()
+            self.assertEqual(font.get_loaded_tables_tags(), ["name"])
+            font.get_weight()
+            font.get_version()
+            self.assertEqual(font.get_loaded_tables_tags(), ["OS/2", "head", "name"])
+
+    def test_get_loaded_tables_tags_without_glyphs_tables(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            font.get_characters_count()
+            font.get_glyphs_count()
+            loaded_tables_tags = font.get_loaded_tables_tags()
+            self.assertFalse("glyf" in loaded_tables_tags)
+            self.assertFalse("GPOS" in loaded_tables_tags)
+            font.get_characters_count(ignore_blank=True)
+            loaded_tables_tags = font.get_loaded_tables_tags()
+            self.assertTrue("glyf" in loaded_tables_tags)
+
+    def test_save_overwriting_source_file(self):
+        filepath = self._get_font_temp_path("RobotoMono-Regular.ttf")
+        fsutil.copy_file(
+            self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf"),
+            filepath,
+        )
+        font = Font(filepath)
+        font.set_name(Font.NAME_FAMILY_NAME, "Roboto Mono Lazy")
+        font.save(overwrite=True)
+        self.assertEqual(font.get_characters_count(ignore_blank=True), 861)
+        font.close()
+        with Font(filepath) as font:
+            self.assertEqual(font.get_name(Font.NAME_FAMILY_NAME), "Roboto Mono Lazy")
+            self.assertEqual(font.get_characters_count(ignore_blank=True), 861)
+
+    def test_close_closes_source_file(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            source_file = font.get_ttfont().reader.file
+            self.assertFalse(source_file.closed)
+        self.assertTrue(source_file.closed)
+
+    def test_get_fingerprint_match_with_filepath_closes_other_font(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            # collect fonts left open by other tests before recording warnings
+            gc.collect()
+            with warnings.catch_warnings(record=True) as records:
+                warnings.simplefilter("always", ResourceWarning)
+                match, _, _, _ = font.get_fingerprint_match(other=filepath)
+                gc.collect()
+        self.assertTrue(match)
+        self.assertFalse(
+            [record for record in records if record.category is ResourceWarning]
+        )
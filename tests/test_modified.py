@@ -0,0 +1,82 @@
+from fontbro import Font
+from tests import AbstractTestCase
+
+
+class ModifiedTestCase(AbstractTestCase):
+    """
+    Test case for the tracking of the tables modified since the font has been opened.
+    """
+
+    def test_get_modified_tables_tags_with_unmodified_font(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            font.get_family_name()
+            font.get_weight()
+            font.get_characters_count()
+            self.assertEqual(font.get_modified_tables_tags(), [])
+            self.assertFalse(font.is_modified())
+
+    def test_get_modified_tables_tags_after_set_name(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            font.set_name(Font.NAME_FAMILY_NAME, "Roboto Mono Custom")
+            self.assertEqual(font.get_modified_tables_tags(), ["name"])
+            self.assertTrue(font.is_modified())
+
+    def test_get_modified_tables_tags_after_set_style_flags(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            font.set_style_flags(bold=True)
+            self.assertEqual(font.get_modified_tables_tags(), ["OS/2", "head"])
+
+    def test_get_modified_tables_tags_after_set_vertical_metrics(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            font.set_vertical_metrics(ascent=1000, typo_ascender=1000)
+            self.assertEqual(font.get_modified_tables_tags(), ["OS/2", "hhea"])
+
+    def test_get_modified_tables_tags_after_subset(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            tables_tags = sorted(font.get_ttfont().keys())
+            tables_tags.remove("GlyphOrder")
+            font.subset(unicodes="0041-005A")
+            self.assertEqual(font.get_modified_tables_tags(), tables_tags)
+
+    def test_get_modified_tables_tags_after_to_static(self):
+        with self._get_font("/Roboto_Mono/RobotoMono-VariableFont_wght.ttf") as font:
+            font.to_static(coordinates={"wght": 700})
+            modified_tables_tags = font.get_modified_tables_tags()
+            self.assertIn("STAT", modified_tables_tags)
+            self.assertIn("fvar", modified_tables_tags)
+            self.assertIn("glyf", modified_tables_tags)
+
+    def test_get_modified_tables_tags_with_table_removed_from_ttfont(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            del font.get_ttfont()["OS/2"]
+            self.assertEqual(font.get_modified_tables_tags(), ["OS/2"])
+
+    def test_set_modified(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            font.get_ttfont()["OS/2"].usWeightClass = 700
+            self.assertFalse(font.is_modified())
+            font.set_modified(["OS/2"])
+            self.assertEqual(font.get_modified_tables_tags(), ["OS/2"])
+            font.set_modified()
+            self.assertIn("glyf", font.get_modified_tables_tags())
+
+    def test_set_modified_invalidates_binary_cache(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            font.get_image(text="Hello", size=24)
+            self.assertTrue(font._image_fonts)
+            font.set_modified(["glyf"])
+            self.assertFalse(font._image_fonts)
+
+    def test_ttfont_modified_directly_invalidates_binary_cache(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            font.get_weight()
+            binary_hash = font._get_binary_hash()
+            self.assertEqual(font._get_binary_hash(), binary_hash)
+            font.get_ttfont()["OS/2"].usWeightClass = 700
+            self.assertNotEqual(font._get_binary_hash(), binary_hash)
+
+    def test_clone_keeps_modified_tables_tags(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            font.set_name(Font.NAME_FAMILY_NAME, "Roboto Mono Custom")
+            with font.clone() as font_clone:
+                self.assertEqual(font_clone.get_modified_tables_tags(), ["name"])
@@ -1,3 +1,8 @@
+import struct
+
+from fontTools.ttLib.sfnt import SFNTReader
+
+from fontbro import Font
 from tests import AbstractTestCase
 
 
@@ -6,6 +11,14 @@ class MonospaceTestCase(AbstractTestCase):
     This class describes a monospace test case.
     """
 
+    def _get_font_with_patched_table(self, filepath, tag, offset, value):
+        # write an uint16 value in the table binary data (malformed font)
+        with open(self._get_font_path(filepath), "rb") as fileobject:
+            data = bytearray(fileobject.read())
+            table_offset = SFNTReader(fileobject).tables[tag].offset
+        struct.pack_into(">H", data, table_offset + offset, value)
+        return Font.from_bytes(bytes(data))
+
     def test_is_monospace(self):
         with self._get_font("/Inter/static/Inter-Regular.ttf") as font:
             self.assertFalse(font.is_monospace())
@@ -15,3 +28,74 @@ class MonospaceTestCase(AbstractTestCase):
             self.assertFalse(font.is_monospace())
         with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
             self.assertTrue(font.is_monospace())
+
+    def test_get_monospace_info(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            self.assertEqual(
+                font.get_monospace_info(),
+                {
+                    "is_monospace": True,
+                    "advance_width": 1229,
+                    "advance_width_ratio": 1.0,
+                    "post_is_fixed_pitch": True,
+                    "panose_monospaced": True,
+                },
+            )
+            # tables are read without being decompiled
+            loaded_tables_tags = font.get_loaded_tables_tags()
+            for tag in ["GDEF", "hmtx", "post"]:
+                self.assertNotIn(tag, loaded_tables_tags)
+        with self._get_font("/Inter/static/Inter-Regular.ttf") as font:
+            info = font.get_monospace_info()
+            self.assertFalse(info["is_monospace"])
+            self.assertLess(info["advance_width_ratio"], 0.1)
+            self.assertFalse(info["post_is_fixed_pitch"])
+            self.assertFalse(info["panose_monospaced"])
+
+    def test_get_monospace_info_with_threshold(self):
+        with self._get_font("/Honk/static/Honk-Regular.ttf") as font:
+            info = font.get_monospace_info()
+            self.assertFalse(info["is_monospace"])
+            threshold = info["advance_width_ratio"]
+            self.assertTrue(font.is_monospace(threshold=threshold))
+            self.assertFalse(font.is_monospace(threshold=threshold + 0.01))
+
+    def test_get_monospace_info_with_modified_hmtx(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            hmtx = font.get_ttfont()["hmtx"]
+            glyphs_names = font.get_ttfont().getGlyphOrder()
+            for name in glyphs_names[: len(glyphs_names) // 2]:
+                hmtx[name] = (600, hmtx[name][1])
+            info = font.get_monospace_info()
+            self.assertFalse(info["is_monospace"])
+            self.assertEqual(info["advance_width"], 1229)
+            self.assertFalse(font.is_monospace())
+
+    def test_get_monospace_info_with_zero_hmtx_metrics(self):
+        # hhea.numberOfHMetrics
+        font = self._get_font_with_patched_table(
+            "/Roboto_Mono/static/RobotoMono-Regular.ttf", "hhea", 34, 0
+        )
+        with font:
+            info = font.get_monospace_info()
+            self.assertFalse(info["is_monospace"])
+            self.assertIsNone(info["advance_width"])
+            self.assertFalse(font.is_monospace())
+
+    def test_get_monospace_info_with_truncated_gdef(self):
+        filepath = "/Open_Sans/static/OpenSans-Regular.ttf"
+        with self._get_font(filepath) as font:
+            expected_info = font.get_monospace_info()
+        # GDEF glyphClassDefOffset out of table and huge classRangeCount
+        for offset, value in [(4, 0xFFF0), (116 + 2, 0xFFFF)]:
+            with self.subTest(offset=offset):
+                font = self._get_font_with_patched_table(
+                    filepath, "GDEF", offset, value
+                )
+                with font:
+                    info = font.get_monospace_info()
+                    self.assertFalse(info["is_monospace"])
+                    self.assertEqual(
+                        info["advance_width"], expected_info["advance_width"]
+                    )
+                    self.assertFalse(font.is_monospace())
@@ -3,6 +3,7 @@ import logging
 import fsutil
 
 from fontbro import Font
+from fontbro.sanitizer import get_sanitizer_error, get_sanitizer_warnings
 from tests import AbstractTestCase
 
 
@@ -78,17 +79,26 @@ class SanitizeTestCase(AbstractTestCase):
         )
 
     def test_sanitize_with_good_fonts(self):
-        # some fonts have version == "OTTO" but there is not "CFF " table
         self._test_sanitize(
             "fonts-ots/good",
             strict=False,
-            expected_errors_count=2,  # should reduce to 0
+            expected_errors_count=0,
         )
 
     def test_sanitize_strict_with_good_fonts(self):
-        # some fonts have version == "OTTO" but there is not "CFF " table
         self._test_sanitize(
             "fonts-ots/good",
             strict=True,
-            expected_errors_count=2,  # should reduce to 0
+            expected_errors_count=0,
         )
+
+    def test_get_sanitizer_warnings(self):
+        output = (0, "WARNING: table is dense\nFile sanitized successfully!\n", "")
+        self.assertEqual(get_sanitizer_warnings(output), "WARNING: table is dense")
+        self.assertEqual(
+            get_sanitizer_error(output, strict=True),
+            "OpenType Sanitizer warnings: \nWARNING: table is dense",
+        )
+        output = (0, "File sanitized successfully!\n", "")
+        self.assertIsNone(get_sanitizer_warnings(output))
+        self.assertIsNone(get_sanitizer_error(output, strict=True))
@@ -1,6 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from unittest import mock
 
 import fsutil
+from fontTools.ttLib import TTFont, woff2
 
 from fontbro import Font
 from tests import AbstractTestCase
@@ -72,6 +75,47 @@ class SaveTestCase(AbstractTestCase):
         # 00 01 00 00 00 is the file signature for TrueType fonts
         self.assertEqual(content[:5], b"\x00\x01\x00\x00\x00")
 
+    def test_save_as(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        font.rename(family_name="Roboto Mono Web")
+        output_filepath = self._get_font_temp_path("")
+        filepaths = font.save_as(output_filepath)
+        self.assertEqual(
+            list(filepaths.keys()),
+            [Font.FORMAT_TTF, Font.FORMAT_WOFF2, Font.FORMAT_WOFF],
+        )
+        for format_, filepath in filepaths.items():
+            self.assertTrue(filepath.endswith(f"RobotoMonoWeb-Regular.{format_}"))
+            with Font(filepath) as font_saved:
+                self.assertEqual(font_saved.get_format(), format_)
+                self.assertEqual(font_saved.get_family_name(), "Roboto Mono Web")
+                self.assertEqual(font_saved.get_characters_count(), 875)
+        # ensure that the original font format is not changed
+        self.assertEqual(font.get_format(), Font.FORMAT_TTF)
+
+    def test_save_as_with_formats(self):
+        font = self._get_font("/issues/issue-0050/LeagueGothic-Regular.otf")
+        output_filepath = self._get_font_temp_path("LeagueGothic.otf")
+        filepaths = font.save_as(
+            output_filepath,
+            formats=[Font.FORMAT_TTF, Font.FORMAT_WOFF2],
+        )
+        self.assertEqual(
+            filepaths,
+            {
+                Font.FORMAT_OTF: self._get_font_temp_path("LeagueGothic.otf"),
+                Font.FORMAT_WOFF2: self._get_font_temp_path("LeagueGothic.woff2"),
+            },
+        )
+        with Font(filepaths[Font.FORMAT_WOFF2]) as font_saved:
+            self.assertEqual(font_saved.get_format(), Font.FORMAT_WOFF2)
+
+    def test_save_as_with_invalid_format(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        output_filepath = self._get_font_temp_path("")
+        with self.assertRaises(ValueError):
+            font.save_as(output_filepath, formats=["eot"])
+
     def test_save_as_woff(self):
         # font = self._get_font('/Noto_Sans_TC/NotoSansTC-Regular.otf')
         font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
@@ -84,6 +128,93 @@ class SaveTestCase(AbstractTestCase):
         font_saved = Font(font_saved_filepath)
         self.assertEqual(font_saved.get_format(), Font.FORMAT_WOFF)
 
+    def test_save_as_woff_with_compression_level(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        filepath_fast = font.save_as_woff(
+            self._get_font_temp_path("fast/"), compression_level=1
+        )
+        filepath_default = font.save_as_woff(self._get_font_temp_path("default/"))
+        self.assertGreater(
+            fsutil.get_file_size(filepath_fast), fsutil.get_file_size(filepath_default)
+        )
+        with Font(filepath_fast) as font_saved:
+            self.assertEqual(font_saved.get_characters_count(), 875)
+
+    def test_save_as_woff2_with_compression_level_and_window_size(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        filepath_fast = font.save_as_woff2(
+            self._get_font_temp_path("fast/"), compression_level=1, window_size=16
+        )
+        filepath_default = font.save_as_woff2(self._get_font_temp_path("default/"))
+        self.assertGreater(
+            fsutil.get_file_size(filepath_fast), fsutil.get_file_size(filepath_default)
+        )
+        with Font(filepath_fast) as font_saved:
+            self.assertEqual(font_saved.get_format(), Font.FORMAT_WOFF2)
+            self.assertEqual(font_saved.get_characters_count(), 875)
+
+    def test_save_as_with_default_compression_options_as_fonttools(self):
+        for font_path in [
+            "/Roboto_Mono/static/RobotoMono-Regular.ttf",
+            "/issues/issue-0050/LeagueGothic-Regular.otf",
+        ]:
+            filepath = self._get_font_path(font_path)
+            for flavor in [Font.FORMAT_WOFF, Font.FORMAT_WOFF2]:
+                with self.subTest(font_path=font_path, flavor=flavor):
+                    ttfont = TTFont(filepath, recalcTimestamp=False)
+                    ttfont.flavor = flavor
+                    fileobject = BytesIO()
+                    ttfont.save(fileobject)
+                    with Font(filepath, recalcTimestamp=False) as font:
+                        saved_filepath = font.save_as(
+                            self._get_font_temp_path(""), formats=[flavor]
+                        )[flavor]
+                    with open(saved_filepath, "rb") as saved_fileobject:
+                        self.assertEqual(saved_fileobject.read(), fileobject.getvalue())
+
+    def test_save_as_woff2_with_compression_options_in_threads(self):
+        font_path = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        options_list = [
+            {"compression_level": 1, "window_size": 16},
+            {},
+            {"compression_level": 5},
+        ]
+
+        def save_as_woff2(index):
+            with Font(font_path, recalcTimestamp=False) as font:
+                filepath = self._get_font_temp_path(f"threads-{index}/")
+                filepath = font.save_as_woff2(filepath, **options_list[index % 3])
+                return fsutil.get_file_size(filepath)
+
+        sizes = [save_as_woff2(index) for index in range(3)]
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            sizes_in_threads = list(executor.map(save_as_woff2, range(3, 9)))
+        self.assertEqual(sizes_in_threads, sizes * 2)
+        self.assertEqual(len(set(sizes)), 3)
+
+    def test_save_as_woff2_with_compression_options_restores_brotli(self):
+        brotli = woff2.brotli
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        font.save_as_woff2(self._get_font_temp_path(""), compression_level=1)
+        self.assertIs(woff2.brotli, brotli)
+        with mock.patch.object(
+            woff2.WOFF2Writer, "close", side_effect=RuntimeError("close failed")
+        ):
+            with self.assertRaises(RuntimeError):
+                font.save_as_woff2(self._get_font_temp_path(""), compression_level=1)
+        self.assertIs(woff2.brotli, brotli)
+
+    def test_save_as_with_invalid_compression_options(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        output_filepath = self._get_font_temp_path("")
+        with self.assertRaises(ValueError):
+            font.save_as_woff(output_filepath, compression_level=10)
+        with self.assertRaises(ValueError):
+            font.save_as_woff2(output_filepath, compression_level=-1)
+        with self.assertRaises(ValueError):
+            font.save_as_woff2(output_filepath, window_size=25)
+        self.assertFalse(fsutil.exists(output_filepath))
+
     def test_save_as_woff2(self):
         # font = self._get_font('/Noto_Sans_TC/NotoSansTC-Regular.otf')
         font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
@@ -186,6 +317,93 @@ class SaveTestCase(AbstractTestCase):
             ],
         )
 
+    def test_save_variable_instances_with_workers(self):
+        font = self._get_font("/Roboto_Mono/RobotoMono-VariableFont_wght.ttf")
+        font.rename(family_name="Roboto Mono Workers")
+        output_dirpath = self._get_font_temp_path("test_save_variable_instances")
+        saved_fonts = font.save_variable_instances(
+            output_dirpath,
+            woff2=False,
+            woff=True,
+            overwrite=True,
+            workers=2,
+        )
+        saved_instances = [saved_font["instance"] for saved_font in saved_fonts]
+        self.assertEqual(saved_instances, font.get_variable_instances())
+        saved_files_ttf = [
+            fsutil.get_filename(saved_font["files"]["ttf"])
+            for saved_font in saved_fonts
+        ]
+        self.assertEqual(
+            saved_files_ttf,
+            [
+                "RobotoMonoWorkers-Thin.ttf",
+                "RobotoMonoWorkers-Light.ttf",
+                "RobotoMonoWorkers-Regular.ttf",
+                "RobotoMonoWorkers-Medium.ttf",
+                "RobotoMonoWorkers-Bold.ttf",
+            ],
+        )
+        saved_files_woff = [
+            fsutil.get_filename(saved_font["files"]["woff"])
+            for saved_font in saved_fonts
+        ]
+        self.assertEqual(
+            saved_files_woff,
+            [
+                "RobotoMonoWorkers-Thin.woff",
+                "RobotoMonoWorkers-Light.woff",
+                "RobotoMonoWorkers-Regular.woff",
+                "RobotoMonoWorkers-Medium.woff",
+                "RobotoMonoWorkers-Bold.woff",
+            ],
+        )
+        with Font(saved_fonts[-1]["files"]["ttf"]) as saved_font:
+            self.assertTrue(saved_font.is_static())
+            self.assertEqual(saved_font.get_family_name(), "Roboto Mono Workers")
+            self.assertEqual(saved_font.get_weight()["value"], 700)
+
+    def test_save_variable_instances_with_executor(self):
+        font = self._get_font("/Roboto_Mono/RobotoMono-VariableFont_wght.ttf")
+        output_dirpath = self._get_font_temp_path("test_save_variable_instances")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            saved_fonts = font.save_variable_instances(
+                output_dirpath,
+                woff2=False,
+                woff=False,
+                overwrite=True,
+                executor=executor,
+            )
+        saved_files_ttf = [
+            fsutil.get_filename(saved_font["files"]["ttf"])
+            for saved_font in saved_fonts
+        ]
+        self.assertEqual(
+            saved_files_ttf,
+            [
+                "RobotoMono-Thin.ttf",
+                "RobotoMono-Light.ttf",
+                "RobotoMono-Regular.ttf",
+                "RobotoMono-Medium.ttf",
+                "RobotoMono-Bold.ttf",
+            ],
+        )
+
+    def test_save_variable_instances_with_invalid_workers(self):
+        font = self._get_font("/Roboto_Mono/RobotoMono-VariableFont_wght.ttf")
+        output_dirpath = self._get_font_temp_path("test_save_variable_instances")
+        with self.assertRaises(ValueError):
+            font.save_variable_instances(output_dirpath, workers=0)
+        with (
+            ThreadPoolExecutor(max_workers=2) as executor,
+            self.assertRaises(ValueError),
+        ):
+            font.save_variable_instances(
+                output_dirpath,
+                workers=2,
+                executor=executor,
+            )
+
     def test_save_variable_instances_with_static_font(self):
         font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
         output_dirpath = self._get_font_temp_path("")
@@ -221,3 +439,54 @@ class SaveTestCase(AbstractTestCase):
         self.assertEqual(font_woff2.get_format(), Font.FORMAT_WOFF2)
         font_saved = Font(font_saved_filepath)
         self.assertEqual(font_saved.get_format(), Font.FORMAT_TTF)
+
+    def test_save_to_fileobject_with_unmodified_font(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        font = Font(filepath, recalcTimestamp=False)
+        font.get_family_name()
+        font.get_weight()
+        with open(filepath, "rb") as fileobject:
+            self.assertEqual(font.save_to_fileobject().read(), fileobject.read())
+
+    def test_save_reuses_unmodified_tables_data(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        glyf_data = font.get_ttfont().getTableData("glyf")
+        font.get_glyphs()
+        font.rename(family_name="Roboto Mono Renamed")
+        filepath = font.save(self._get_font_temp_path("RobotoMonoRenamed.ttf"))
+        with Font(filepath, checkChecksums=2) as font_saved:
+            font_saved.get_ttfont().ensureDecompiled()
+            self.assertEqual(font_saved.get_family_name(), "Roboto Mono Renamed")
+            self.assertEqual(font_saved.get_ttfont().getTableData("glyf"), glyf_data)
+
+    def test_save_with_modified_glyphs(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        glyph_name = font.get_ttfont().getBestCmap()[ord("A")]
+        font.get_ttfont()["glyf"][glyph_name].numberOfContours = 0
+        font.set_modified(["glyf"])
+        with Font(font.save_to_fileobject()) as font_saved:
+            self.assertEqual(font_saved.get_characters_count(ignore_blank=True), 860)
+
+    def test_save_updates_modified_timestamp(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        modified_timestamp = font.get_ttfont()["head"].modified
+        with Font(font.save_to_fileobject()) as font_saved:
+            self.assertGreater(
+                font_saved.get_ttfont()["head"].modified, modified_timestamp
+            )
+
+    def test_save_and_clone_with_tables_modified_on_ttfont(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        # changes made directly on the TTFont instance, without set_modified
+        font.get_ttfont()["OS/2"].usWeightClass = 123
+        font.get_ttfont()["name"].setName("Direct Edit", 1, 3, 1, 0x409)
+        with Font(font.save_to_fileobject()) as font_saved:
+            self.assertEqual(font_saved.get_ttfont()["OS/2"].usWeightClass, 123)
+            self.assertEqual(font_saved.get_family_name(), "Direct Edit")
+        filepath = font.save(self._get_font_temp_path("RobotoMonoDirectEdit.ttf"))
+        with Font(filepath) as font_saved:
+            self.assertEqual(font_saved.get_ttfont()["OS/2"].usWeightClass, 123)
+            self.assertEqual(font_saved.get_family_name(), "Direct Edit")
+        with font.clone() as font_clone:
+            self.assertEqual(font_clone.get_ttfont()["OS/2"].usWeightClass, 123)
+            self.assertEqual(font_clone.get_family_name(), "Direct Edit")
@@ -0,0 +1,184 @@
+import fsutil
+
+from fontbro import Font
+from tests import AbstractTestCase
+
+
+class SplitTestCase(AbstractTestCase):
+    """
+    Test case for the font splitting by unicode ranges.
+    """
+
+    def test_split_by_unicode_ranges(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        dirpath = self._get_font_temp_path("slices")
+        result = font.split_by_unicode_ranges(dirpath)
+        slices = result["slices"]
+        self.assertEqual(
+            [slice_["name"] for slice_ in slices],
+            [
+                "cyrillic-ext",
+                "cyrillic",
+                "greek-ext",
+                "greek",
+                "vietnamese",
+                "latin-ext",
+                "latin",
+                "0",
+            ],
+        )
+        self.assertEqual(
+            slices[1]["unicode_range"],
+            "U+0301, U+0400-045F, U+0490-0491, U+04B0-04B1, U+2116",
+        )
+        self.assertEqual(
+            slices[1]["files"],
+            {Font.FORMAT_WOFF2: f"{dirpath}/RobotoMono-Regular-cyrillic.woff2"},
+        )
+        # all the font characters are included in the slices
+        characters_codes = set()
+        for slice_ in slices:
+            with Font(slice_["files"][Font.FORMAT_WOFF2]) as slice_font:
+                self.assertEqual(slice_font.get_format(), Font.FORMAT_WOFF2)
+                characters_codes.update(
+                    character["code"] for character in slice_font.get_characters()
+                )
+        self.assertEqual(
+            characters_codes,
+            {character["code"] for character in font.get_characters()},
+        )
+        # the source font is not modified
+        self.assertEqual(font.get_characters_count(), 875)
+        self.assertFalse(font.is_modified())
+
+    def test_split_by_unicode_ranges_with_ranges(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        dirpath = self._get_font_temp_path("slices")
+        result = font.split_by_unicode_ranges(
+            dirpath,
+            {
+                "basic-latin": "U+0000-007F",
+                "letters": [0x41, 0x42, "0061-0062"],
+                "cjk": "U+4E00-9FFF",
+            },
+            formats=["woff", "woff2"],
+        )
+        slices = result["slices"]
+        self.assertEqual(
+            [(slice_["name"], slice_["unicode_range"]) for slice_ in slices],
+            [
+                ("basic-latin", "U+000D, U+0020-007E"),
+                ("letters", "U+0041-0042, U+0061-0062"),
+            ],
+        )
+        self.assertEqual(
+            sorted(fsutil.list_files(dirpath)),
+            [
+                f"{dirpath}/RobotoMono-Regular-basic-latin.woff",
+                f"{dirpath}/RobotoMono-Regular-basic-latin.woff2",
+                f"{dirpath}/RobotoMono-Regular-letters.woff",
+                f"{dirpath}/RobotoMono-Regular-letters.woff2",
+            ],
+        )
+        with Font(slices[1]["files"][Font.FORMAT_WOFF]) as slice_font:
+            self.assertEqual(slice_font.get_characters_count(), 4)
+
+    def test_split_by_unicode_ranges_slices_are_independent(self):
+        font = self._get_font("/Inter/static/Inter-Black.ttf")
+        ranges = {"a": "U+0020", "b": "U+0041-005A"}
+        result = font.split_by_unicode_ranges(
+            self._get_font_temp_path("slices"), ranges, formats=["ttf"]
+        )
+        for slice_ in result["slices"]:
+            name = slice_["name"]
+            with self.subTest(name=name):
+                result_single = font.split_by_unicode_ranges(
+                    self._get_font_temp_path(f"slices-{name}"),
+                    {name: ranges[name]},
+                    formats=["ttf"],
+                )
+                slice_single = result_single["slices"][0]
+                with (
+                    Font(slice_["files"][Font.FORMAT_TTF]) as slice_font,
+                    Font(slice_single["files"][Font.FORMAT_TTF]) as slice_font_single,
+                ):
+                    ttfont = slice_font.get_ttfont()
+                    ttfont_single = slice_font_single.get_ttfont()
+                    self.assertEqual(
+                        sorted(ttfont.keys()), sorted(ttfont_single.keys())
+                    )
+                    for tag in ["GDEF", "GPOS", "GSUB"]:
+                        if tag in ttfont_single:
+                            self.assertEqual(
+                                ttfont.getTableData(tag),
+                                ttfont_single.getTableData(tag),
+                            )
+        with Font(result["slices"][1]["files"][Font.FORMAT_TTF]) as slice_font:
+            self.assertIn("GDEF", slice_font.get_ttfont())
+            self.assertIn("GPOS", slice_font.get_ttfont())
+
+    def test_split_by_unicode_ranges_css(self):
+        font = self._get_font("/Roboto_Mono/RobotoMono-VariableFont_wght.ttf")
+        dirpath = self._get_font_temp_path("slices")
+        result = font.split_by_unicode_ranges(
+            dirpath,
+            {"latin": "U+0000-00FF"},
+            formats=["ttf", "woff", "woff2"],
+        )
+        self.assertEqual(
+            result["css"],
+            "/* latin */\n"
+            "@font-face {\n"
+            "  font-family: 'Roboto Mono';\n"
+            "  font-style: normal;\n"
+            "  font-weight: 100 700;\n"
+            "  font-display: swap;\n"
+            "  src: url(\"RobotoMono[wght]-latin.woff2\") format('woff2'), "
+            "url(\"RobotoMono[wght]-latin.woff\") format('woff'), "
+            "url(\"RobotoMono[wght]-latin.ttf\") format('truetype');\n"
+            "  unicode-range: U+000D, U+0020-007E, U+00A0-00FF;\n"
+            "}\n",
+        )
+
+    def test_split_by_unicode_ranges_css_with_special_characters_in_filename(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        slices = [
+            {
+                "name": "latin",
+                "unicode_range": "U+0000-00FF",
+                "files": {Font.FORMAT_WOFF2: 'slices/Roboto Mono (1) "x\\y".woff2'},
+            }
+        ]
+        self.assertIn(
+            '  src: url("Roboto Mono (1) \\"x\\\\y\\".woff2") format(\'woff2\');\n',
+            font._get_unicode_ranges_css(slices),
+        )
+
+    def test_split_by_unicode_ranges_with_workers(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        font.rename(family_name="Roboto Mono Slices")
+        ranges = {"latin": "U+0000-00FF", "greek": "U+0370-03FF"}
+        result = font.split_by_unicode_ranges(
+            self._get_font_temp_path("slices"), ranges
+        )
+        result_with_workers = font.split_by_unicode_ranges(
+            self._get_font_temp_path("slices-workers"), ranges, workers=2
+        )
+        self.assertEqual(
+            result_with_workers["css"],
+            result["css"],
+        )
+        for slice_ in result_with_workers["slices"]:
+            with Font(slice_["files"][Font.FORMAT_WOFF2]) as slice_font:
+                self.assertEqual(slice_font.get_family_name(), "Roboto Mono Slices")
+
+    def test_split_by_unicode_ranges_with_invalid_args(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        dirpath = self._get_font_temp_path("slices")
+        with self.assertRaises(ValueError):
+            font.split_by_unicode_ranges(dirpath, formats=["eot"])
+        with self.assertRaises(ValueError):
+            font.split_by_unicode_ranges(dirpath, workers=0)
+        with self.assertRaises(ValueError):
+            font.split_by_unicode_ranges(dirpath, woff2_compression_level=12)
+        self.assertFalse(fsutil.exists(dirpath))
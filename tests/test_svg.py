@@ -1,9 +1,15 @@
+import re
+import unittest
+from io import StringIO
+from unittest import mock
+
+from fontbro.shaping import is_shaping_available
 from tests import AbstractTestCase
 
 
 class SVGTestCase(AbstractTestCase):
     """
-    This class describes an image test case.
+    This class describes an svg test case.
     """
 
     def test_generate_svg(self):
@@ -18,3 +24,145 @@ class SVGTestCase(AbstractTestCase):
         self.assertTrue(svg.endswith("</svg>"))
         self.assertFalse("{" in svg)
         self.assertFalse("}" in svg)
+
+    def test_generate_svg_with_repeated_glyphs(self):
+        font = self._get_font("/Inter/static/Inter-Black.ttf")
+        svg = font.get_svg(
+            text="Hello World!",
+            size=16,
+        )
+        # distinct non-blank glyphs are defined once and referenced for each char
+        self.assertEqual(svg.count("<path "), 8)
+        self.assertEqual(svg.count("<use "), 11)
+        glyph_id = re.search(r'<path id="(glyph-[0-9a-f]{8})-2"', svg).group(1)
+        self.assertEqual(svg.count(f'xlink:href="#{glyph_id}-2"'), 3)
+
+    def test_generate_svg_glyphs_ids_differ_between_fonts(self):
+        font = self._get_font("/Inter/static/Inter-Black.ttf")
+        other_font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        svgs = [
+            font.get_svg(text="Hello", size=16),
+            font.get_svg(text="World", size=16),
+            other_font.get_svg(text="Hello", size=16),
+        ]
+        glyphs_ids = [set(re.findall(r'<path id="([^"]+)"', svg)) for svg in svgs]
+        for index, ids in enumerate(glyphs_ids):
+            for other_ids in glyphs_ids[index + 1 :]:
+                self.assertFalse(ids & other_ids)
+
+    def test_generate_svg_with_cache(self):
+        font = self._get_font("/Inter/static/Inter-Black.ttf")
+        svg = font.get_svg(text="Hello", size=16)
+        self.assertEqual(len(font._svg_glyphs_paths), 4)
+        self.assertEqual(font.get_svg(text="Hello", size=16), svg)
+        font.set_name(font.NAME_FAMILY_NAME, "Inter Test")
+        self.assertEqual(len(font._svg_glyphs_paths), 0)
+        self.assertEqual(font.get_svg(text="Hello", size=16), svg)
+
+    def test_generate_svg_with_cache_size(self):
+        font = self._get_font("/Inter/static/Inter-Black.ttf")
+        with mock.patch.object(font, "_SVG_GLYPHS_PATHS_CACHE_SIZE", 3):
+            svg = font.get_svg(text="Hello", size=16)
+            self.assertEqual(len(font._svg_glyphs_paths), 3)
+            self.assertEqual(font.get_svg(text="Hello", size=16), svg)
+            self.assertEqual(len(font._svg_glyphs_paths), 3)
+
+    def test_save_svg_to_fileobject(self):
+        font = self._get_font("/Inter/static/Inter-Black.ttf")
+        text = "Hello World! " * 100
+        svg = font.get_svg(text=text, size=16)
+        fileobject = font.save_svg_to_fileobject(text=text, size=16)
+        self.assertEqual(fileobject.read(), svg)
+        fileobject = StringIO()
+        font.save_svg_to_fileobject(fileobject, text=text, size=16)
+        self.assertEqual(fileobject.getvalue(), svg)
+
+    def test_save_svg_to_non_seekable_fileobject(self):
+        font = self._get_font("/Inter/static/Inter-Black.ttf")
+        svg = font.get_svg(text="Hello", size=16)
+        fileobject = mock.Mock(spec=StringIO)
+        fileobject.seekable.return_value = False
+        font.save_svg_to_fileobject(fileobject, text="Hello", size=16)
+        self.assertEqual(
+            "".join(call.args[0] for call in fileobject.write.call_args_list), svg
+        )
+        fileobject.seek.assert_not_called()
+
+    @unittest.skipUnless(is_shaping_available(), "uharfbuzz not installed")
+    def test_generate_svg_with_shaping_ligatures(self):
+        font = self._get_font("/Open_Sans/static/OpenSans-Bold.ttf")
+        svg = font.get_svg(text="fi ffi", size=16)
+        self.assertEqual(svg.count("<use "), 5)
+        svg = font.get_svg(text="fi ffi", size=16, shaping=True)
+        self.assertEqual(svg.count("<use "), 2)
+        svg = font.get_svg(
+            text="fi ffi", size=16, shaping=True, features={"liga": False}
+        )
+        self.assertEqual(svg.count("<use "), 5)
+
+    @unittest.skipUnless(is_shaping_available(), "uharfbuzz not installed")
+    def test_generate_svg_with_shaping_kerning(self):
+        font = self._get_font("/Inter/static/Inter-Black.ttf")
+        svg = font.get_svg(text="AV", size=16)
+        svg_shaped = font.get_svg(text="AV", size=16, shaping=True)
+        svg_shaped_no_kern = font.get_svg(
+            text="AV", size=16, shaping=True, features={"kern": False}
+        )
+        self.assertEqual(svg, svg_shaped_no_kern)
+        self.assertNotEqual(svg, svg_shaped)
+        self.assertIn('x="1944"', svg_shaped)
+
+    @unittest.skipUnless(is_shaping_available(), "uharfbuzz not installed")
+    def test_generate_svg_with_shaping_cache(self):
+        font = self._get_font("/Inter/static/Inter-Black.ttf")
+        svg = font.get_svg(text="AV", size=16, shaping=True)
+        font.get_svg(text="AV", size=32, shaping=True)
+        self.assertEqual(len(font._shaping_cache), 1)
+        font.get_svg(text="AV", size=16, shaping=True, features={"kern": False})
+        self.assertEqual(len(font._shaping_cache), 2)
+        font.set_name(font.NAME_FAMILY_NAME, "Inter Test")
+        self.assertEqual(len(font._shaping_cache), 0)
+        self.assertEqual(font.get_svg(text="AV", size=16, shaping=True), svg)
+
+    def test_generate_svg_with_features_without_shaping(self):
+        font = self._get_font("/Inter/static/Inter-Black.ttf")
+        with self.assertRaises(ValueError):
+            font.get_svg(text="AV", size=16, features={"kern": False})
+
+    def test_generate_svg_with_shaping_not_available(self):
+        font = self._get_font("/Inter/static/Inter-Black.ttf")
+        with mock.patch("fontbro.shaping.uharfbuzz", None):
+            with self.assertRaises(TypeError):
+                font.get_svg(text="AV", size=16, shaping=True)
+
+    def test_generate_svg_with_coordinates(self):
+        font = self._get_font("/Roboto_Mono/RobotoMono-VariableFont_wght.ttf")
+        svg_default = font.get_svg(text="Hello", size=16)
+        svg = font.get_svg(text="Hello", size=16, coordinates={"wght": 700})
+        self.assertNotEqual(svg, svg_default)
+        # same paths of the instanced font
+        static_font = font.clone()
+        static_font.to_static(coordinates={"wght": 700})
+        self.assertEqual(static_font.get_svg(text="Hello", size=16), svg)
+        # out of range values are clamped
+        svg_max = font.get_svg(text="Hello", size=16, coordinates={"wght": 2000})
+        svg_700 = font.get_svg(text="Hello", size=16, coordinates={"wght": 700})
+        self.assertEqual(svg_max, svg_700)
+        self.assertEqual(font.get_svg(text="Hello", size=16), svg_default)
+
+    def test_generate_svg_with_invalid_coordinates(self):
+        font = self._get_font("/Roboto_Mono/RobotoMono-VariableFont_wght.ttf")
+        with self.assertRaises(ValueError):
+            font.get_svg(text="Hello", size=16, coordinates={"wdth": 100})
+        font = self._get_font("/Inter/static/Inter-Black.ttf")
+        with self.assertRaises(TypeError):
+            font.get_svg(text="Hello", size=16, coordinates={"wght": 700})
+
+    @unittest.skipUnless(is_shaping_available(), "uharfbuzz not installed")
+    def test_generate_svg_with_shaping_and_coordinates(self):
+        font = self._get_font("/Roboto_Mono/RobotoMono-VariableFont_wght.ttf")
+        svg = font.get_svg(text="Hello", size=16, coordinates={"wght": 700})
+        svg_shaped = font.get_svg(
+            text="Hello", size=16, shaping=True, coordinates={"wght": 700}
+        )
+        self.assertEqual(svg, svg_shaped)
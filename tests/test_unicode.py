@@ -0,0 +1,54 @@
+from fontTools import unicodedata
+
+from fontbro import Font
+from fontbro.unicode import get_unicode_block_and_script
+from tests import AbstractTestCase
+
+
+class UnicodeTestCase(AbstractTestCase):
+    """
+    Test case for the pre-computed unicode data lookup.
+    """
+
+    def test_get_unicode_block_and_script(self):
+        self.assertEqual(
+            get_unicode_block_and_script(0x41),
+            ("Basic Latin", "Latn", "Latin"),
+        )
+        self.assertEqual(
+            get_unicode_block_and_script(0x4E00),
+            ("CJK Unified Ideographs", "Hani", "Han"),
+        )
+
+    def test_get_unicode_block_and_script_without_block(self):
+        self.assertEqual(
+            get_unicode_block_and_script(0x2FE0),
+            ("No_Block", "Zzzz", "Unknown"),
+        )
+        self.assertEqual(
+            get_unicode_block_and_script(0x10FFFF + 1),
+            ("No_Block", "Zzzz", "Unknown"),
+        )
+
+    def test_get_unicode_block_and_script_matches_unicodedata(self):
+        for code in range(0, 0x110000, 7):
+            script_tag = unicodedata.script(code)
+            self.assertEqual(
+                get_unicode_block_and_script(code),
+                (
+                    unicodedata.block(code),
+                    script_tag,
+                    unicodedata.script_name(script_tag),
+                ),
+            )
+
+    def test_unicode_blocks_and_scripts_ranges(self):
+        for items in [Font._UNICODE_BLOCKS, Font._UNICODE_SCRIPTS]:
+            for item in items:
+                with self.subTest(name=item["name"]):
+                    ranges = item["ranges"]
+                    self.assertEqual(ranges, sorted(ranges))
+                    self.assertEqual(
+                        sum(last - first + 1 for first, last in ranges),
+                        item["characters_total"],
+                    )